@@ -15,7 +15,7 @@
 
 """RIDE -- Robot Framework test data editor
 
-Usage: ride.py [--noupdatecheck] [--debugconsole] [--version] [inpath]
+Usage: ride.py [--noupdatecheck] [--debugconsole] [--profile-startup[=file]] [--version] [inpath]
 
 RIDE can be started either without any arguments or by giving a path to a test
 data file or directory to be opened.
@@ -24,6 +24,10 @@ To disable update checker use --noupdatecheck.
 
 To start debug console for RIDE problem debugging use --debugconsole option.
 
+To see how long the phases of the startup take use --profile-startup. The
+breakdown is printed when the main window is shown. If a file is given, like
+--profile-startup=ride.prof, also cProfile statistics are written to it.
+
 To see RIDE's version use --version.
 
 RIDE's API is still evolving while the project is moving towards the 1.0
@@ -56,7 +60,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'lib'))
 def main(*args):
     _replace_std_for_win()
     noupdatecheck, debug_console, inpath = _parse_args(args)
-    if len(args) > 3 or '--help' in args:
+    profile_startup, profile_path = _parse_profile_args(args)
+    if len(args) > 4 or '--help' in args:
         print(__doc__)
         sys.exit()
     if '--version' in args:
@@ -68,7 +73,7 @@ def main(*args):
         print(version.VERSION)
         sys.exit(0)
     try:
-        _run(inpath, not noupdatecheck, debug_console)
+        _run(inpath, not noupdatecheck, debug_console, profile_startup, profile_path)
     except Exception:  # DEBUG
         import traceback
         traceback.print_exception(*sys.exc_info())
@@ -81,19 +86,30 @@ def _parse_args(args):
     noupdatecheck = '--noupdatecheck' in args
     debug_console = '--debugconsole' in args
     inpath = args[-1] if args[-1] not in ['--noupdatecheck',
-                                          '--debugconsole'] else None
+                                          '--debugconsole'] \
+        and not args[-1].startswith('--profile-startup') else None
     return noupdatecheck, debug_console, inpath
 
 
-def _run(inpath=None, updatecheck=True, debug_console=False):
+def _parse_profile_args(args):
+    for arg in args or ():
+        if arg == '--profile-startup':
+            return True, None
+        if arg.startswith('--profile-startup='):
+            return True, arg.split('=', 1)[1] or None
+    return False, None
+
+
+def _run(inpath=None, updatecheck=True, debug_console=False, profile_startup=False, profile_path=None):
     # print(f"DEBUG: ENTER _run {inpath=}, {updatecheck=}, {debug_console=}")
     try:
         from robotide.application import RIDE
         from robotide.application import debugconsole
+        from robotide.application.startupprofile import StartupProfile
     except ImportError:
         _show_old_wxpython_warning_if_needed()
         raise
-    ride = RIDE(inpath, updatecheck)
+    ride = RIDE(inpath, updatecheck, StartupProfile(profile_startup, profile_path))
     if wx.VERSION <= (4, 0, 4, '', ''):
         _show_old_wxpython_warning_if_needed(ride.frame)
     else:
@@ -29,6 +29,7 @@ from ..preferences import Preferences, RideSettings
 from ..application.pluginloader import PluginLoader
 from ..application.editorprovider import EditorProvider
 from ..application.releasenotes import ReleaseNotes
+from ..application.startupprofile import StartupProfile
 from ..application.updatenotifier import UpdateNotifierController, UpdateDialog
 from ..ui.mainframe import ToolBar
 from ..ui.treeplugin import TreePlugin
@@ -69,29 +70,79 @@ class RIDE(wx.App):
     settings = None
     treeplugin = None
 
-    def __init__(self, path=None, updatecheck=True):
+    def __init__(self, path=None, updatecheck=True, profile=None):
         self._updatecheck = updatecheck
+        self._profile = profile or StartupProfile()
         self.workspace_path = path
         context.APP = self
         wx.App.__init__(self, redirect=False)
 
     def OnInit(self):  # Overrides wx method
-        # DEBUG To test RTL
-        # self._initial_locale = wx.Locale(wx.LANGUAGE_ARABIC)
-        self._initial_locale = wx.Locale(wx.LANGUAGE_ENGLISH_US)
-        # Needed for SetToolTipString to work
-        wx.HelpProvider.Set(wx.SimpleHelpProvider())  # DEBUG: adjust to wx versions
-        self.settings = RideSettings()
-        librarydatabase.initialize_database()
-        self.preferences = Preferences(self.settings)
-        self.namespace = Namespace(self.settings)
-        self._controller = Project(self.namespace, self.settings)
-        self.frame = RideFrame(self, self._controller)
-        # DEBUG  self.frame.Show()
-        self._editor_provider = EditorProvider()
-        self._plugin_loader = PluginLoader(self, self._get_plugin_dirs(),
-                                           coreplugins.get_core_plugins())
-        self._plugin_loader.enable_plugins()
+        profile = self._profile
+        with profile.phase('Settings'):
+            # DEBUG To test RTL
+            # self._initial_locale = wx.Locale(wx.LANGUAGE_ARABIC)
+            self._initial_locale = wx.Locale(wx.LANGUAGE_ENGLISH_US)
+            # Needed for SetToolTipString to work
+            wx.HelpProvider.Set(wx.SimpleHelpProvider())  # DEBUG: adjust to wx versions
+            self.settings = RideSettings()
+        with profile.phase('Library database'):
+            librarydatabase.initialize_database()
+        with profile.phase('Namespace and project'):
+            self.preferences = Preferences(self.settings)
+            self.namespace = Namespace(self.settings)
+            self._controller = Project(self.namespace, self.settings)
+        with profile.phase('Main frame'):
+            self.frame = RideFrame(self, self._controller)
+            # DEBUG  self.frame.Show()
+            self._editor_provider = EditorProvider()
+        with profile.phase('Plugin loading'):
+            self._plugin_loader = PluginLoader(self, self._get_plugin_dirs(),
+                                               coreplugins.get_core_plugins(),
+                                               coreplugins.get_lazy_core_plugins())
+        with profile.phase('Plugin enabling'):
+            self._plugin_loader.enable_plugins(profile)
+        with profile.phase('Perspectives'):
+            self._load_perspectives()
+        with profile.phase('Tree and file explorer'):
+            self.treeplugin = TreePlugin(self)
+            if self.treeplugin.settings['_enabled']:
+                self.treeplugin.register_frame(self.frame)
+            self.fileexplorerplugin = FileExplorerPlugin(self, self._controller)
+            if self.fileexplorerplugin.settings['_enabled']:
+                self.fileexplorerplugin.register_frame(self.frame)
+            if not self.treeplugin.opened:
+                self.treeplugin.close_tree()
+            # else:
+            #     wx.CallLater(200, self.treeplugin.populate, self.model)
+            if not self.fileexplorerplugin.opened:
+                self.fileexplorerplugin.close_tree()
+            self.editor = self._get_editor()
+        with profile.phase('Robot Framework installation'):
+            self.robot_version = self._find_robot_installation()
+        with profile.phase('Data loading'):
+            self._load_data()
+        with profile.phase('Tree population'):
+            self.treeplugin.populate(self.model)
+            self.treeplugin.set_editor(self.editor)
+        with profile.phase('Frame showing'):
+            self._publish_system_info()
+            self.frame.Show()    # ###### DEBUG DANGER ZONE
+            self.SetTopWindow(self.frame)
+            self.frame.aui_mgr.Update()
+        wx.CallLater(200, ReleaseNotes(self).bring_to_front)
+        wx.CallLater(200, self.fileexplorerplugin.update_tree)
+        if self._updatecheck:
+            wx.CallAfter(UpdateNotifierController(self.settings).notify_update_if_needed, UpdateDialog)
+        self.Bind(wx.EVT_ACTIVATE_APP, self.on_app_activate)
+        PUBLISHER.subscribe(self.SetGlobalColour, RideSettingsChanged)
+        PUBLISHER.subscribe(self.update_excludes, RideSettingsChanged)
+        with profile.phase('Excludes'):
+            RideSettingsChanged(keys=('Excludes', 'init'), old=None, new=None).publish()
+        profile.finish()
+        return True
+
+    def _load_perspectives(self):
         perspective = self.settings.get('AUI Perspective', None)
         if perspective:
             self.frame.aui_mgr.LoadPerspective(perspective, True)
@@ -105,36 +156,6 @@ class RIDE(wx.App):
                   f"{os.path.join(context.SETTINGS_DIRECTORY, 'settings.cfg')}")
             if not isinstance(e, IndexError):  # If is with all notebooks disabled, continue
                 raise e
-        self.treeplugin = TreePlugin(self)
-        if self.treeplugin.settings['_enabled']:
-            self.treeplugin.register_frame(self.frame)
-        self.fileexplorerplugin = FileExplorerPlugin(self, self._controller)
-        if self.fileexplorerplugin.settings['_enabled']:
-            self.fileexplorerplugin.register_frame(self.frame)
-        if not self.treeplugin.opened:
-            self.treeplugin.close_tree()
-        # else:
-        #     wx.CallLater(200, self.treeplugin.populate, self.model)
-        if not self.fileexplorerplugin.opened:
-            self.fileexplorerplugin.close_tree()
-        self.editor = self._get_editor()
-        self.robot_version = self._find_robot_installation()
-        self._load_data()
-        self.treeplugin.populate(self.model)
-        self.treeplugin.set_editor(self.editor)
-        self._publish_system_info()
-        self.frame.Show()    # ###### DEBUG DANGER ZONE
-        self.SetTopWindow(self.frame)
-        self.frame.aui_mgr.Update()
-        wx.CallLater(200, ReleaseNotes(self).bring_to_front)
-        wx.CallLater(200, self.fileexplorerplugin.update_tree)
-        if self._updatecheck:
-            wx.CallAfter(UpdateNotifierController(self.settings).notify_update_if_needed, UpdateDialog)
-        self.Bind(wx.EVT_ACTIVATE_APP, self.on_app_activate)
-        PUBLISHER.subscribe(self.SetGlobalColour, RideSettingsChanged)
-        PUBLISHER.subscribe(self.update_excludes, RideSettingsChanged)
-        RideSettingsChanged(keys=('Excludes', 'init'), old=None, new=None).publish()
-        return True
 
     @staticmethod
     def _ApplyThemeToWidget(widget, fore_color=wx.BLUE, back_color=wx.LIGHT_GREY, theme: (None, dict) = None):
@@ -13,8 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import importlib
+
 from .. import utils
+from ..action import ActionInfo
 from ..context import LOG
+from ..publish import PUBLISHER
 
 
 def plugin_factory(application, plugin_class):
@@ -64,6 +68,114 @@ class PluginConnector(_PluginConnector):
             self.conn_plugin.disable()
 
 
+class LazyPlugin(object):
+    """Description of a plugin that is imported and enabled on first use.
+
+    `actions` are (menu, name, handler, position) tuples of the menu entries
+    of the plugin, and `topics` are (message, handler) tuples of the messages
+    it listens to. Using a menu entry or publishing one of the messages
+    activates the plugin, and the event or the message is passed to the
+    plugin method named by `handler`.
+    """
+
+    def __init__(self, module, class_name, actions=(), topics=(), doc=''):
+        self.module = module
+        self.class_name = class_name
+        self.name = utils.printable_name(class_name[:-len('Plugin')]
+                                         if class_name.endswith('Plugin')
+                                         else class_name, code_style=True)
+        self.actions = list(actions)
+        self.topics = list(topics)
+        self.doc = doc
+
+
+class LazyPluginConnector(_PluginConnector):
+
+    def __init__(self, lazy_plugin, application):
+        _PluginConnector.__init__(self, lazy_plugin.name, lazy_plugin.doc)
+        self._lazy_plugin = lazy_plugin
+        self._application = application
+        self._settings = application.settings['Plugins'].add_section(lazy_plugin.name)
+        self._actions = []
+        self._listeners = []
+        self._connector = None
+
+    @property
+    def activated(self):
+        return self._connector is not None
+
+    @property
+    def conn_plugin(self):
+        return getattr(self._connector, 'conn_plugin', None)
+
+    def enable_on_startup(self):
+        if self._settings.get('_enabled', True):
+            self.enable()
+
+    def enable(self):
+        self._settings.set('_enabled', True)
+        self.enabled = True
+        if self._connector:
+            self._connector.enable()
+        elif not self._actions and not self._listeners:
+            self._register_triggers()
+
+    def disable(self):
+        if self.enabled:
+            self._settings.set('_enabled', False)
+            self.enabled = False
+            self._unregister_triggers()
+            if self._connector:
+                self._connector.disable()
+
+    def activate(self):
+        """Imports and enables the plugin, unless already done, and returns it.
+
+        Returns None if the plugin could not be taken into use.
+        """
+        if self._connector is None:
+            # The plugin registers its own menu entries and listeners when
+            # enabled, and the lazy ones would also trigger it.
+            self._unregister_triggers()
+            module = importlib.import_module(self._lazy_plugin.module)
+            self._connector = plugin_factory(self._application,
+                                             getattr(module, self._lazy_plugin.class_name))
+            self.doc = self._connector.doc
+            self.error = self._connector.error
+            self.metadata = self._connector.metadata
+            self.config_panel = self._connector.config_panel
+            if self.error:
+                self.enabled = False
+            else:
+                self._connector.enable()
+        return self.conn_plugin
+
+    def _register_triggers(self):
+        for menu, name, handler, position in self._lazy_plugin.actions:
+            info = ActionInfo(menu, name, self._get_trigger(handler),
+                              position=position)
+            self._actions.append(self._application.frame.actions.register_action(info))
+        for topic, handler in self._lazy_plugin.topics:
+            listener = self._get_trigger(handler)
+            PUBLISHER.subscribe(listener, topic)
+            self._listeners.append((listener, topic))
+
+    def _unregister_triggers(self):
+        for action in self._actions:
+            action.unregister()
+        self._actions = []
+        for listener, topic in self._listeners:
+            PUBLISHER.unsubscribe(listener, topic)
+        self._listeners = []
+
+    def _get_trigger(self, handler):
+        def trigger(message):
+            plugin = self.activate()
+            if plugin:
+                getattr(plugin, handler)(message)
+        return trigger
+
+
 class BrokenPlugin(_PluginConnector):
 
     def __init__(self, error_msg, traceback, plugin_class):
@@ -20,20 +20,24 @@ import os
 
 from ..context import LOG
 from ..pluginapi import Plugin
-from .pluginconnector import plugin_factory
+from .pluginconnector import plugin_factory, LazyPluginConnector
+from .startupprofile import StartupProfile
 
 
 class PluginLoader(object):
 
-    def __init__(self, application, load_dirs, standard_classes):
+    def __init__(self, application, load_dirs, standard_classes, lazy_plugins=()):
         self._load_errors = []
         self.plugins = [plugin_factory(application, cls) for cls in standard_classes + self._find_classes(load_dirs)]
+        self.plugins.extend(LazyPluginConnector(lazy, application) for lazy in lazy_plugins)
         if self._load_errors:
             LOG.error('\n\n'.join(self._load_errors))
 
-    def enable_plugins(self):
+    def enable_plugins(self, profile=None):
+        profile = profile or StartupProfile()
         for p in self.plugins:
-            p.enable_on_startup()
+            with profile.phase(p.name):
+                p.enable_on_startup()
 
     def _find_classes(self, load_dirs):
         classes = []
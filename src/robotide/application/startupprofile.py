@@ -0,0 +1,78 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile(object):
+    """Records how long the phases of RIDE startup take.
+
+    Phases can be nested, and the breakdown written by `finish` is indented
+    accordingly. When `profile_path` is given, the whole startup is also run
+    under cProfile and the statistics are dumped to that file.
+
+    A profile that is not `enabled` records nothing, so the phases can
+    always be marked.
+    """
+
+    def __init__(self, enabled=False, profile_path=None):
+        self.enabled = enabled or bool(profile_path)
+        self.phases = []
+        self._profile_path = profile_path
+        self._profiler = None
+        self._depth = 0
+        self._start = time.perf_counter()
+        if profile_path:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        index = len(self.phases)
+        self.phases.append((self._depth, name, None))
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (self._depth, name, time.perf_counter() - start)
+
+    def finish(self, output=None):
+        """Stops profiling and writes the phase breakdown to `output`,
+        which is `sys.stdout` by default."""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._start
+        if self._profiler:
+            self._profiler.disable()
+            self._profiler.dump_stats(self._profile_path)
+            self._profiler = None
+        (output or sys.stdout).write(self.report(total))
+
+    def report(self, total):
+        lines = ['RIDE startup took %.1f ms' % (total * 1000)]
+        for depth, name, elapsed in self.phases:
+            lines.append('%10.1f ms  %s%s' % ((elapsed or 0) * 1000,
+                                              '  ' * depth, name))
+        if self._profile_path:
+            lines.append('Profile written to %s' % self._profile_path)
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# encoding=utf-8
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+
+from robotide.batch import BatchError, BatchRunner, read_script
+
+__doc__ = """
+Usage: python -m robotide.batch [options] <path> <script>
+Runs refactorings on test data without starting the user interface.
+
+<path> is a test case file, a resource file or a directory, loaded like
+when opened in RIDE. <script> is a file with one command per line, the
+command name and its arguments separated with two or more spaces, or a
+JSON file (*.json) with a list of commands like
+  [{"command": "rename keyword", "args": ["Old Name", "New Name"]}]
+
+Commands:
+  rename keyword  <old name>  <new name>  [file]
+  rename test     <file::test>  <new name>
+  find usages     <keyword>
+  sort tests|keywords|variables  [file...]
+  move            <file::test or keyword>  <destination file>
+  extract keyword <file::test or keyword>  <first step>  <last step>  <new name>  [arguments]
+  change format   <robot|resource|txt|tsv|html>  [file...]
+  save
+Files are given relative to <path>, or to its directory if it is a file.
+Changed files are saved after all the commands are run, using the
+saving preferences of RIDE.
+
+Options:
+  --dry-run           Run the commands but do not write anything to disk.
+  --help              This help.
+""".strip()
+
+
+def main(args):
+    dry_run = '--dry-run' in args
+    args = [arg for arg in args if arg != '--dry-run']
+    if '--help' in args or len(args) != 2:
+        print(__doc__)
+        return 0 if '--help' in args else 251
+    path, script = args
+    from robotide.preferences import RideSettings
+    runner = BatchRunner(RideSettings(), dry_run=dry_run)
+    try:
+        commands = read_script(script)
+        runner.load(path)
+        runner.run(commands)
+        runner.save()
+    except (BatchError, OSError) as err:
+        sys.stderr.write('[ERROR] %s\n' % err)
+        return 1
+    finally:
+        runner.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,293 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import re
+import sys
+import time
+from inspect import signature
+
+from ..controller import Project
+from ..controller.ctrlcommands import (ExtractKeyword, FindOccurrences, MoveTo, NullObserver,
+                                       RenameKeywordOccurrences, RenameTest, SaveAll, SortKeywords,
+                                       SortTests, SortVariables)
+from ..namespace import Namespace
+from ..publish import PUBLISHER, RideParserLogMessage
+from ..spec.librarydatabase import initialize_database
+
+ITEM_SEPARATOR = '::'
+FORMATS = ('robot', 'resource', 'txt', 'tsv', 'html')
+
+
+class BatchError(Exception):
+    """Used when loading the data or executing a command fails."""
+
+
+def read_script(path):
+    """Reads batch commands from a JSON or a plain text file.
+
+    See `parse_script` for the supported formats.
+    """
+    with open(path, encoding='UTF-8') as script:
+        return parse_script(script.read(), json_format=path.lower().endswith('.json'))
+
+
+def parse_script(content, json_format=False):
+    """Returns commands as lists of a command name and its arguments.
+
+    A JSON script is a list of commands, each given either as a list
+    like ``["rename keyword", "Old Name", "New Name"]`` or as an object
+    like ``{"command": "rename keyword", "args": ["Old Name", "New Name"]}``.
+
+    A plain text script has one command per line and the command name and
+    the arguments are separated like in Robot Framework data, with two or
+    more spaces or with tabs. Empty lines and lines starting with ``#`` are
+    ignored.
+    """
+    if json_format:
+        try:
+            commands = json.loads(content)
+        except ValueError as err:
+            raise BatchError('Invalid JSON script: %s' % err)
+        if not isinstance(commands, list):
+            raise BatchError('JSON script must contain a list of commands.')
+        return [_json_command(command) for command in commands]
+    commands = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            commands.append(re.split(r' {2,}|\t+', line))
+    return commands
+
+
+def _json_command(command):
+    if isinstance(command, dict):
+        if 'command' not in command:
+            raise BatchError("JSON command %s has no 'command'." % json.dumps(command))
+        command = [command['command']] + list(command.get('args', []))
+    if not command or not all(isinstance(value, str) for value in command):
+        raise BatchError('Invalid JSON command %s.' % json.dumps(command))
+    return command
+
+
+class BatchRunner(object):
+    """Executes refactoring commands on test data without user interface.
+
+    The data is loaded into a `Project` like in RIDE, and commands are run
+    through the same controller commands as the editors and the tree use.
+    Files changed by the commands are saved with `save`.
+
+    Data files and the tests and keywords in them are referred to with
+    paths relative to the loaded path, or absolute paths, like
+    ``tests/login.robot::Valid Login``.
+
+    With `dry_run` the commands change only the loaded data, and nothing
+    is written to the disk.
+
+    The time taken by loading, every command and saving is written to
+    `output`, and parsing errors to `errors`.
+    """
+
+    def __init__(self, settings, output=None, errors=None, dry_run=False):
+        self._settings = settings
+        self._dry_run = dry_run
+        self._output = output or sys.stdout
+        self._errors = errors or sys.stderr
+        self._project = None
+        self._root = None
+        self._commands = {
+            'rename keyword': self.rename_keyword,
+            'rename test': self.rename_test,
+            'find usages': self.find_usages,
+            'sort tests': lambda *files: self.sort(SortTests, *files),
+            'sort keywords': lambda *files: self.sort(SortKeywords, *files),
+            'sort variables': lambda *files: self.sort(SortVariables, *files),
+            'move': self.move,
+            'extract keyword': self.extract_keyword,
+            'change format': self.change_format,
+            'save': self.save
+        }
+
+    @property
+    def project(self):
+        return self._project
+
+    def load(self, path, library_manager=None):
+        start = time.time()
+        path = os.path.abspath(path)
+        self._root = path if os.path.isdir(path) else os.path.dirname(path)
+        if not library_manager:
+            initialize_database()
+        self._project = Project(Namespace(self._settings), self._settings, library_manager)
+        observer = _LoadObserver()
+        PUBLISHER.subscribe(self._report_parser_message, RideParserLogMessage)
+        try:
+            self._project.load_data(path, observer)
+        finally:
+            PUBLISHER.unsubscribe(self._report_parser_message, RideParserLogMessage)
+        if observer.error_message or not self._project.controller and not self._project.resources:
+            raise BatchError(observer.error_message or "Loading '%s' failed." % path)
+        datafiles = self._project.datafiles
+        tests = sum(len(list(df.tests)) for df in datafiles)
+        keywords = sum(len(list(df.keywords)) for df in datafiles)
+        self._report('Loaded %d files with %d tests and %d keywords'
+                     % (len(datafiles), tests, keywords), start, len(datafiles))
+
+    def close(self):
+        if self._project:
+            self._project.close()
+            self._project = None
+
+    def run(self, commands):
+        for command in commands:
+            self.execute(*command)
+
+    def execute(self, name, *args):
+        handler = self._commands.get(' '.join(name.lower().split()))
+        if not handler:
+            raise BatchError("Unknown command '%s'. Available commands are: %s."
+                             % (name, ', '.join(sorted(self._commands))))
+        try:
+            signature(handler).bind(*args)
+        except TypeError:
+            raise BatchError("Invalid arguments for command '%s': %s." % (name, ', '.join(args)))
+        return handler(*args)
+
+    def rename_keyword(self, old_name, new_name, datafile=None):
+        start = time.time()
+        keyword_info = None
+        if datafile:
+            keyword_info = self._find_item(datafile + ITEM_SEPARATOR + old_name, 'keywords').info
+        command = RenameKeywordOccurrences(old_name, new_name, NullObserver(), keyword_info)
+        self._project.controller.execute(command)
+        self._report("Renamed keyword '%s' to '%s' in %d places"
+                     % (old_name, new_name, len(command._occurrences)), start)
+
+    def rename_test(self, test, new_name):
+        start = time.time()
+        self._find_item(test, 'tests').execute(RenameTest(new_name))
+        self._report("Renamed test '%s' to '%s'" % (test, new_name), start)
+
+    def find_usages(self, keyword):
+        start = time.time()
+        occurrences = list(self._project.controller.execute(FindOccurrences(keyword)))
+        for occurrence in occurrences:
+            self._output.write('%s: %s (%s)\n' % (self._relative(occurrence.source),
+                                                  occurrence.location, occurrence.usage))
+        self._report("Found %d usages of keyword '%s'" % (len(occurrences), keyword), start)
+        return occurrences
+
+    def sort(self, command_class, *datafiles):
+        start = time.time()
+        controllers = [self._find_datafile(df) for df in datafiles] or self._project.datafiles
+        for controller in controllers:
+            controller.execute(command_class())
+        self._report('Sorted %d files' % len(controllers), start, len(controllers))
+
+    def move(self, item, destination):
+        start = time.time()
+        controller = self._find_item(item)
+        target = self._find_datafile(destination)
+        if not (controller.datafile_controller.is_modifiable() and target.is_modifiable()):
+            raise BatchError("Can not move '%s' to read-only file." % item)
+        controller.execute(MoveTo(target))
+        self._report("Moved '%s' to '%s'" % (item, destination), start)
+
+    def extract_keyword(self, item, first_step, last_step, new_name, arguments=''):
+        start = time.time()
+        try:
+            steps = (int(first_step) - 1, int(last_step) - 1)
+        except ValueError:
+            raise BatchError("Step numbers must be integers, got '%s' and '%s'."
+                             % (first_step, last_step))
+        controller = self._find_item(item)
+        if not 0 <= steps[0] <= steps[1] < len(controller.steps):
+            raise BatchError("'%s' has no steps %s-%s." % (item, first_step, last_step))
+        controller.execute(ExtractKeyword(new_name, arguments, steps))
+        self._report("Extracted keyword '%s' from '%s'" % (new_name, item), start)
+
+    def change_format(self, new_format, *datafiles):
+        start = time.time()
+        if new_format.lower() not in FORMATS:
+            raise BatchError("Invalid format '%s'. Valid formats are: %s."
+                             % (new_format, ', '.join(FORMATS)))
+        controllers = [self._find_datafile(df) for df in datafiles] or \
+            [df for df in self._project.datafiles if df.has_format()]
+        changed = [c for c in controllers if not c.is_same_format(new_format)]
+        if not self._dry_run:
+            for controller in changed:
+                self._project.change_format(controller, new_format)
+        self._report('Changed format of %d files to %s' % (len(changed), new_format),
+                     start, len(changed))
+
+    def save(self):
+        start = time.time()
+        reformat = self._settings.get('reformat', False)
+        dirty = [df for df in self._project.datafiles if df.dirty and df.has_format()]
+        if self._dry_run:
+            self._output.write('Not saving %d changed files in dry run.\n' % len(dirty))
+            return len(dirty)
+        saved = self._project.execute(SaveAll(reformat))
+        self._report('Saved %d files' % len(saved), start, len(saved))
+        if len(saved) < len(dirty):
+            raise BatchError('Saving %d files failed.' % (len(dirty) - len(saved)))
+        return len(saved)
+
+    def _find_datafile(self, path):
+        path = os.path.normcase(os.path.abspath(os.path.join(self._root, path)))
+        for controller in self._project.datafiles:
+            if controller.filename and os.path.normcase(os.path.abspath(controller.filename)) == path:
+                return controller
+        raise BatchError("Data file '%s' is not loaded." % self._relative(path))
+
+    def _find_item(self, item, kinds=('tests', 'keywords')):
+        if ITEM_SEPARATOR not in item:
+            raise BatchError("Item must be given as 'path%sname', got '%s'." % (ITEM_SEPARATOR, item))
+        path, name = item.rsplit(ITEM_SEPARATOR, 1)
+        datafile = self._find_datafile(path)
+        for kind in [kinds] if isinstance(kinds, str) else kinds:
+            for controller in getattr(datafile, kind):
+                if controller.name == name:
+                    return controller
+        raise BatchError("'%s' not found." % item)
+
+    def _relative(self, path):
+        try:
+            return os.path.relpath(path, self._root)
+        except ValueError:  # Different drives on Windows
+            return path
+
+    def _report(self, message, start, count=None):
+        elapsed = time.time() - start
+        if count is not None and elapsed > 0:
+            message += ' in %.2f s (%.1f files/s)' % (elapsed, count / elapsed)
+        else:
+            message += ' in %.2f s' % elapsed
+        self._output.write(message + '.\n')
+
+    def _report_parser_message(self, message):
+        self._errors.write('%s\n' % message.message)
+
+
+class _LoadObserver(object):
+
+    def __init__(self):
+        self.error_message = None
+
+    notify = finish = lambda self: None
+
+    def error(self, message):
+        self.error_message = message
@@ -23,10 +23,26 @@ def get_core_plugins():
     from ..editor import EditorPlugin
     from ..editor.texteditor import TextEditorPlugin
     from ..log import LogPlugin
-    from ..parserlog import ParserLogPlugin
     from ..searchtests.searchtests import TestSearchPlugin
-    from ..spec.specimporter import SpecImporterPlugin
     from ..postinstall.desktopshortcut import ShortcutPlugin
 
-    return [LogPlugin, RunAnything, RecentFilesPlugin, PreviewPlugin, SpecImporterPlugin, EditorPlugin, TextEditorPlugin,
-            KeywordSearch, TestSearchPlugin, ShortcutPlugin, ParserLogPlugin, TreePlugin, FileExplorerPlugin]
+    return [LogPlugin, RunAnything, RecentFilesPlugin, PreviewPlugin, EditorPlugin, TextEditorPlugin,
+            KeywordSearch, TestSearchPlugin, ShortcutPlugin, TreePlugin, FileExplorerPlugin]
+
+
+def get_lazy_core_plugins():
+    """Core plugins without visible user interface at startup.
+
+    They are imported and enabled when their menu entry is first used or
+    when they get their first message.
+    """
+    from ..application.pluginconnector import LazyPlugin
+    from ..publish.messages import RideExecuteSpecXmlImport, RideParserLogMessage
+
+    return [LazyPlugin('robotide.spec.specimporter', 'SpecImporterPlugin',
+                       actions=[('Tools', 'Import Library Spec XML', '_ps_on_execute_spec_import', 83)],
+                       topics=[(RideExecuteSpecXmlImport, '_ps_on_execute_spec_import')]),
+            LazyPlugin('robotide.parserlog.parserlog', 'ParserLogPlugin',
+                       actions=[('Tools', 'View Parser Log', 'on_view_log', 83)],
+                       topics=[(RideParserLogMessage, '_log_message')],
+                       doc='Viewer for parser log messages.')]
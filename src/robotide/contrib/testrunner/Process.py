@@ -36,16 +36,18 @@ import subprocess
 import sys
 import threading
 
-from queue import Empty, Queue
 from robotide.context import IS_WINDOWS
+from robotide.contrib.testrunner.TestRunnerAgent import BinaryStreamHandler, LISTENER_PROTOCOL_ENV
 
 OUTPUT_ENCODING = sys.getfilesystemencoding()
 
 
 class Process(object):
 
-    def __init__(self, cwd):
+    def __init__(self, cwd, on_output=None, on_exit=None):
         self._process = None
+        self._on_output = on_output
+        self._on_exit = on_exit
         self._error_stream = None
         self._output_stream = None
         self._cwd = cwd
@@ -53,7 +55,7 @@ class Process(object):
         self._sock = None
         self._kill_called = False
 
-    def run_command(self, command):
+    def run_command(self, command, env=None):
         # We need to supply stdin for subprocess, because other ways in python
         # subprocess will try using sys.stdin which causes an error in windows
         # print("DEBUG: enter run_command %s dir %s" % (command, self._cwd))
@@ -74,17 +76,34 @@ class Process(object):
         else:
             subprocess_args['preexec_fn'] = os.setsid
             subprocess_args['shell'] = True
+            subprocess_args['env'] = dict(os.environ)
+        subprocess_args['env'][LISTENER_PROTOCOL_ENV] = BinaryStreamHandler.supported_protocols()
+        subprocess_args['env'].update(env or {})
         self._process = subprocess.Popen(command, **subprocess_args)
         self._process.stdin.close()
-        self._output_stream = StreamReaderThread(self._process.stdout)
-        self._error_stream = StreamReaderThread(self._process.stderr)
+        self._output_stream = StreamReaderThread(self._process.stdout, self._on_output)
+        self._error_stream = StreamReaderThread(self._process.stderr, self._on_output)
         self._output_stream.run()
         self._error_stream.run()
         self._kill_called = False
+        if self._on_exit:
+            waiter = threading.Thread(target=self._wait_for_exit)
+            waiter.daemon = True
+            waiter.start()
+
+    def _wait_for_exit(self):
+        self._process.wait()
+        self._output_stream.join()
+        self._error_stream.join()
+        self._on_exit()
 
     def set_port(self, port):
         self._port = port
 
+    @property
+    def port(self):
+        return self._port
+
     def get_output(self):
         return self._output_stream.pop()
 
@@ -159,29 +178,225 @@ class Process(object):
                 pass
 
 
+class ProcessGroup(object):
+    """Runs several commands in parallel and then an optional final command.
+
+    Has the same interface as `Process`. Output of all the processes is
+    returned together and control signals are sent to all of them.
+    `on_exit` is called when the final command, or the last of the parallel
+    commands if there is no final command, has ended.
+    """
+
+    def __init__(self, cwd, on_output=None, on_exit=None):
+        self._cwd = cwd
+        self._on_output = on_output
+        self._on_exit = on_exit
+        self._processes = []
+        self._final = None
+        self._final_command = None
+        self._env = None
+        self._running = 0
+        self._killed = False
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+
+    def run_commands(self, commands, final_command=None, env=None):
+        """Starts `commands` in parallel.
+
+        `final_command` is a callable returning the command to run after all
+        of them have ended, or None to not run anything.
+
+        If a command can not be started, the already started processes are
+        killed and the error is raised. `on_exit` is still called once they
+        have ended.
+        """
+        self._final_command = final_command
+        self._env = env
+        # Counts as one running process until all the commands are started,
+        # so that processes ending quickly do not end the group too early.
+        self._running = 1
+        try:
+            for command in commands:
+                self._start(command, env)
+        except Exception:
+            self.kill(force=True)
+            raise
+        finally:
+            self._process_ended()
+
+    def _start(self, command, env):
+        process = Process(self._cwd, self._on_output, self._process_ended)
+        with self._lock:
+            self._processes.append(process)
+            self._running += 1
+        try:
+            process.run_command(command, env)
+        except Exception:
+            with self._lock:
+                self._processes.remove(process)
+                self._running -= 1
+            raise
+
+    def _process_ended(self):
+        with self._lock:
+            self._running -= 1
+            if self._running:
+                return
+        command = self._final_command() \
+            if self._final_command and not self._killed else None
+        if not command:
+            self._finish()
+            return
+        self._final = Process(self._cwd, self._on_output, self._finish)
+        self._processes.append(self._final)
+        self._final.run_command(command, self._env)
+
+    def _finish(self):
+        self._finished.set()
+        if self._on_exit:
+            self._on_exit()
+
+    def set_port(self, port):
+        with self._lock:
+            for process in self._processes:
+                if process.port is None:
+                    process.set_port(port)
+                    return
+
+    def get_output(self):
+        return b''.join(process.get_output() for process in list(self._processes))
+
+    def get_errors(self):
+        return b''.join(process.get_errors() for process in list(self._processes))
+
+    def get_returncode(self):
+        if self._final:
+            return self._final.get_returncode()
+        codes = [process.get_returncode() for process in self._processes]
+        return None if None in codes else max(codes or [0])
+
+    def is_alive(self):
+        return not self._finished.is_set()
+
+    def wait(self):
+        self._finished.wait()
+
+    def kill(self, force=False, killer_pid=None):
+        _ = killer_pid
+        self._killed = True
+        for process in list(self._processes):
+            process.kill(force)
+
+    def pause(self):
+        self._for_all(Process.pause)
+
+    def pause_on_failure(self, pause):
+        self._for_all(lambda process: process.pause_on_failure(pause))
+
+    def resume(self):
+        self._for_all(Process.resume)
+
+    def step_next(self):
+        self._for_all(Process.step_next)
+
+    def step_over(self):
+        self._for_all(Process.step_over)
+
+    def _for_all(self, action):
+        for process in list(self._processes):
+            if process.is_alive():
+                action(process)
+
+
 class StreamReaderThread(object):
+    """Reads a stream in a background thread.
+
+    Data is read in chunks as soon as it is available and collected to a
+    buffer that `pop` empties. `on_data` is called, in the reader thread,
+    when data arrives after the previous `pop`, so that the receiver is
+    notified once per batch instead of polling.
 
-    def __init__(self, stream):
-        self._queue = Queue()
+    A chunk can end in the middle of a multibyte UTF-8 character or an ANSI
+    escape sequence. `pop` leaves such an incomplete end to the buffer until
+    the rest of it has been read, or the stream has ended.
+    """
+    CHUNK_SIZE = 65536
+
+    def __init__(self, stream, on_data=None):
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
         self._thread = None
         self._stream = stream
+        self._on_data = on_data
+        self._notified = False
+        self._ended = False
 
     def run(self):
-        self._thread = threading.Thread(target=self._enqueue_output,
+        self._thread = threading.Thread(target=self._read_output,
                                         args=(self._stream,))
         self._thread.daemon = True
         self._thread.start()
 
-    def _enqueue_output(self, out):
-        for line in iter(out.readline, b''):
-            self._queue.put(line)
+    def _read_output(self, out):
+        fileno = out.fileno()
+        while True:
+            try:
+                data = os.read(fileno, self.CHUNK_SIZE)
+            except OSError:
+                data = b''
+            with self._lock:
+                self._buffer += data
+                self._ended = not data
+                notify = bool(self._buffer) and not self._notified
+                self._notified = self._notified or notify
+            if notify and self._on_data:
+                self._on_data()
+            if not data:
+                break
+
+    def join(self, timeout=None):
+        if self._thread:
+            self._thread.join(timeout)
 
     def pop(self):
-        result = b''
-        my_queue_rng = range(self._queue.qsize())
-        for _ in my_queue_rng:
-            try:
-                result += self._queue.get_nowait()
-            except Empty:
-                pass
+        with self._lock:
+            end = len(self._buffer) if self._ended else _complete_length(self._buffer)
+            result = bytes(self._buffer[:end])
+            del self._buffer[:end]
+            self._notified = False
         return result
+
+
+_ESCAPE = 0x1b
+_MAX_ESCAPE_LENGTH = 32
+
+
+def _complete_length(data):
+    """Returns the length of `data` without an incomplete UTF-8 character
+    or ANSI escape sequence at its end."""
+    end = len(data)
+    escape = data.rfind(bytes([_ESCAPE]), max(0, end - _MAX_ESCAPE_LENGTH))
+    if escape != -1 and not _escape_is_complete(data[escape + 1:]):
+        end = escape
+    for index in range(end - 1, max(end - 4, -1), -1):
+        byte = data[index]
+        if byte & 0xC0 != 0x80:  # Not a continuation byte
+            if byte >= 0xF0:
+                length = 4
+            elif byte >= 0xE0:
+                length = 3
+            elif byte >= 0xC0:
+                length = 2
+            else:
+                length = 1
+            return index if index + length > end else end
+    return end
+
+
+def _escape_is_complete(sequence):
+    if not sequence:
+        return False
+    if sequence[0] != ord('['):
+        return True
+    # Control sequence ends with a byte in range @-~ after parameters.
+    return any(0x40 <= byte <= 0x7E for byte in sequence[1:])
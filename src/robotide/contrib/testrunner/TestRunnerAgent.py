@@ -71,7 +71,9 @@ import pickle
 import platform
 import sys
 import socket
+import struct
 import threading
+import time
 
 PLATFORM = platform.python_implementation()
 
@@ -85,6 +87,7 @@ try:
     # to find robot (we use provided lib)
     sys.path.append(os.path.join(os.path.dirname(__file__), '../../lib'))
     from robot.errors import ExecutionFailed
+    from robot.output.loggerhelper import LEVELS
     from robot.running import EXECUTION_CONTEXTS
     from robot.running.signalhandler import STOP_SIGNAL_MONITOR
     from robot.utils import encoding
@@ -100,6 +103,11 @@ except ImportError:
     json = None
     _JSONAVAIL = False
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 try:
     from StringIO import StringIO
 except ImportError:  # py3 <=3.6
@@ -107,6 +115,12 @@ except ImportError:  # py3 <=3.6
 
 HOST = "localhost"
 
+# RIDE tells in this environment variable which listener protocols it can
+# read, e.g. "binary,msgpack". Without it, the JSON protocol is used.
+LISTENER_PROTOCOL_ENV = "RIDE_LISTENER_PROTOCOL"
+# JSON object telling which events RIDE wants to receive, see EventFilter.
+LISTENER_FILTER_ENV = "RIDE_LISTENER_FILTER"
+
 # Setting Output encoding to UTF-8 and ignoring the platform specs
 # RIDE will expect UTF-8
 # Set output encoding to UTF-8 for piped output streams
@@ -140,6 +154,10 @@ class TestRunnerAgent:
         self.sock = None
         self.filehandler = None
         self.streamhandler = None
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        self._batch_timer = None
+        self._filter = EventFilter.from_environment()
         self._connect()
         self._send_pid()
         self._create_debugger((len(args) >= 2) and (args[1] == 'True'))
@@ -184,16 +202,8 @@ class TestRunnerAgent:
         self._send_socket("end_suite", name, attrs_copy)
 
     def start_keyword(self, name, attrs):
-        # pass empty args, see https://github.com/nokia/RED/issues/32
-
-        # we're cutting args from original attrs dict, because it may contain
-        # objects which are not json-serializable, and we don't need them anyway
-        attrs_copy = copy.copy(attrs)
-        del attrs_copy['args']
-        del attrs_copy['doc']
-        del attrs_copy['assign']
-
-        self._send_socket("start_keyword", name, attrs_copy)
+        if self._filter.start_keyword():
+            self._send_socket("start_keyword", name, self._keyword_attrs(attrs))
         if self._debugger.is_breakpoint(name, attrs):  # must check original
             self._debugger.pause()
         paused = self._debugger.is_paused()
@@ -204,21 +214,29 @@ class TestRunnerAgent:
             self._send_socket('continue')
 
     def end_keyword(self, name, attrs):
+        if self._filter.end_keyword():
+            self._send_socket("end_keyword", name, self._keyword_attrs(attrs))
+        self._debugger.end_keyword(attrs['status'] == 'PASS')
+
+    @staticmethod
+    def _keyword_attrs(attrs):
         # pass empty args, see https://github.com/nokia/RED/issues/32
+
+        # we're cutting args from original attrs dict, because it may contain
+        # objects which are not json-serializable, and we don't need them anyway
         attrs_copy = copy.copy(attrs)
         del attrs_copy['args']
         del attrs_copy['doc']
         del attrs_copy['assign']
-
-        self._send_socket("end_keyword", name, attrs_copy)
-        self._debugger.end_keyword(attrs['status'] == 'PASS')
+        return attrs_copy
 
     def message(self, message):
         """ Just ignore it """
         pass
 
     def log_message(self, message):
-        if _is_logged(message['level']):
+        if self._filter.log_message(message['level']) and \
+                _is_logged(message['level']):
             self._send_socket("log_message", message)
 
     def log_file(self, path):
@@ -241,6 +259,8 @@ class TestRunnerAgent:
 
     def close(self):
         self._send_socket("close")
+        if self._batch_timer:
+            self._batch_timer.cancel()
         if self.sock:
             self.filehandler.close()
             self.sock.close()
@@ -252,7 +272,13 @@ class TestRunnerAgent:
             self.sock.connect((self.host, self.port))
             # Iron python does not return right object type if not binary mode
             self.filehandler = self.sock.makefile('wb')
-            self.streamhandler = StreamHandler(self.filehandler)
+            protocols = os.environ.get(LISTENER_PROTOCOL_ENV, '').split(',')
+            if 'binary' in protocols:
+                self.streamhandler = BinaryStreamHandler(
+                    self.filehandler, use_msgpack='msgpack' in protocols)
+                self.streamhandler.start()
+            else:
+                self.streamhandler = StreamHandler(self.filehandler)
         except socket.error as ex:
             print('unable to open socket to "%s:%s" error: %s'
                   % (self.host, self.port, str(ex)))
@@ -263,14 +289,89 @@ class TestRunnerAgent:
         try:
             if self.filehandler:
                 packet = (name, args)
-                self.streamhandler.dump(packet)
-                self.filehandler.flush()
+                if isinstance(self.streamhandler, BinaryStreamHandler):
+                    self._send_batched(packet)
+                else:
+                    self.streamhandler.dump(packet)
+                    self.filehandler.flush()
         except Exception:
             import traceback
             traceback.print_exc(file=sys.stdout)
             sys.stdout.flush()
             raise
 
+    def _send_batched(self, packet):
+        # Keyword and log message events are collected to frames of several
+        # events. Events changing the test status are sent immediately, as are
+        # the buffered events after BATCH_DELAY seconds.
+        with self._batch_lock:
+            self._batch.append(packet)
+            if packet[0] in BinaryStreamHandler.IMMEDIATE_EVENTS or \
+                    len(self._batch) >= BinaryStreamHandler.BATCH_SIZE:
+                self._flush_batch()
+            elif not self._batch_timer:
+                self._batch_timer = threading.Timer(
+                    BinaryStreamHandler.BATCH_DELAY, self._flush_delayed)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+
+    def _flush_delayed(self):
+        with self._batch_lock:
+            self._batch_timer = None
+            if self.filehandler:
+                self._flush_batch()
+
+    def _flush_batch(self):
+        if self._batch:
+            self.streamhandler.dump_batch(self._batch)
+            self.filehandler.flush()
+            self._batch = []
+
+
+class EventFilter(object):
+    """Decides which events are sent to RIDE.
+
+    The configuration is read from LISTENER_FILTER_ENV and may contain:
+
+    - ``log_level``: minimum level number of sent log messages
+    - ``keywords``: whether keyword events are sent at all
+    - ``keyword_interval``: minimum seconds between sent keyword starts
+
+    Keyword ends are sent only for the keywords whose start was sent.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.log_level = config.get('log_level', 0)
+        self.keywords = config.get('keywords', True)
+        self.keyword_interval = config.get('keyword_interval', 0)
+        self._last_keyword_time = None
+        self._sent_keywords = []
+
+    @classmethod
+    def from_environment(cls):
+        try:
+            return cls(json.loads(os.environ.get(LISTENER_FILTER_ENV, '{}')))
+        except (ValueError, AttributeError):
+            return cls()
+
+    def log_message(self, level):
+        return LEVELS.get(level, self.log_level) >= self.log_level
+
+    def start_keyword(self):
+        send = self.keywords
+        if send and self.keyword_interval > 0:
+            now = time.monotonic()
+            send = self._last_keyword_time is None or \
+                now - self._last_keyword_time >= self.keyword_interval
+            if send:
+                self._last_keyword_time = now
+        self._sent_keywords.append(send)
+        return send
+
+    def end_keyword(self):
+        return self._sent_keywords.pop() if self._sent_keywords else self.keywords
+
 
 class RobotDebugger(object):
 
@@ -546,3 +647,71 @@ class StreamHandler(object):
                 raise EOFError('File/Socket closed while reading load header')
             buff.write(recv_char)
         return buff.getvalue()[:-1]
+
+
+class BinaryStreamHandler(object):
+    """
+    Faster alternative for StreamHandler, used when RIDE announces that it
+    supports it in LISTENER_PROTOCOL_ENV.
+
+    The stream starts with the MAGIC byte, which can never start a message of
+    StreamHandler, so the reading side can detect the protocol. After that the
+    stream consists of frames having a fixed size header (payload length as
+    a 32-bit unsigned integer and encoding as one byte) followed by the
+    payload. The payload is a list of (name, args) events encoded with
+    msgpack, if both sides have it, or as compact JSON otherwise.
+    """
+    MAGIC = b'B'
+    HEADER = struct.Struct('>IB')
+    JSON = ord('J')
+    MSGPACK = ord('M')
+    BATCH_SIZE = 64
+    BATCH_DELAY = 0.05
+    IMMEDIATE_EVENTS = ('pid', 'port', 'start_suite', 'end_suite', 'start_test',
+                        'end_test', 'paused', 'continue', 'log_file',
+                        'report_file', 'close')
+
+    def __init__(self, fp, use_msgpack=False):
+        self.fp = fp
+        self._use_msgpack = use_msgpack and msgpack is not None
+        self._json_encoder = json.JSONEncoder(separators=(',', ':'),
+                                              default=str).encode
+
+    @staticmethod
+    def supported_protocols():
+        return 'binary,msgpack' if msgpack is not None else 'binary'
+
+    def start(self):
+        self.fp.write(self.MAGIC)
+
+    def dump_batch(self, packets):
+        if self._use_msgpack:
+            payload = msgpack.packb(packets, use_bin_type=True, default=str)
+            encoding = self.MSGPACK
+        else:
+            payload = self._json_encoder(packets).encode('UTF-8')
+            encoding = self.JSON
+        self.fp.write(self.HEADER.pack(len(payload), encoding) + payload)
+
+    def load_batch(self):
+        """
+        Returns the list of (name, args) events of the next frame. The MAGIC
+        byte must have been consumed from the stream already.
+        """
+        header = self._read(self.HEADER.size)
+        length, encoding = self.HEADER.unpack(header)
+        payload = self._read(length)
+        try:
+            if encoding == self.MSGPACK and msgpack is not None:
+                return msgpack.unpackb(payload, raw=False)
+            if encoding == self.JSON:
+                return json.loads(payload.decode('UTF-8'))
+        except ValueError as ex:
+            raise DecodeError(str(ex))
+        raise DecodeError("Frame encoding %r not supported" % encoding)
+
+    def _read(self, size):
+        data = self.fp.read(size)
+        if len(data) < size:
+            raise EOFError('File/Socket closed while reading frame')
+        return data
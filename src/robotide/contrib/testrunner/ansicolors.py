@@ -0,0 +1,90 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import re
+
+_COLOR_CODE = re.compile(r'\x1b\[([0-9;]*)m')
+_COLOR_CODE_BYTES = re.compile(br'\x1b\[([0-9;]*)m')
+_STYLE_RUN = re.compile(br'(.)\1*', re.S)
+
+RESET = '0'
+RED = '31'
+GREEN = '32'
+YELLOW = '33'
+BLUE = '34'
+
+
+def split_colors(text, styles, default):
+    """Removes ANSI color codes from `text` and returns it with its styling.
+
+    `text` can be bytes or a string. `styles` maps color codes like `RED`
+    to style numbers; codes not in it, like `RESET`, use `default` style.
+
+    Returns the text without color codes and a styling buffer having the
+    style number of every byte of the text, encoded as UTF-8 in case of a
+    string, as expected by `StyledTextCtrl.SetStyleBytes`.
+    """
+    if isinstance(text, bytes):
+        pattern, empty, size, decode = _COLOR_CODE_BYTES, b'', len, bytes.decode
+    else:
+        pattern, empty, size, decode = _COLOR_CODE, '', _utf8_size, str
+    pieces = []
+    styling = []
+    style = default
+    position = 0
+    for match in pattern.finditer(text):
+        if match.start() > position:
+            piece = text[position:match.start()]
+            pieces.append(piece)
+            styling.append(bytes((style,)) * size(piece))
+        # Only the last parameter matters, e.g. 31 in bold red 1;31
+        code = decode(match.group(1)).split(';')[-1]
+        style = styles.get(code, default)
+        position = match.end()
+    if not pieces:
+        if position:
+            text = text[position:]
+        return text, bytes((style,)) * size(text)
+    pieces.append(text[position:])
+    styling.append(bytes((style,)) * size(pieces[-1]))
+    return empty.join(pieces), b''.join(styling)
+
+
+def join_colors(text, styling, codes, default):
+    """Adds ANSI color codes to `text` based on its styling.
+
+    Reverse of `split_colors`: `text` is bytes and `styling` has the style
+    number of its every byte. `codes` maps style numbers to color codes;
+    other styles, like `default`, are written as `RESET`.
+
+    The code of a colored part is repeated after every newline in it, so
+    that the text can be split at line boundaries without losing colors.
+    """
+    pieces = []
+    for match in _STYLE_RUN.finditer(styling):
+        style = match.group()[0]
+        piece = text[match.start():match.end()]
+        if style == default and not pieces:
+            pieces.append(piece)
+            continue
+        code = b'\x1b[%sm' % codes.get(style, RESET).encode('ASCII')
+        if style != default:
+            piece = piece.replace(b'\n', b'\n' + code)
+        pieces.append(code + piece)
+    return b''.join(pieces)
+
+
+def _utf8_size(text):
+    return len(text.encode('UTF-8'))
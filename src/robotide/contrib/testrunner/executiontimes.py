@@ -0,0 +1,140 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import OrderedDict
+
+from robotide.lib.robot.utils import ET, ETSource, get_elapsed_time, normalize
+
+# Keyword types of old outputs which are not real keyword calls
+_CONTROL_KEYWORD_TYPES = ('for', 'foritem')
+
+
+class KeywordTimes(object):
+    """Elapsed times of all the calls of one keyword, in milliseconds."""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0
+        self.slowest = 0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.slowest = max(self.slowest, elapsed)
+
+    @property
+    def average(self):
+        return self.total // self.count if self.count else 0
+
+
+class ExecutionTimes(object):
+    """Elapsed times of the tests and keywords of one test run.
+
+    Tests are identified by their longnames. Keywords can be looked up both
+    with and without the library or resource name prefix.
+    """
+
+    def __init__(self):
+        self.tests = OrderedDict()
+        self._keywords = {}
+        self._keywords_by_name = {}
+
+    def add_test(self, longname, status, elapsed):
+        self.tests[longname] = (status, elapsed)
+
+    def add_keyword(self, name, library, elapsed):
+        full_name = '%s.%s' % (library, name) if library else name
+        self._get_times(self._keywords, full_name).add(elapsed)
+        if library:
+            self._get_times(self._keywords_by_name, name).add(elapsed)
+
+    @staticmethod
+    def _get_times(keywords, name):
+        key = normalize(name, ignore='_')
+        if key not in keywords:
+            keywords[key] = KeywordTimes(name)
+        return keywords[key]
+
+    def get_test(self, longname):
+        """Returns the elapsed time of a test, or None if it was not run."""
+        return self.tests[longname][1] if longname in self.tests else None
+
+    def get_keyword(self, name):
+        """Returns `KeywordTimes` of a keyword, or None if it was not run."""
+        key = normalize(name, ignore='_')
+        return self._keywords.get(key) or self._keywords_by_name.get(key)
+
+    @property
+    def slowest_test(self):
+        return max([elapsed for _, elapsed in self.tests.values()] or [0])
+
+    def slowest_tests(self, count=10):
+        """Returns (longname, elapsed) pairs of the slowest tests."""
+        tests = [(name, elapsed) for name, (_, elapsed) in self.tests.items()]
+        return sorted(tests, key=lambda test: test[1], reverse=True)[:count]
+
+    def slowest_keywords(self, count=10):
+        """Returns `KeywordTimes` of the keywords that took most time in total."""
+        return sorted(self._keywords.values(), key=lambda kw: kw.total,
+                      reverse=True)[:count]
+
+
+def read_execution_times(source):
+    """Reads `ExecutionTimes` from an output.xml file.
+
+    The file is parsed in a streaming manner and every element is discarded
+    as soon as it has been handled, so memory usage does not depend on the
+    size of the file. Outputs of Robot Framework 3.x and newer are supported.
+    """
+    times = ExecutionTimes()
+    suites = []
+    elements = []
+    with ETSource(source) as xml:
+        for event, elem in ET.iterparse(xml, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'suite':
+                    suites.append(elem.get('name', ''))
+                elements.append(elem)
+                continue
+            elements.pop()
+            if elem.tag == 'status' and elements:
+                _add_times(times, elements[-1], suites, elem)
+            elif elem.tag == 'suite':
+                suites.pop()
+            elem.clear()
+            if elements:
+                elements[-1].remove(elem)
+    return times
+
+
+def _add_times(times, owner, suites, status):
+    if owner.tag == 'test':
+        times.add_test('.'.join(suites + [owner.get('name', '')]),
+                       status.get('status', ''), _elapsed_time(status))
+    elif owner.tag == 'kw' and owner.get('type') not in _CONTROL_KEYWORD_TYPES:
+        times.add_keyword(owner.get('name', ''),
+                          owner.get('library') or owner.get('owner'),
+                          _elapsed_time(status))
+
+
+def _elapsed_time(status):
+    elapsed = status.get('elapsed')
+    if elapsed is not None:
+        return int(round(float(elapsed) * 1000))
+    start, end = status.get('starttime'), status.get('endtime')
+    if not start or not end or 'N/A' in (start, end):
+        return 0
+    return get_elapsed_time(start, end)
@@ -0,0 +1,73 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+
+
+class SpillFile(object):
+    """Holds the text trimmed from the beginning of a bounded log view.
+
+    The file works like a stack: `push` adds text that was removed from the
+    top of the view and `pop` gives back the newest of it, so that it can be
+    put back to the top of the view. Text is stored as UTF-8 and popped at
+    line boundaries whenever possible.
+    """
+
+    def __init__(self):
+        self._file = None
+
+    @property
+    def size(self):
+        """Number of bytes stored."""
+        if not self._file:
+            return 0
+        self._file.seek(0, os.SEEK_END)
+        return self._file.tell()
+
+    def push(self, text):
+        if not text:
+            return
+        if not self._file:
+            self._file = tempfile.TemporaryFile()
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(text.encode('UTF-8') if not isinstance(text, bytes) else text)
+
+    def pop(self, size):
+        """Removes and returns at most `size` bytes of the newest text."""
+        end = self.size
+        if not end:
+            return ''
+        start = max(end - size, 0)
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        if start:
+            data, start = self._from_line_start(data, start)
+        self._file.truncate(start)
+        return data.decode('UTF-8', 'replace')
+
+    @staticmethod
+    def _from_line_start(data, start):
+        newline = data.find(b'\n')
+        skip = newline + 1 if 0 <= newline < len(data) - 1 else 0
+        # Never start in the middle of a multibyte character
+        while skip < len(data) and (data[skip] & 0xC0) == 0x80:
+            skip += 1
+        return data[skip:], start + skip
+
+    def clear(self):
+        if self._file:
+            self._file.close()
+            self._file = None
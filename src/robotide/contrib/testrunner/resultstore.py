@@ -0,0 +1,162 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import os
+
+from robotide.context import SETTINGS_DIRECTORY
+
+RESULTS_DIRECTORY = os.path.join(SETTINGS_DIRECTORY, 'test_results')
+
+PASS = 'PASS'
+FAIL = 'FAIL'
+SKIP = 'SKIP'
+
+
+class ResultStore(object):
+    """Remembers the outcome of the latest run of every test of a project.
+
+    Results are stored by test longname with the status, the elapsed time in
+    milliseconds and the content hash of the test when it was run. They are
+    kept in memory until `save` is called.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._results = self._read()
+
+    @classmethod
+    def for_project(cls, source):
+        """Returns the store of the project whose top level suite is `source`."""
+        name = hashlib.md5(os.path.abspath(source).encode('UTF-8')).hexdigest()
+        return cls(os.path.join(RESULTS_DIRECTORY, name + '.json'))
+
+    def _read(self):
+        try:
+            with open(self._path, encoding='UTF-8') as results_file:
+                results = json.load(results_file)
+        except (IOError, ValueError):
+            return {}
+        return results if isinstance(results, dict) else {}
+
+    def save(self):
+        directory = os.path.dirname(self._path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        temp_path = self._path + '.tmp'
+        with open(temp_path, 'w', encoding='UTF-8') as results_file:
+            json.dump(self._results, results_file)
+        os.replace(temp_path, self._path)
+
+    def set_result(self, longname, status, elapsed, content_hash):
+        self._results[longname] = {'status': status, 'elapsed': elapsed,
+                                   'hash': content_hash}
+
+    def get_status(self, longname):
+        return self._results.get(longname, {}).get('status')
+
+    def get_elapsed(self, longname):
+        """Elapsed milliseconds of the latest run, or None if never run."""
+        return self._results.get(longname, {}).get('elapsed')
+
+    def failed(self, longnames):
+        """Returns the tests of `longnames` that failed on their latest run."""
+        return [name for name in longnames if self.get_status(name) == FAIL]
+
+    def changed(self, hashes):
+        """Returns the tests that have changed since their latest run.
+
+        `hashes` is a list of (longname, content hash) pairs. Tests that have
+        never been run are considered changed.
+        """
+        return [name for name, content_hash in hashes
+                if self._results.get(name, {}).get('hash') != content_hash]
+
+    def slowest_first(self, longnames):
+        """Returns `longnames` ordered by the elapsed time of the latest run.
+
+        Tests that have never been run go first, as their duration is unknown.
+        """
+        def elapsed(name):
+            value = self.get_elapsed(name)
+            return float('inf') if value is None else value
+        return sorted(longnames, key=elapsed, reverse=True)
+
+
+def model_longname(longname, run_suite, model_suite):
+    """Returns the long name of a test in a run as its long name in the model.
+
+    `run_suite` is the name of the top level suite in the run and
+    `model_suite` its name in the model. They differ when the suite is
+    renamed in the run, e.g. with ``--name``.
+    """
+    if run_suite and run_suite != model_suite and longname.startswith(run_suite + '.'):
+        return model_suite + longname[len(run_suite):]
+    return longname
+
+
+def hash_tests_content(tests):
+    """Returns (longname, content hash) pairs of `tests`.
+
+    The settings and keywords of a file are hashed only once, however many
+    of its tests are given.
+    """
+    file_digests = {}
+    return [(test.longname, hash_test_content(test, file_digests)) for test in tests]
+
+
+def hash_test_content(test, file_digests=None):
+    """Returns a hash of `test` and the settings and keywords of its file.
+
+    `test` is a `TestCaseController`. Changes in resource files are not
+    noticed. Digests of the files are cached in `file_digests`, if given,
+    by the id of the file.
+    """
+    datafile = test.datafile
+    if file_digests is None:
+        file_digest = _hash_file_content(datafile)
+    else:
+        if id(datafile) not in file_digests:
+            file_digests[id(datafile)] = _hash_file_content(datafile)
+        file_digest = file_digests[id(datafile)]
+    digest = hashlib.md5(file_digest)
+    _update_digest(digest, [test.name])
+    for element in test.data:
+        _update_rows(digest, element)
+    return digest.hexdigest()
+
+
+def _hash_file_content(datafile):
+    digest = hashlib.md5()
+    for table in (datafile.setting_table, datafile.keyword_table):
+        for element in table:
+            _update_rows(digest, element)
+    return digest.digest()
+
+
+def _update_rows(digest, element):
+    # User keywords and for loops contain steps of their own
+    if hasattr(element, 'as_list'):
+        _update_digest(digest, element.as_list())
+    else:
+        _update_digest(digest, [element.name])
+    if hasattr(element, 'steps'):
+        for child in element:
+            _update_rows(digest, child)
+
+
+def _update_digest(digest, row):
+    digest.update('\x1f'.join(row).encode('UTF-8') + b'\n')
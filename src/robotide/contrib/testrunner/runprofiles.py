@@ -34,6 +34,7 @@ import wx
 
 from robotide import pluginapi
 from robotide.context import IS_WINDOWS
+from robotide.contrib.testrunner.sharding import BY_SUITE, BY_TEST
 from robotide.contrib.testrunner.usages import USAGE
 from robotide.lib.robot.utils import format_time
 from robotide.robotapi import DataError, Information
@@ -679,3 +680,61 @@ class CustomScriptProfile(PybotProfile):
     def on_custom_script_changed(self, evt):
         _ = evt
         self.set_setting("runner_script", self._script_ctrl.GetValue())
+
+
+class ParallelProfile(PybotProfile):
+    """A runner profile which runs the tests in several robot processes
+
+    Tests are split to shards, either keeping the tests of a suite together
+    or test by test, and every shard is run in its own process. Outputs of
+    the processes are finally combined with rebot. It is assumed that robot
+    and rebot are on the path.
+    """
+
+    name = "parallel"
+    default_settings = dict(PybotProfile.default_settings,
+                            processes=os.cpu_count() or 2,
+                            shard_by=BY_SUITE)
+    _shard_choices = [(BY_SUITE, "Suites"), (BY_TEST, "Tests")]
+
+    @staticmethod
+    def get_merge_command():
+        return "rebot.bat" if IS_WINDOWS else "rebot"
+
+    def get_toolbar_items(self, parent):
+        return [self._get_parallel_panel(parent),
+                self._get_arguments_panel(parent),
+                self._get_tags_panel(parent),
+                self._get_log_options_panel(parent)]
+
+    def _get_parallel_panel(self, parent):
+        panel = wx.Panel(parent, wx.ID_ANY)
+        label = Label(panel, label="Processes: ")
+        self._processes_ctrl = wx.SpinCtrl(panel, wx.ID_ANY, min=1, max=64,
+                                           initial=int(self.processes))
+        self._processes_ctrl.SetBackgroundColour(self._mysettings.color_secondary_background)
+        self._processes_ctrl.SetForegroundColour(self._mysettings.color_secondary_foreground)
+        self._processes_ctrl.Bind(wx.EVT_SPINCTRL, self.on_processes_changed)
+        shard_label = Label(panel, label="Split by: ")
+        self._shard_by_ctrl = wx.Choice(
+            panel, wx.ID_ANY, choices=[title for _, title in self._shard_choices])
+        values = [value for value, _ in self._shard_choices]
+        self._shard_by_ctrl.SetSelection(
+            values.index(self.shard_by) if self.shard_by in values else 0)
+        self._shard_by_ctrl.Bind(wx.EVT_CHOICE, self.on_shard_by_changed)
+        sizer = wx.BoxSizer(wx.HORIZONTAL)
+        sizer.Add(label, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
+        sizer.Add(self._processes_ctrl, 0, wx.ALIGN_CENTER_VERTICAL)
+        sizer.Add(shard_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
+        sizer.Add(self._shard_by_ctrl, 0, wx.ALIGN_CENTER_VERTICAL)
+        panel.SetSizerAndFit(sizer)
+        return panel
+
+    def on_processes_changed(self, evt):
+        _ = evt
+        self.set_setting("processes", self._processes_ctrl.GetValue())
+
+    def on_shard_by_changed(self, evt):
+        _ = evt
+        self.set_setting("shard_by",
+                         self._shard_choices[self._shard_by_ctrl.GetSelection()][0])
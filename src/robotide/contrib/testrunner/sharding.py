@@ -0,0 +1,60 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import OrderedDict
+
+BY_SUITE = 'suite'
+BY_TEST = 'test'
+
+
+def shard_tests(tests, count, by=BY_SUITE, weight=None):
+    """Splits `tests` to at most `count` shards to be run in parallel.
+
+    `tests` is a list of (suite longname, test longname) pairs. With
+    `BY_SUITE` all the tests of a suite go to the same shard, so that suite
+    setups and teardowns are run only once. With `BY_TEST` the tests are
+    distributed one by one. The heaviest suites or tests are placed first
+    to the least loaded shards.
+
+    `weight` is an optional function returning the expected duration of a
+    test. Without it all tests are considered equally long, and with
+    `BY_TEST` the tests are simply dealt round-robin.
+
+    Returns a list of non-empty shards, each keeping the original order of
+    its tests.
+    """
+    count = max(int(count), 1)
+    if by == BY_TEST:
+        if weight is None:
+            shards = [tests[index::count] for index in range(count)]
+            return [shard for shard in shards if shard]
+        groups = [[test] for test in tests]
+    else:
+        suites = OrderedDict()
+        for suite, test in tests:
+            suites.setdefault(suite, []).append((suite, test))
+        groups = list(suites.values())
+    weight = weight or (lambda test: 1)
+
+    def group_weight(group):
+        return sum(weight(test) for test in group)
+    shards = [[] for _ in range(min(count, len(groups)))]
+    loads = [0] * len(shards)
+    for group in sorted(groups, key=group_weight, reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].extend(group)
+        loads[lightest] += group_weight(group)
+    order = dict((test, index) for index, test in enumerate(tests))
+    return [sorted(shard, key=order.get) for shard in shards]
@@ -29,11 +29,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import io
+import json
 import socketserver as SocketServer
 import threading
 
-from robotide.contrib.testrunner.Process import Process
-from robotide.contrib.testrunner.TestRunnerAgent import StreamHandler
+from robotide.contrib.testrunner.Process import Process, ProcessGroup
+from robotide.contrib.testrunner.TestRunnerAgent import (StreamHandler, BinaryStreamHandler,
+                                                         LISTENER_FILTER_ENV)
 from robotide.controller.testexecutionresults import TestExecutionResults
 
 
@@ -64,6 +67,7 @@ class TestRunner(object):
         self.profiles = {}
         self._pause_longname = None
         self._pause_testname = None
+        self._listener_filter = {}
 
     def enable(self, result_handler):
         self._start_listener_server(result_handler)
@@ -165,10 +169,40 @@ class TestRunner(object):
         if self._process:
             self._process.step_over()
 
-    def run_command(self, command, cwd):
+    def set_listener_filter(self, log_level=0, keywords=True, keyword_interval=0):
+        """Configures which events the listener of the next run sends.
+
+        See `TestRunnerAgent.EventFilter` for the meaning of the arguments.
+        """
+        self._listener_filter = {'log_level': log_level, 'keywords': keywords,
+                                 'keyword_interval': keyword_interval}
+
+    def run_command(self, command, cwd, on_output=None, on_exit=None):
+        """Starts `command` in `cwd`.
+
+        `on_output` is called when new output is available and `on_exit` when
+        the process has ended and all its output has been read. Both are
+        called from background threads.
+        """
+        self._pid_to_kill = None
+        self._process = Process(cwd, on_output, on_exit)
+        self._process.run_command(command, env=self._listener_env())
+
+    def run_commands(self, commands, cwd, final_command=None, on_output=None,
+                     on_exit=None):
+        """Starts `commands` in `cwd` in parallel.
+
+        `final_command` is a callable returning a command to run after all
+        the commands have ended, or None. Otherwise works like `run_command`
+        but `on_exit` is called only once everything has ended.
+        """
         self._pid_to_kill = None
-        self._process = Process(cwd)
-        self._process.run_command(command)
+        self._process = ProcessGroup(cwd, on_output, on_exit)
+        self._process.run_commands(commands, final_command,
+                                   env=self._listener_env())
+
+    def _listener_env(self):
+        return {LISTENER_FILTER_ENV: json.dumps(self._listener_filter)}
 
     def get_output_and_errors(self, profile):
         stdout, stderr, returncode = self._process.get_output(), \
@@ -192,18 +226,43 @@ class TestRunner(object):
 # server. It is designed to run in a separate thread, read data
 # from the given port and update the UI -- hopefully all in a
 # thread-safe manner.
-class RideListenerServer(SocketServer.TCPServer):
-    """Implements a simple line-buffered socket server"""
+class RideListenerServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """Implements a simple line-buffered socket server
+
+    Every connection is handled in its own thread, so that several test
+    processes can report at the same time, but the callback is never called
+    concurrently.
+    """
     allow_reuse_address = True
+    daemon_threads = True
 
     def __init__(self, request_handler_class, callback):
         SocketServer.TCPServer.__init__(self, ("", 0), request_handler_class)
-        self.callback = callback
+        self._callback = callback
+        self._callback_lock = threading.Lock()
+
+    def callback(self, *args):
+        with self._callback_lock:
+            self._callback(*args)
 
 
 class RideListenerHandler(SocketServer.StreamRequestHandler):
     def handle(self):
-        decoder = StreamHandler(self.request.makefile('r'))
+        if self.rfile.peek(1)[:1] == BinaryStreamHandler.MAGIC:
+            self.rfile.read(1)
+            self._handle_binary(BinaryStreamHandler(self.rfile))
+        else:
+            self._handle_json(StreamHandler(io.TextIOWrapper(self.rfile, encoding='UTF-8')))
+
+    def _handle_binary(self, decoder):
+        while True:
+            try:
+                for name, args in decoder.load_batch():
+                    self.server.callback(name, *args)
+            except (EOFError, IOError):
+                break
+
+    def _handle_json(self, decoder):
         while True:
             try:
                 (name, args) = decoder.load()
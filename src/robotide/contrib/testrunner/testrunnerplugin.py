@@ -47,6 +47,7 @@ being used for a currently running test.
 """
 import atexit
 import datetime
+import glob
 import shutil
 import subprocess
 import tempfile
@@ -64,15 +65,21 @@ from wx.lib.embeddedimage import PyEmbeddedImage
 from robotide.action.shortcut import localize_shortcuts
 from robotide.context import IS_WINDOWS, IS_MAC
 from robotide.contrib.testrunner import TestRunner
-from robotide.contrib.testrunner import runprofiles
+from robotide.contrib.testrunner import runprofiles, ansicolors
 from robotide.contrib.testrunner.ArgsParser import ArgsParser
 from robotide.contrib.testrunner.CommandArgs import CommandArgs
+from robotide.contrib.testrunner.executiontimes import read_execution_times
 from robotide.contrib.testrunner.Command import Command
 from robotide.contrib.testrunner.FileWriter import FileWriter
+from robotide.contrib.testrunner.logbuffer import SpillFile
+from robotide.contrib.testrunner.resultstore import (ResultStore, hash_tests_content,
+                                                      model_longname)
 from robotide.contrib.testrunner.SettingsParser import SettingsParser
+from robotide.contrib.testrunner.sharding import shard_tests
 from robotide.controller.macrocontrollers import TestCaseController
 from robotide.publish import RideSettingsChanged, PUBLISHER
-from robotide.publish.messages import RideTestSelectedForRunningChanged
+from robotide.publish.messages import (RideExecutionTimesLoaded,
+                                       RideTestSelectedForRunningChanged)
 from robotide.pluginapi import Plugin, ActionInfo
 from robotide.ui.notebook import NoteBook
 from robotide.widgets import Label, ImageProvider, RIDEDialog
@@ -106,11 +113,26 @@ ID_SHOW_LOG = wx.NewIdRef()
 ID_AUTOSAVE = wx.NewIdRef()
 ID_PAUSE_ON_FAILURE = wx.NewIdRef()
 ID_SHOW_MESSAGE_LOG = wx.NewIdRef()
+ID_SLOWEST_FIRST = wx.NewIdRef()
 STYLE_DEFAULT = 0
 STYLE_STDERR = 2
 STYLE_PASS = 1
 STYLE_SKIP = 3
 STYLE_FAIL = 4
+_COLOR_STYLES = {ansicolors.RED: STYLE_FAIL,
+                 ansicolors.GREEN: STYLE_PASS,
+                 ansicolors.YELLOW: STYLE_SKIP}
+# Text moved to the spill file keeps its styling as color codes. Stderr,
+# which has no color of its own, uses a code that the output styling ignores.
+_SPILLED_STYLES = dict(_COLOR_STYLES, **{ansicolors.BLUE: STYLE_STDERR})
+_SPILLED_CODES = dict((style, code) for code, style in _SPILLED_STYLES.items())
+
+RUN_SELECTED = 'selected'
+RUN_FAILED = 'failed'
+RUN_CHANGED = 'changed'
+RUN_MODES = [(RUN_SELECTED, "Selected tests"),
+             (RUN_FAILED, "Failed on last run"),
+             (RUN_CHANGED, "Changed since last run")]
 
 ATEXIT_LOCK = threading.RLock()
 
@@ -160,6 +182,11 @@ class TestRunnerPlugin(Plugin):
                 "profile_name": "robot",
                 "show_console_log": True,
                 "show_message_log": True,
+                "keyword_events": True,
+                "keyword_event_interval": 0.1,
+                "log_size_limit": 4,
+                "run_mode": RUN_SELECTED,
+                "slowest_first": False,
                 "sash_position": 200,
                 "run_profiles":
                     [('jybot', 'jybot' + ('.bat' if os.name == 'nt' else '')),
@@ -178,6 +205,7 @@ class TestRunnerPlugin(Plugin):
 
     report_regex = re.compile(r"^Report: {2}(.*\.html)$", re.MULTILINE)
     log_regex = re.compile(r"^Log: {5}(.*\.html)$", re.MULTILINE)
+    output_regex = re.compile(r"^Output: {2}(.*\.xml)$", re.MULTILINE)
     title = "Run"
 
     def __init__(self, application=None):
@@ -199,10 +227,15 @@ class TestRunnerPlugin(Plugin):
         self._min_log_level_number = LOG_LEVELS['INFO']
         self._pause_on_failure = False
         self._selected_tests: {TestCaseController} = set()
+        self._tests_to_run = []
+        self._result_store = None
+        self._run_hashes = {}
+        self._run_suite_name = None
         self._process = psutil.Process()
         self._initmemory = None
         self._limitmemory = None  # This will be +80%
         self._maxmemmsg = None
+        self._output_update_pending = False
         self.use_colors = self.__getattr__('use colors')
         self.fail_color = self.__getattr__('fail color')
         self.pass_color = self.__getattr__('pass color')
@@ -212,7 +245,7 @@ class TestRunnerPlugin(Plugin):
     def _names_to_run(self):
         return list(
             map(lambda ctrl: (ctrl.datafile_controller.longname, ctrl.longname),
-                self._selected_tests))
+                self._tests_to_run))
 
     def _register_shortcuts(self):
         self.register_shortcut('CtrlCmd-C', self._copy_from_log_ctrls)
@@ -325,8 +358,6 @@ class TestRunnerPlugin(Plugin):
     def on_close(self, event):
         """Shut down the running services and processes"""
         self._test_runner.kill_process()
-        if self._process_timer:
-            self._process_timer.Stop()
         self._test_runner.shutdown_server()
         event.Skip()
 
@@ -387,10 +418,13 @@ class TestRunnerPlugin(Plugin):
         if not self._can_start_running_tests():
             return
         if self.__getattr__('confirm run') \
+                and self.run_mode == RUN_SELECTED \
                 and not self._tests_selected() \
                 and not self._ask_user_to_run_anyway():
             # In Linux NO runs dialog 4 times
             return
+        if not self._select_tests_to_run():
+            return
         self._reset_memory_calc()
         profile = self.get_current_profile()
         self.use_colors = self.__getattr__('use colors')
@@ -398,13 +432,18 @@ class TestRunnerPlugin(Plugin):
         args_file = self._save_command_args_in_file(command_args)
         # print(f"DEBUG: testrunnerplugin _run_tests AFTER _save_command_args_in_file")
         command = self._create_command(profile.get_command(), args_file)
+        shards = self._get_parallel_shards(profile)
         self._initialize_variables_for_running(profile.get_settings(), command_args)
         self._initialize_ui_for_running()
-        # DEBUG on Py3 it not shows correct if tags with latin chars
-        self._append_to_console_log("command: %s\n" % command)
         try:
-            self._test_runner.run_command(command, self._get_current_working_dir(profile))
-            self._process_timer.Start(41)  # roughly 24fps
+            if shards:
+                self._run_shards(profile, shards, log_level)
+            else:
+                # DEBUG on Py3 it not shows correct if tags with latin chars
+                self._append_to_console_log("command: %s\n" % command)
+                self._test_runner.run_command(command, self._get_current_working_dir(profile),
+                                              on_output=self._schedule_output_update,
+                                              on_exit=lambda: wx.CallAfter(self.on_process_ended, None))
             self._set_running()
             self._progress_bar.Start()
         except Exception as e:
@@ -414,21 +453,102 @@ class TestRunnerPlugin(Plugin):
             if log_message:
                 log_message.publish()
 
-    def _create_command_args(self, profile_command_args, log_level='INFO', use_colors=False):
+    def _select_tests_to_run(self):
+        """Selects the tests to run based on the run mode and earlier results.
+
+        Returns False if the run mode leaves no tests to run.
+        """
+        self._result_store = ResultStore.for_project(self.model.suite.source)
+        tests = list(self._selected_tests)
+        candidates = tests or list(self.model.all_testcases())
+        self._run_hashes = dict(hash_tests_content(candidates))
+        self._run_suite_name = None
+        if self.run_mode == RUN_FAILED:
+            names = self._result_store.failed(list(self._run_hashes))
+        elif self.run_mode == RUN_CHANGED:
+            names = self._result_store.changed(self._run_hashes.items())
+        else:
+            names = [test.longname for test in tests]
+        if self.run_mode != RUN_SELECTED and not names:
+            wx.MessageBox("There are no tests to run: no %s tests were found."
+                          % ("failed" if self.run_mode == RUN_FAILED else "changed"),
+                          "No tests to run")
+            return False
+        if self.slowest_first:
+            names = self._result_store.slowest_first(names)
+        by_name = dict((test.longname, test) for test in candidates)
+        self._tests_to_run = [by_name[name] for name in names]
+        return True
+
+    def _test_weight(self, test):
+        """Expected duration of a (suite longname, test longname) pair."""
+        elapsed = self._result_store.get_elapsed(test[1])
+        return 1 if elapsed is None else max(elapsed, 1)
+
+    def _create_command_args(self, profile_command_args, log_level='INFO', use_colors=False,
+                             tests=None):
         return CommandArgs().with_existing_args(profile_command_args) \
             .with_log_level(log_level) \
             .with_output_directory(self._default_output_dir) \
             .with_python_path(self.global_settings.get('pythonpath', None)) \
             .with_console_width(self._get_console_width()) \
             .without_console_color(not use_colors) \
-            .with_runnable_tests(self._names_to_run) \
+            .with_runnable_tests(self._names_to_run if tests is None else tests) \
             .build()
 
-    def _save_command_args_in_file(self, args):
-        arg_file = os.path.join(self._default_output_dir, 'argfile.txt')
+    def _save_command_args_in_file(self, args, name='argfile.txt'):
+        arg_file = os.path.join(self._default_output_dir, name)
         FileWriter.write(arg_file, args, 'wb')
         return arg_file
 
+    def _get_parallel_shards(self, profile):
+        """Returns the shards to run in parallel, or None to use one process."""
+        if not isinstance(profile, runprofiles.ParallelProfile):
+            return None
+        tests = self._names_to_run or \
+            [(ctrl.datafile_controller.longname, ctrl.longname)
+             for ctrl in self.model.all_testcases()]
+        shards = shard_tests(tests, profile.processes, profile.shard_by,
+                             weight=self._test_weight if self.slowest_first else None)
+        return shards if len(shards) > 1 else None
+
+    def _run_shards(self, profile, shards, log_level):
+        prefix = profile.get_command()
+        commands = []
+        output_dirs = []
+        for index, shard in enumerate(shards, start=1):
+            output_dir = os.path.join(self._default_output_dir, 'shard%d' % index)
+            shutil.rmtree(output_dir, ignore_errors=True)
+            output_dirs.append(output_dir)
+            # Later options override the ones given by the user
+            args = self._create_command_args(profile.get_command_args(), log_level,
+                                             self.use_colors, tests=shard) + \
+                ['-d', output_dir, '-o', 'output.xml', '-l', 'NONE', '-r', 'NONE',
+                 '--console', 'dotted']
+            args_file = self._save_command_args_in_file(args, 'argfile%d.txt' % index)
+            commands.append(self._create_command(prefix, args_file))
+            self._append_to_console_log("command: %s\n" % commands[-1])
+        merge_args = ['--name', self.model.suite.name, '-d', self._logs_directory,
+                      '-o', 'output.xml']
+        merge_command = Command().with_prefix(profile.get_merge_command()) \
+            .with_args_file(os.path.join(self._default_output_dir, 'mergefile.txt')) \
+            .build()
+        self._append_to_console_log("command: %s\n" % merge_command)
+
+        def final_command():
+            # Called in a background thread when all the shards have ended
+            outputs = [output for output_dir in output_dirs
+                       for output in sorted(glob.glob(os.path.join(output_dir, 'output*.xml')))]
+            if not outputs:
+                return None
+            self._save_command_args_in_file(merge_args + outputs, 'mergefile.txt')
+            return merge_command
+
+        self._test_runner.run_commands(commands, self._get_current_working_dir(profile),
+                                       final_command,
+                                       on_output=self._schedule_output_update,
+                                       on_exit=lambda: wx.CallAfter(self.on_process_ended, None))
+
     def _create_command(self, profile_command, args_file):
         return Command().with_prefix(profile_command) \
             .with_args_file(args_file) \
@@ -443,6 +563,10 @@ class TestRunnerPlugin(Plugin):
 
         self._min_log_level_number = \
             ArgsParser.get_message_log_level(args)
+        self._test_runner.set_listener_filter(
+            log_level=self._min_log_level_number,
+            keywords=self.keyword_events,
+            keyword_interval=self.keyword_event_interval)
 
         self._logs_directory = \
             ArgsParser.get_output_directory(args, self._default_output_dir)
@@ -506,6 +630,7 @@ class TestRunnerPlugin(Plugin):
         text_ctrl.SetReadOnly(False)
         text_ctrl.ClearAll()
         text_ctrl.SetReadOnly(True)
+        text_ctrl.clear_spilled()
 
     def on_open_logs_directory(self, event):
         """Called when the user clicks on the "Open Logs Directory" button"""
@@ -530,16 +655,19 @@ class TestRunnerPlugin(Plugin):
 
     def on_process_ended(self, event):
         _ = event
+        if not self.panel:
+            return
+        self._append_log_messages()
         output, errors, log_message = self._test_runner.get_output_and_errors(
             self.get_current_profile())
         self._append_to_console_log(output)
         self._read_report_and_log_from_stdout_if_needed()
         if len(errors) > 0:
             self._append_to_console_log(errors, source="stderr")
-        if self._process_timer:
-            self._process_timer.Stop()
         self._set_stopped()
         self._progress_bar.Stop()
+        self._save_results()
+        self._load_execution_times()
         now = datetime.datetime.now().timetuple()
         self._append_to_console_log("\nTest finished {}"
                                     .format(robottime.format_time(now)))
@@ -548,6 +676,53 @@ class TestRunnerPlugin(Plugin):
             log_message.publish()
         self._local_toolbar.EnableTool(ID_OPEN_LOGS_DIR, True)
 
+    def _save_results(self):
+        if not self._result_store:
+            return
+        try:
+            self._result_store.save()
+        except (IOError, OSError) as err:
+            self._append_to_message_log("Could not save test results: %s\n" % err,
+                                        "stderr")
+
+    def _load_execution_times(self):
+        # The last output file printed is the final one also in parallel runs
+        outputs = self.output_regex.findall(self._console_log_ctrl.GetText())
+        if not outputs or not os.path.isfile(outputs[-1]):
+            return
+        reader = threading.Thread(target=self._read_execution_times,
+                                  args=(outputs[-1],))
+        reader.daemon = True
+        reader.start()
+
+    def _read_execution_times(self, path):
+        # Run in a background thread, output files can be huge
+        try:
+            times = read_execution_times(path)
+        except Exception as err:
+            wx.CallAfter(self._append_to_message_log,
+                         "\nCould not read execution times from %s: %s\n" % (path, err),
+                         "stderr")
+            return
+        wx.CallAfter(self._show_execution_times, times)
+
+    def _show_execution_times(self, times):
+        if not self.panel:
+            return
+        lines = ["", "Slowest tests:"]
+        lines += ["  %s  %s" % (self._format_elapsed(elapsed), name)
+                  for name, elapsed in times.slowest_tests()]
+        lines += ["", "Slowest keywords (total time, calls, slowest call):"]
+        lines += ["  %s  %s  %d  %s" % (self._format_elapsed(kw.total), kw.name,
+                                        kw.count, self._format_elapsed(kw.slowest))
+                  for kw in times.slowest_keywords()]
+        self._append_to_message_log("\n".join(lines) + "\n")
+        RideExecutionTimesLoaded(times=times).publish()
+
+    @staticmethod
+    def _format_elapsed(elapsed):
+        return robottime.elapsed_time_to_string(elapsed)
+
     def _read_report_and_log_from_stdout_if_needed(self):
         output = self._console_log_ctrl.GetText()
         if not self._report_file:
@@ -565,22 +740,25 @@ class TestRunnerPlugin(Plugin):
         res = regex.search(output)
         return res.group(1) if res and os.path.isfile(res.group(1)) else None
 
-    def on_timer(self, event):
+    def _put_log_message(self, text):
+        self._log_message_queue.put(text)
+        self._schedule_output_update()
+
+    def _schedule_output_update(self):
+        # Called from the reader and listener threads. Output arriving
+        # before the update has run is handled by the same update.
+        if not self._output_update_pending:
+            self._output_update_pending = True
+            wx.CallAfter(self._update_output)
+
+    def _update_output(self):
         """Get process output"""
-        _ = event
-        if not self._log_message_queue.empty():
-            if self._process.memory_info()[0] <= self._limitmemory:
-                texts = []
-                while not self._log_message_queue.empty():
-                    texts += [self._log_message_queue.get()]
-                self._append_to_message_log('\n' + '\n'.join(texts))
-            else:
-                if not self._maxmemmsg:
-                    self._maxmemmsg = '\n' + "Messages log exceeded 80% of process memory, stopping for now..."
-                    self._append_to_message_log(self._maxmemmsg, "stderr")
-        if not self._test_runner.is_running():
-            self.on_process_ended(None)
+        self._output_update_pending = False
+        if not self.panel:
             return
+        self._append_log_messages()
+        if not self._test_runner.is_running():
+            return  # on_process_ended appends the rest
         out_buffer, err_buffer, _ = self._test_runner.get_output_and_errors(self.get_current_profile())
         if len(out_buffer) > 0:
             self._append_to_console_log(out_buffer, source="stdout")
@@ -594,6 +772,18 @@ class TestRunnerPlugin(Plugin):
                 self._append_to_console_log("\n")
             self._append_to_console_log(err_buffer, source="stderr")
 
+    def _append_log_messages(self):
+        if not self._log_message_queue.empty():
+            if self._process.memory_info()[0] <= self._limitmemory:
+                texts = []
+                while not self._log_message_queue.empty():
+                    texts += [self._log_message_queue.get()]
+                self._append_to_message_log('\n' + '\n'.join(texts))
+            else:
+                if not self._maxmemmsg:
+                    self._maxmemmsg = '\n' + "Messages log exceeded 80% of process memory, stopping for now..."
+                    self._append_to_message_log(self._maxmemmsg, "stderr")
+
     def _get_last_output_char(self):
         """Return the last character in the output window"""
         pos = self._console_log_ctrl.PositionBefore(
@@ -621,9 +811,10 @@ class TestRunnerPlugin(Plugin):
         # text could be bytes or str
         if not self.panel or not text_ctrl:
             return
-        self._color_map = list()
+        default_style = STYLE_STDERR if source == "stderr" else STYLE_DEFAULT
+        styling = None
         if self.use_colors:
-            text = self.parse_colors(text)
+            text, styling = ansicolors.split_colors(text, _COLOR_STYLES, default_style)
         text_ctrl.update_scroll_width(text)
         # we need this information to decide whether to autoscroll or not
         new_text_start = text_ctrl.GetLength()
@@ -632,8 +823,6 @@ class TestRunnerPlugin(Plugin):
             text_ctrl.GetFirstVisibleLine() + text_ctrl.LinesOnScreen() - 1
 
         text_ctrl.SetReadOnly(False)
-        pos = text_ctrl.GetLastPosition()   # DEBUG: Process \r with Replace
-        # print(f"DEBUG: _append_text lastposition={pos}")
         text_ctrl.AppendText(text)
         new_text_end = text_ctrl.GetLength()
 
@@ -641,80 +830,17 @@ class TestRunnerPlugin(Plugin):
             text_ctrl.StartStyling(new_text_start, 0x1f)
         else:
             text_ctrl.StartStyling(new_text_start)
-        text_ctrl.SetStyling(0, STYLE_DEFAULT)
-        if source == "stderr" and not self.use_colors:
-            text_ctrl.SetStyling(new_text_end - new_text_start, STYLE_STDERR)
-
-        if self.use_colors and self._color_map:
-            style = None
-            previous_start = None
-            for item in self._color_map:
-                previous_style = style
-                if item[1] == 'RED':
-                    style = STYLE_FAIL
-                elif item[1] == 'GREEN':
-                    style = STYLE_PASS
-                elif item[1] == 'YELLOW':
-                    style = STYLE_SKIP
-                elif item[1] is None:
-                    style = STYLE_DEFAULT
-                if style:
-                    if wx.VERSION < (4, 1, 0):
-                        text_ctrl.StartStyling(pos + item[0], 0x1f)
-                    else:
-                        text_ctrl.StartStyling(pos + item[0])
-                    previous_start = item[0]
-                if previous_style and style == STYLE_DEFAULT:
-                    text_ctrl.SetStyling(item[0] - previous_start, previous_style)
-            if previous_start and style:
-                text_ctrl.SetStyling(item[0] - previous_start, STYLE_DEFAULT)
+        if styling:
+            text_ctrl.SetStyleBytes(len(styling), styling)
+        else:
+            text_ctrl.SetStyling(new_text_end - new_text_start, default_style)
 
         text_ctrl.SetReadOnly(True)
+        text_ctrl.limit_size()
         if last_visible_line >= line_count - 4:
             line_count = text_ctrl.GetLineCount()
             text_ctrl.ScrollToLine(line_count)
 
-    def parse_colors(self, txt):
-        # print(f"DEBUG: enter parse_colors {txt}")
-        idx = 0
-        t_size = len(txt)
-        while idx < t_size:
-            # print(f"{str(txt[idx])}")
-            if txt[idx] == 27:  # .startswith('\033[32m'):
-                color = False
-                # print(f"DEBUG: parse_colors got ESC, {txt[idx+1:idx+5]}")
-                if txt[idx + 1:idx+5] == b'[34m':
-                    color = True
-                    self.store_color(idx, 'BLUE')
-                    # print(f"DEBUG: parse_colors got BLUE")
-                if txt[idx + 1:idx+5] == b'[33m':
-                    color = True
-                    self.store_color(idx, 'YELLOW')
-                    # print(f"DEBUG: parse_colors got YELLOW")
-                if txt[idx+1:idx+5] == b'[32m':
-                    color = True
-                    self.store_color(idx, 'GREEN')
-                    # print(f"DEBUG: parse_colors got GREEN")
-                if txt[idx+1:idx+5] == b'[31m':
-                    color = True
-                    self.store_color(idx, 'RED')
-                    # print(f"DEBUG: parse_colors got RED")
-                if txt[idx+1:idx+4] == b'[0m':
-                    # print(f"DEBUG: parse_colors reset to NORMAL")
-                    self.store_color(idx, None)
-                    txt = txt[:idx] + txt[idx+4:]
-                elif color:
-                    txt = txt[:idx] + txt[idx+5:]
-                if idx >= len(txt):
-                    break
-            t_size = len(txt)
-            if idx < t_size:
-                idx += 1
-        return txt
-
-    def store_color(self, idx, color):
-        self._color_map.append((idx, color))
-
     def _get_console_width(self):
         # robot wants to know a fixed size for output, so calculate the
         # width of the window based on average width of a character. A
@@ -815,6 +941,24 @@ class TestRunnerPlugin(Plugin):
                                    " Pause after failure  ", False,
                                    "Automatically pause after failing keyword")
         toolbar.AddControl(self.pause_on_failure_cb)
+        toolbar.AddSeparator()
+
+        run_mode_label = Label(toolbar, label="Run:  ")
+        self.run_mode_choice = wx.Choice(toolbar, wx.ID_ANY,
+                                         choices=[title for _, title in RUN_MODES])
+        self.run_mode_choice.SetToolTip(wx.ToolTip("Choose which tests to run "
+                                                   "based on the results of earlier runs"))
+        modes = [mode for mode, _ in RUN_MODES]
+        self.run_mode_choice.SetSelection(
+            modes.index(self.run_mode) if self.run_mode in modes else 0)
+        toolbar.AddControl(run_mode_label)
+        toolbar.AddControl(self.run_mode_choice)
+        self.slowest_first_cb = \
+            self._create_check_box(toolbar, ID_SLOWEST_FIRST, " Slowest first  ",
+                                   self.slowest_first,
+                                   "Order tests by their duration on the last run, "
+                                   "which balances parallel runs")
+        toolbar.AddControl(self.slowest_first_cb)
 
         toolbar.EnableTool(ID_OPEN_LOGS_DIR, False)
         toolbar.EnableTool(ID_SHOW_LOG, False)
@@ -839,6 +983,9 @@ class TestRunnerPlugin(Plugin):
                  self.autosave_cb),
                 (wx.EVT_CHECKBOX, self._on_pause_on_failure_cb,
                  self.pause_on_failure_cb),
+                (wx.EVT_CHECKBOX, self._on_slowest_first_cb,
+                 self.slowest_first_cb),
+                (wx.EVT_CHOICE, self._on_run_mode_selection, self.run_mode_choice),
                 (wx.EVT_CHOICE, self._on_profile_selection, self.choice)):
             toolbar.Bind(event, handler, source)
 
@@ -850,6 +997,12 @@ class TestRunnerPlugin(Plugin):
         self._pause_on_failure = evt.IsChecked()
         self._test_runner.send_pause_on_failure(evt.IsChecked())
 
+    def _on_slowest_first_cb(self, evt):
+        self.save_setting("slowest_first", evt.IsChecked())
+
+    def _on_run_mode_selection(self, event):
+        self.save_setting("run_mode", RUN_MODES[event.GetSelection()][0])
+
     def _on_profile_selection(self, event):
         self.save_setting("profile_name", event.GetString())
         self._set_profile(self.profile_name)
@@ -899,8 +1052,6 @@ class TestRunnerPlugin(Plugin):
         sizer.Add(self._output_panel, 1, wx.EXPAND | wx.TOP, 5)
         self.panel.SetSizer(sizer)
 
-        self._process_timer = wx.Timer(self.panel)
-        self.panel.Bind(wx.EVT_TIMER, self.on_timer)
         self.panel.Bind(wx.EVT_WINDOW_DESTROY, self.on_close)
 
         self.add_tab(self.panel, self.title, allow_closing=False)
@@ -985,7 +1136,7 @@ class TestRunnerPlugin(Plugin):
         return collapsible_pane, text_ctrl
 
     def _create_text_ctrl(self, parent):
-        text_ctrl = OutputStyledTextCtrl(parent)
+        text_ctrl = OutputStyledTextCtrl(parent, max_size=int(self.log_size_limit * 1024 * 1024))
         text_ctrl.SetScrollWidth(100)
         self._set_margins(text_ctrl)
         text_ctrl.SetReadOnly(True)
@@ -1018,6 +1169,9 @@ class TestRunnerPlugin(Plugin):
             # out from under us. In the immortal words of Jar Jar
             # Binks, "How rude!"
             return
+        if event == 'start_suite':
+            self._handle_start_suite(args)
+            return
         if event == 'start_test':
             self._handle_start_test(args)
             return
@@ -1045,14 +1199,23 @@ class TestRunnerPlugin(Plugin):
         if event == 'continue':
             self._handle_continue(args)
 
+    def _handle_start_suite(self, args):
+        if args[1].get('id') == 's1':
+            self._run_suite_name = args[1]['longname']
+
     def _handle_start_test(self, args):
         longname = args[1]['longname'].encode('utf-8')
-        self._log_message_queue.put(
+        self._put_log_message(
             f"Starting test: {longname.decode(encoding['OUTPUT'], 'backslashreplace')}")
 
     def _handle_end_test(self, args):
+        if self._result_store:
+            name = model_longname(args[1]['longname'], self._run_suite_name,
+                                  self.model.controller.longname)
+            self._result_store.set_result(name, args[1]['status'], args[1].get('elapsedtime'),
+                                          self._run_hashes.get(name))
         longname = args[1]['longname'].encode('utf-8')
-        self._log_message_queue.put(
+        self._put_log_message(
             f"Ending test: {longname.decode(encoding['OUTPUT'], 'backslashreplace')}\n")
         if args[1]['status'] == 'PASS':
             self._progress_bar.add_pass()
@@ -1061,7 +1224,7 @@ class TestRunnerPlugin(Plugin):
         elif args[1]['status'] == 'FAIL':
             self._progress_bar.add_fail()
         else:
-            self._log_message_queue.put(f"UNKNOWN STATUS: {args[1]['status']}\n")
+            self._put_log_message(f"UNKNOWN STATUS: {args[1]['status']}\n")
 
     def _handle_report_file(self, args):
         self._report_file = args[0]
@@ -1084,17 +1247,17 @@ class TestRunnerPlugin(Plugin):
             message = a['message']
             if '\n' in message:
                 message = '\n' + message
-            self._log_message_queue.put(prefix + message)
+            self._put_log_message(prefix + message)
 
     def _handle_paused(self, args):
         _ = args
         wx.CallAfter(self._set_paused)
-        self._log_message_queue.put('<<  PAUSED  >>')
+        self._put_log_message('<<  PAUSED  >>')
 
     def _handle_continue(self, args):
         _ = args
         wx.CallAfter(self._set_continue)
-        self._log_message_queue.put('<< CONTINUE >>')
+        self._put_log_message('<< CONTINUE >>')
 
     def _set_running(self):
         self._run_action.disable()
@@ -1260,13 +1423,77 @@ class ProgressBar(wx.Panel):
 
 
 class OutputStyledTextCtrl(wx.stc.StyledTextCtrl):
+    """Output view keeping at most `max_size` bytes of the newest text.
 
-    def __init__(self, parent):
+    Older text is moved to a spill file, from where it can be loaded back
+    with the "Load Older Output" context menu item. Loaded text keeps its
+    colors and is not moved to the spill file again during the same run.
+    """
+
+    def __init__(self, parent, max_size=0):
         wx.stc.StyledTextCtrl.__init__(self, parent, wx.ID_ANY,
                                        style=wx.SUNKEN_BORDER)
         app_settings = self._get_app_settings(parent)
         self.stylizer = OutputStylizer(self, app_settings)
         self._max_row_len = 0
+        self.max_size = max_size
+        self._spilled = SpillFile()
+        self._older_size = 0
+        self.Bind(wx.EVT_CONTEXT_MENU, self.on_context_menu)
+
+    def limit_size(self):
+        length = self.GetLength()
+        # Older text loaded back is kept while new output is appended
+        max_size = self.max_size + self._older_size
+        if self.max_size <= 0 or length <= max_size:
+            return
+        # Trim a quarter more than needed, so that appending every chunk
+        # does not trim again
+        line = self.LineFromPosition(length - max_size + self.max_size // 4)
+        cut = self.PositionFromLine(line + 1)
+        if cut < 0:
+            cut = length
+        styled = bytes(self.GetStyledText(0, cut))
+        self._spilled.push(ansicolors.join_colors(styled[0::2], styled[1::2],
+                                                  _SPILLED_CODES, STYLE_DEFAULT))
+        read_only = self.GetReadOnly()
+        self.SetReadOnly(False)
+        self.DeleteRange(0, cut)
+        self.SetReadOnly(read_only)
+
+    def load_older(self):
+        text = self._spilled.pop(max(self.max_size // 4, 4096))
+        if not text:
+            return
+        text, styling = ansicolors.split_colors(text, _SPILLED_STYLES, STYLE_DEFAULT)
+        read_only = self.GetReadOnly()
+        self.SetReadOnly(False)
+        self.InsertText(0, text)
+        if wx.VERSION < (4, 1, 0):
+            self.StartStyling(0, 0x1f)
+        else:
+            self.StartStyling(0)
+        self.SetStyleBytes(len(styling), styling)
+        self.SetReadOnly(read_only)
+        self._older_size += len(styling)
+        self.ScrollToLine(0)
+
+    def clear_spilled(self):
+        self._spilled.clear()
+        self._older_size = 0
+
+    def on_context_menu(self, event):
+        _ = event
+        menu = wx.Menu()
+        for label, handler, enabled in [
+                ('Copy', lambda e: self.Copy(), self.GetSelectionStart() != self.GetSelectionEnd()),
+                ('Select All', lambda e: self.SelectAll(), True),
+                ('Load Older Output', lambda e: self.load_older(), self._spilled.size > 0)]:
+            item = menu.Append(wx.ID_ANY, label)
+            item.Enable(enabled)
+            self.Bind(wx.EVT_MENU, handler, item)
+        self.PopupMenu(menu)
+        menu.Destroy()
 
     def update_scroll_width(self, string):
         if isinstance(string, bytes):
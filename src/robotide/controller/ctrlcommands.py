@@ -21,8 +21,8 @@ from . import settingcontrollers
 from . import validators
 from ..namespace.embeddedargs import EmbeddedArgsHandler
 from ..namespace import namespace
-from ..publish.messages import (RideSelectResource, RideFileNameChanged, RideSaving, RideSaved, RideSaveAll,
-                                RideExcludesChanged)
+from ..publish.messages import (RideSelectResource, RideFileNameChanged, RideSaving, RideSaved, RideSavedBatch,
+                                RideSaveAll, RideExcludesChanged)
 from ..utils import variablematcher
 
 
@@ -1073,23 +1073,43 @@ class SaveFile(_Command):
         RideSaving(path=context.filename, datafile=context).publish()
         datafile_controller = context.datafile_controller
         if self._reformat:
-            for macro_controller in chain(datafile_controller.tests, datafile_controller.keywords):
-                macro_controller.execute(Purify())
+            _purify(datafile_controller)
         datafile_controller.save()
         datafile_controller.unmark_dirty()
         RideSaved(path=context.filename).publish()
 
 
 class SaveAll(_Command):
+    """Saves all dirty data files in parallel.
+
+    Instead of a `RideSaved` message per file, a single `RideSavedBatch`
+    is sent after all the files have been written.
+    """
 
     def __init__(self, reformat=False):
         self._reformat = reformat
 
     def execute(self, context):
-        for datafile_controller in context._get_all_dirty_controllers():
-            if datafile_controller.has_format():
-                datafile_controller.execute(SaveFile(self._reformat))
+        controllers = [datafile_controller for datafile_controller in context._get_all_dirty_controllers()
+                       if datafile_controller.has_format()]
+        for datafile_controller in controllers:
+            RideSaving(path=datafile_controller.filename, datafile=datafile_controller).publish()
+            if self._reformat:
+                _purify(datafile_controller)
+        saved = context.save_all(controllers)
+        for datafile_controller in saved:
+            datafile_controller.unmark_dirty()
+        if saved:
+            paths = [datafile_controller.filename for datafile_controller in saved]
+            RideSavedBatch(path=paths[0] if len(paths) == 1 else '%d files' % len(paths),
+                           paths=paths).publish()
         RideSaveAll().publish()
+        return saved
+
+
+def _purify(datafile_controller):
+    for macro_controller in chain(datafile_controller.tests, datafile_controller.keywords):
+        macro_controller.execute(Purify())
 
 
 class Purify(_Command):
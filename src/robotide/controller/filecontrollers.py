@@ -805,6 +805,7 @@ class ResourceFileControllerFactory(object):
 
     def __init__(self, namespace, project):
         self._resources = []
+        self._resources_by_source = {}
         self._namespace = namespace
         self._project = project
         self._all_resource_imports_resolved = False
@@ -817,8 +818,12 @@ class ResourceFileControllerFactory(object):
         return self._find_with_source(data.source)
 
     def _find_with_source(self, source):
+        other = self._resources_by_source.get(source)
+        if other is not None and other.filename == source:
+            return other
         for other in self.resources:
             if other.filename == source:
+                self._resources_by_source[source] = other
                 return other
         return None
 
@@ -850,6 +855,8 @@ class ResourceFileControllerFactory(object):
 
     def remove(self, controller):
         self._resources.remove(controller)
+        self._resources_by_source = dict((source, other) for source, other in self._resources_by_source.items()
+                                         if other is not controller)
         self.set_all_resource_imports_unresolved()
 
 
@@ -958,9 +965,12 @@ class ResourceFileController(_FileSystemElement, _DataController):
             return True
         if not self._resource_file_controller_factory:
             return False
-        if self._resource_file_controller_factory.is_all_resource_file_imports_resolved():
-            return False
-        return any(self._resolve_known_imports())
+        if not self._resource_file_controller_factory.is_all_resource_file_imports_resolved():
+            # Resolving all the imports at once links every imported resource
+            # to its imports, so that later calls need no scanning
+            for _ in self._resolve_known_imports():
+                pass
+        return bool(self._known_imports)
 
     def get_where_used(self):
         if self._resource_file_controller_factory.is_all_resource_file_imports_resolved():
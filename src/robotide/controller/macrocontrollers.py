@@ -82,6 +82,10 @@ class WithStepsController(ControllerWithParent, WithUndoRedoStacks):
         self._init(data)
         self._has_steps_changed = True
         self._steps_cached = None
+        self._cell_infos = {}
+        self._cell_info_generation = None
+        self._row_keys = None
+        self._keyed_steps = None
         self.datafile_controller.register_for_namespace_updates(
             self.clear_cached_steps)
 
@@ -119,6 +123,25 @@ class WithStepsController(ControllerWithParent, WithUndoRedoStacks):
         self._has_steps_changed = True
         self._steps_cached = None
 
+    def replace_content(self, data):
+        """Replaces the name, settings and steps with those of `data`.
+
+        The underlying item is kept, so that this controller stays valid.
+        """
+        old_name = self.data.name
+        parent = self.data.parent
+        self.data.__dict__.update(vars(data))
+        self.data.parent = parent
+        for setting in self.data.settings:
+            setting.parent = self.data
+        for step in self.data.steps:
+            if hasattr(step, 'parent'):
+                step.parent = self.data
+        if self.data.name != old_name:
+            self.notify_name_changed(old_name)
+        self.notify_settings_changed()
+        self.notify_steps_changed()
+
     @property
     def max_columns(self):
         return max(chain((len(step) for step in self.steps), [0]))
@@ -167,7 +190,38 @@ class WithStepsController(ControllerWithParent, WithUndoRedoStacks):
         steps = self.steps
         if row < 0 or len(steps) <= row:
             return None
-        return steps[row].get_cell_info(col)
+        cell_infos = self._cached_cell_infos(steps, row)
+        if col not in cell_infos:
+            cell_infos[col] = steps[row].get_cell_info(col)
+        return cell_infos[col]
+
+    def _cached_cell_infos(self, steps, row):
+        """Returns the cached cell infos of a row, by column.
+
+        Cell infos depend also on the rows before, for example on the
+        variables they assign, so they are cached by the content of the row
+        and all the rows before it. The cache is emptied when the namespace
+        is updated.
+        """
+        namespace = self.datafile_controller.namespace
+        generation = (namespace.generation if namespace else None, self.has_template())
+        if generation != self._cell_info_generation:
+            self._cell_infos = {}
+            self._cell_info_generation = generation
+        if steps is not self._keyed_steps or self._row_keys[row][0] != steps[row].as_list():
+            self._key_rows(steps)
+        return self._cell_infos.setdefault(self._row_keys[row][1], {})
+
+    def _key_rows(self, steps):
+        key = None
+        self._row_keys = []
+        for step in steps:
+            content = step.as_list()
+            key = hash((key, tuple(content)))
+            self._row_keys.append((content, key))
+        self._keyed_steps = steps
+        keys = set(key for _, key in self._row_keys)
+        self._cell_infos = dict((key, infos) for key, infos in self._cell_infos.items() if key in keys)
 
     def get_keyword_info(self, kw_name):
         return self.datafile_controller.keyword_info(None, kw_name)
@@ -460,6 +514,10 @@ class UserKeywordController(WithStepsController):
         ]
         return result
 
+    def replace_content(self, data):
+        self._teardown = self._TEARDOWN_NOT_SET
+        WithStepsController.replace_content(self, data)
+
     @property
     def teardown(self):
         if self._teardown == self._TEARDOWN_NOT_SET:
@@ -16,13 +16,19 @@
 import os
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from .basecontroller import WithNamespace, _BaseController
 from .dataloader import DataLoader
 from .robotdata import new_test_case_file, new_test_data_directory
 from ..context import LOG
+from ..lib.robot.utils import file_writer
 from ..controller.ctrlcommands import NullObserver, SaveFile
-from ..publish.messages import RideOpenSuite, RideNewProject, RideFileNameChanged
+from ..publish import PUBLISHER
+from ..publish.messages import (RideOpenSuite, RideNewProject, RideFileNameChanged, RideDataFileSet,
+                                RideDataFileRemoved, RideSuiteAdded, RideInitFileRemoved,
+                                RideTestCaseAdded, RideTestCaseRemoved, RideItemNameChanged)
 from .. import spec
 from ..spec.xmlreaders import SpecInitializer
 
@@ -31,6 +37,7 @@ class Project(_BaseController, WithNamespace):
 
     def __init__(self, namespace=None, settings=None, library_manager=None):
         from .filecontrollers import ResourceFileControllerFactory
+        from .tagindex import TagIndex
         self._library_manager = self._construct_library_manager(library_manager, settings)
         if not self._library_manager.is_alive():
             self._library_manager.start()
@@ -38,11 +45,17 @@ class Project(_BaseController, WithNamespace):
         self._set_namespace(self._name_space)
         self.internal_settings = settings
         self._loader = DataLoader(self._name_space, settings)
+        self._tests_by_longname = None
         self.controller = None
         self.name = None
         self.external_resources = []
         self._resource_file_controller_factory = ResourceFileControllerFactory(self._name_space, self)
         self._serializer = Serializer(settings, LOG)
+        self._tag_index = TagIndex(self)
+        for topic in (RideOpenSuite, RideNewProject, RideDataFileSet, RideDataFileRemoved,
+                      RideSuiteAdded, RideInitFileRemoved, RideTestCaseAdded,
+                      RideTestCaseRemoved, RideItemNameChanged, RideFileNameChanged):
+            PUBLISHER.subscribe(self._clear_longname_cache, topic)
 
     @staticmethod
     def _construct_library_manager(library_manager, settings):
@@ -96,8 +109,41 @@ class Project(_BaseController, WithNamespace):
     def resource_file_controller_factory(self):
         return self._resource_file_controller_factory
 
+    @property
+    def controller(self):
+        return self._controller
+
+    @controller.setter
+    def controller(self, controller):
+        self._controller = controller
+        self._tests_by_longname = None
+
+    def _clear_longname_cache(self, message):
+        _ = message
+        self._tests_by_longname = None
+
     def find_controller_by_longname(self, longname, testname=None):
-        return self.controller.find_controller_by_longname(longname, testname)
+        """Finds a test by its long name.
+
+        Test runner results are mapped to tests for every test event, so the
+        lookup uses a long name to test map that is built lazily and dropped
+        whenever the suite structure or test names change. The tree walk is
+        used as a fallback, e.g. for names that differ only in case.
+        """
+        if self._tests_by_longname is None:
+            self._tests_by_longname = self._build_longname_map()
+        ctrl = self._tests_by_longname.get(longname)
+        if ctrl is not None and (testname is None or ctrl.name == testname):
+            return ctrl
+        ctrl = self.controller.find_controller_by_longname(longname, testname)
+        if ctrl is not None:
+            self._tests_by_longname[longname] = ctrl
+        return ctrl
+
+    def _build_longname_map(self):
+        if not self.controller:
+            return {}
+        return dict((test.longname, test) for test in self.all_testcases())
 
     def new_directory_project(self, path):
         self._new_project(new_test_data_directory(path))
@@ -240,6 +286,10 @@ class Project(_BaseController, WithNamespace):
             for test in df.tests:
                 yield test
 
+    @property
+    def tag_index(self):
+        return self._tag_index
+
     def get_files_without_format(self, controller=None):
         if controller:
             controller_list = [controller]
@@ -298,6 +348,11 @@ class Project(_BaseController, WithNamespace):
         assert controller is not None
         self._serializer.serialize_file(controller)
 
+    def save_all(self, controllers):
+        """Saves the given data file controllers in parallel and returns
+        the ones that were saved successfully."""
+        return self._serializer.serialize_files(controllers)
+
     def _get_all_dirty_controllers(self):
         return [controller for controller in self.datafiles if controller.dirty]
 
@@ -348,6 +403,33 @@ class Serializer(object):
                 self._cache_error(controller, err)
                 raise
 
+    def serialize_files(self, controllers):
+        """Writes `controllers` in a thread pool and returns the ones written.
+
+        Every file is first written to a temporary file in the same directory,
+        which then atomically replaces the original. A file that can not be
+        written is left untouched, and the errors are logged once all the
+        files have been handled.
+        """
+        options = self._get_options()
+        try:
+            with ThreadPoolExecutor() as executor:
+                written = list(executor.map(lambda c: self._write_atomically(c, options),
+                                            controllers))
+        finally:
+            self._log_errors()
+        return [controller for controller, ok in zip(controllers, written) if ok]
+
+    def _write_atomically(self, controller, options):
+        output = file_writer(newline=options['line_separator'])
+        try:
+            controller.datafile.save(output=output, **options)
+            _replace_file(controller.filename, output.getvalue().encode('UTF-8'))
+        except Exception as err:
+            self._cache_error(controller, err)
+            return False
+        return True
+
     def _get_options(self):
         return {'line_separator': self._get_line_separator(),
                 'pipe_separated': self._get_pipe_separated(),
@@ -377,6 +459,22 @@ class Serializer(object):
             self._errors = []
 
 
+def _replace_file(path, content):
+    temp_path = os.path.join(os.path.dirname(path), '.%s.%d-%d.tmp' % (
+        os.path.basename(path), os.getpid(), threading.get_ident()))
+    # Created like a normal file so that new files get permissions from umask.
+    handle = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(handle, 'wb') as temp:
+            temp.write(content)
+        if os.path.isfile(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
 class Backup(object):
 
     def __init__(self, file_controller):
@@ -26,6 +26,8 @@ class StepController(_BaseController):
 
     _GIVEN_WHEN_THEN_MATCHER = re.compile(r'^(given|when|then|and|but)\s*', re.I)
     indent = None
+    _keyword_lookups = None
+    _keyword_lookup_state = None
 
     def __init__(self, parent, step):
         self.continuing_kw = None
@@ -68,7 +70,31 @@ class StepController(_BaseController):
     def get_keyword_info(self, kw):
         if not kw:
             return None
-        return self.parent.get_keyword_info(kw)
+        return self._cached_lookup('info', kw, self.parent.get_keyword_info)
+
+    def _cached_lookup(self, kind, value, lookup):
+        """Returns the result of a keyword lookup done for this step.
+
+        Resolving the cell info of one column looks up the keywords of the
+        cells before it, so the same lookups are repeated for every column.
+        The results are kept until the cells of the step change or the
+        namespace is updated.
+        """
+        state = self._lookup_state()
+        if state != self._keyword_lookup_state:
+            self._keyword_lookups = {}
+            self._keyword_lookup_state = state
+        key = (kind, value)
+        if key not in self._keyword_lookups:
+            self._keyword_lookups[key] = lookup(value)
+        return self._keyword_lookups[key]
+
+    def _lookup_state(self):
+        try:
+            generation = self.datafile_controller.namespace.generation
+        except AttributeError:
+            generation = None
+        return self.as_list(), generation
 
     def __eq__(self, other):
         if self is other:
@@ -260,10 +286,10 @@ class StepController(_BaseController):
         return self.datafile_controller.is_modifiable()
 
     def is_user_keyword(self, value):
-        return self.parent.is_user_keyword(value)
+        return self._cached_lookup('user', value, self.parent.is_user_keyword)
 
     def is_library_keyword(self, value):
-        return self.parent.is_library_keyword(value)
+        return self._cached_lookup('library', value, self.parent.is_library_keyword)
 
     def as_list(self):
         # print(f"\nDEBUG: Stepcontrollers enter as_list")
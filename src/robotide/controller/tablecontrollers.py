@@ -295,13 +295,16 @@ class _MacroTable(_TableController):
         self._notify_removal(ctrl)
 
     def add(self, ctrl):
-        item = ctrl.data
+        self.add_item(ctrl.data)
+
+    def add_item(self, item):
         item.parent = self._table
         self.items.append(item)
         new_controller = self._create_controller(item)
         self.datafile_controller.update_namespace()
         self.mark_dirty()
         self._notify_creation(new_controller.name, new_controller)
+        return new_controller
 
     def _create_new(self, name, config=None):
         name = name.strip()
@@ -0,0 +1,261 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from .. import robotapi, utils
+from ..lib.robot.model.tags import (AndTagPattern, NotTagPattern, OrTagPattern,
+                                    SingleTagPattern)
+from ..publish import (PUBLISHER, RideDataFileRemoved, RideDataFileSet, RideInitFileRemoved,
+                       RideItemSettingsChanged, RideNewProject, RideOpenSuite, RideSuiteAdded,
+                       RideTestCaseAdded, RideTestCaseRemoved)
+from .macrocontrollers import TestCaseController, UserKeywordController
+
+
+class TagIndex(object):
+    """Index of the tags of all the tests in a project.
+
+    Every test gets a numeric id and every tag maps to a bitset (a Python
+    integer) having the bits of its tests set. Tag pattern searches are
+    evaluated as set operations over these bitsets instead of matching the
+    patterns against the tags of every test.
+
+    Changes to single tests are applied incrementally. Structural changes
+    mark the index stale and it is rebuilt lazily on the next query.
+    """
+
+    def __init__(self, project):
+        self._project = project
+        self._stale = True
+        self._clear()
+        for listener, topic in [(self._test_added, RideTestCaseAdded),
+                                (self._test_removed, RideTestCaseRemoved),
+                                (self._settings_changed, RideItemSettingsChanged),
+                                (self._structure_changed, RideOpenSuite),
+                                (self._structure_changed, RideNewProject),
+                                (self._structure_changed, RideDataFileSet),
+                                (self._structure_changed, RideDataFileRemoved),
+                                (self._structure_changed, RideSuiteAdded),
+                                (self._structure_changed, RideInitFileRemoved)]:
+            PUBLISHER.subscribe(listener, topic)
+
+    def _clear(self):
+        self._tests = []
+        self._ids = {}
+        self._free_ids = []
+        self._test_tags = {}
+        self._tag_bits = {}
+        self._tag_names = {}
+        self._match_bits = {}
+        self._universe = 0
+
+    def mark_stale(self):
+        self._stale = True
+
+    def _structure_changed(self, message):
+        _ = message
+        self.mark_stale()
+
+    def _test_added(self, message):
+        if not self._stale:
+            self._add(message.item)
+
+    def _test_removed(self, message):
+        if not self._stale:
+            self._remove(message.item)
+
+    def _settings_changed(self, message):
+        if self._stale or isinstance(message.item, UserKeywordController):
+            return
+        if isinstance(message.item, TestCaseController):
+            self._remove(message.item)
+            self._add(message.item)
+        else:
+            # Force Tags, Default Tags or Test Tags of a suite changed
+            self.mark_stale()
+
+    def _ensure_built(self):
+        if not self._stale:
+            return
+        self._clear()
+        if self._project.data:
+            for test in self._project.all_testcases():
+                self._add(test)
+        self._stale = False
+
+    def _add(self, test):
+        if test in self._ids:
+            return
+        test_id = self._free_ids.pop() if self._free_ids else len(self._tests)
+        if test_id == len(self._tests):
+            self._tests.append(test)
+        else:
+            self._tests[test_id] = test
+        self._ids[test] = test_id
+        bit = 1 << test_id
+        self._universe |= bit
+        tags = [tag for tag in test.tags
+                if not tag.is_empty() and str(tag).strip()]
+        self._test_tags[test_id] = tags
+        for tag in tags:
+            name = str(tag)
+            key = utils.normalize(name)
+            if key not in self._tag_bits:
+                self._tag_bits[key] = 0
+                self._tag_names[key] = name
+            self._tag_bits[key] |= bit
+            match_key = utils.normalize(name, ignore='_')
+            if match_key not in ('', 'none'):
+                self._match_bits[match_key] = \
+                    self._match_bits.get(match_key, 0) | bit
+
+    def _remove(self, test):
+        test_id = self._ids.pop(test, None)
+        if test_id is None:
+            return
+        bit = 1 << test_id
+        self._universe &= ~bit
+        for tag in self._test_tags.pop(test_id):
+            name = str(tag)
+            key = utils.normalize(name)
+            if self._discard_bit(self._tag_bits, key, bit):
+                self._tag_names.pop(key, None)
+            self._discard_bit(self._match_bits,
+                              utils.normalize(name, ignore='_'), bit)
+        self._tests[test_id] = None
+        self._free_ids.append(test_id)
+
+    @staticmethod
+    def _discard_bit(bits, key, bit):
+        if key not in bits:
+            return False
+        bits[key] &= ~bit
+        if bits[key]:
+            return False
+        del bits[key]
+        return True
+
+    @property
+    def universe(self):
+        self._ensure_built()
+        return self._universe
+
+    @property
+    def number_of_tests(self):
+        return bin(self.universe).count('1')
+
+    def tests_for(self, bits):
+        """Returns the tests whose ids are set in `bits`, in id order."""
+        return [self._tests[test_id] for test_id in self._ids_in(bits)]
+
+    def tag_names(self):
+        self._ensure_built()
+        return list(self._tag_names.values())
+
+    def tests_with_tag(self, name):
+        self._ensure_built()
+        return self.tests_for(self._tag_bits.get(utils.normalize(name), 0))
+
+    def tag_objects(self, name):
+        """Returns the `Tag` controllers of all the tests having tag `name`."""
+        self._ensure_built()
+        key = utils.normalize(name)
+        return [tag for test_id in self._ids_in(self._tag_bits.get(key, 0))
+                for tag in self._test_tags[test_id]
+                if utils.normalize(str(tag)) == key]
+
+    @staticmethod
+    def _ids_in(bits):
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def bits_for_exact(self, normalized_name):
+        self._ensure_built()
+        return self._match_bits.get(normalized_name, 0)
+
+    def bits_for_matcher(self, matcher):
+        self._ensure_built()
+        result = 0
+        for key, bits in self._match_bits.items():
+            if matcher.match(key):
+                result |= bits
+        return result
+
+    def search(self, includes, excludes):
+        """Returns tests matching `includes` and not matching `excludes`.
+
+        Both arguments are whitespace separated tag patterns as accepted by
+        Robot Framework's ``--include`` and ``--exclude`` options.
+        """
+        return CompiledTagPatterns(includes, excludes).search(self)
+
+
+class CompiledTagPatterns(object):
+    """Include and exclude tag patterns compiled to bitset operations."""
+
+    def __init__(self, includes, excludes):
+        self._includes = self._compile_all(includes.split()) \
+            if includes.split() else None
+        self._excludes = self._compile_all(excludes.split())
+
+    def _compile_all(self, patterns):
+        compiled = [self._compile(p) for p in robotapi.TagPatterns(patterns)]
+        return lambda index: self._or(compiled, index)
+
+    def _compile(self, pattern):
+        if isinstance(pattern, NotTagPattern):
+            first = self._compile(pattern._first) if pattern._first else None
+            rest = self._compile(pattern._rest)
+            return lambda index: ((first(index) if first else index.universe)
+                                  & ~rest(index))
+        if isinstance(pattern, OrTagPattern):
+            patterns = [self._compile(p) for p in pattern]
+            return lambda index: self._or(patterns, index)
+        if isinstance(pattern, AndTagPattern):
+            patterns = [self._compile(p) for p in pattern]
+            return lambda index: self._and(patterns, index)
+        if isinstance(pattern, SingleTagPattern):
+            return self._compile_single(pattern._matcher)
+        raise TypeError('Unsupported tag pattern %r' % pattern)
+
+    @staticmethod
+    def _compile_single(matcher):
+        if any(char in matcher.pattern for char in '*?['):
+            return lambda index: index.bits_for_matcher(matcher)
+        name = utils.normalize(matcher.pattern, ignore='_')
+        return lambda index: index.bits_for_exact(name)
+
+    @staticmethod
+    def _or(patterns, index):
+        result = 0
+        for pattern in patterns:
+            result |= pattern(index)
+        return result
+
+    @staticmethod
+    def _and(patterns, index):
+        result = index.universe
+        for pattern in patterns:
+            result &= pattern(index)
+            if not result:
+                break
+        return result
+
+    def bits(self, index):
+        included = self._includes(index) if self._includes else index.universe
+        return included & ~self._excludes(index) & index.universe
+
+    def search(self, index):
+        return index.tests_for(self.bits(index))
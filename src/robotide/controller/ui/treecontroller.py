@@ -39,6 +39,10 @@ class TreeController(object):
         self.settings = settings
         self._history = history or _History()
         self._test_selection = test_selection
+        self._nodes_by_controller = {}
+        self._nodes_by_datafile = {}
+        self._nodes_by_label = {}
+        self._label_keys = {}
 
     def register_tree_actions(self):
         actions = action_info_collection(tree_actions, self, self._tree)
@@ -90,14 +94,83 @@ class TreeController(object):
         if not text.startswith('*'):
             self._tree.SetItemText(node, '*' + text)
 
+    def register_node(self, node, controller):
+        """Adds a node to the maps used for finding nodes.
+
+        Nodes are found by their controller and by their parent and label.
+        The tree must call `register_datafile_node` for data file nodes,
+        `label_changed` whenever a label changes and `unregister_node` when
+        a node is deleted.
+        """
+        self._nodes_by_controller[id(controller)] = (controller, node)
+        self.label_changed(node)
+
+    def register_datafile_node(self, node, controller):
+        self._nodes_by_datafile[id(controller.data)] = (controller.data, node)
+
+    def label_changed(self, node):
+        self._remove_label_key(node)
+        parent = self._tree.GetItemParent(node)
+        if not parent:
+            return
+        key = (id(parent), utils.normalize(self._tree.GetItemText(node)))
+        # With equal labels, the node created first is found
+        self._nodes_by_label.setdefault(key, node)
+        self._label_keys[id(node)] = key
+
+    def _remove_label_key(self, node):
+        key = self._label_keys.pop(id(node), None)
+        if key and self._nodes_by_label.get(key) is node:
+            del self._nodes_by_label[key]
+
+    def unregister_node(self, node):
+        self._remove_label_key(node)
+        handler = self._tree.GetItemData(node)
+        if not handler:
+            return
+        for nodes, key in [(self._nodes_by_controller, id(handler.controller)),
+                           (self._nodes_by_datafile, id(handler.item))]:
+            entry = nodes.get(key)
+            if entry and entry[1] is node:
+                del nodes[key]
+
     def find_node_by_controller(self, controller):
-        def match_handler(n):
-            handler = self.get_handler(n)
-            return handler and controller is handler.controller
-        return self._find_node_with_predicate(self._tree.root, match_handler)
+        entry = self._nodes_by_controller.get(id(controller))
+        if entry and entry[0] is controller:
+            handler = self.get_handler(entry[1])
+            if handler and controller is handler.controller:
+                return entry[1]
+        return None
+
+    def find_datafile_node(self, datafile):
+        entry = self._nodes_by_datafile.get(id(datafile))
+        if entry and entry[0] is datafile:
+            return entry[1]
+        return None
+
+    def is_datafile_node(self, node):
+        handler = node and self.get_handler(node)
+        if not handler:
+            return False
+        entry = self._nodes_by_datafile.get(id(handler.item))
+        return bool(entry) and entry[1] is node
 
     def find_node_with_label(self, node, label):
+        """Returns `node` or the node under it that has `label`.
+
+        `node` itself is checked first, then its direct children and only
+        after them the deeper nodes in depth-first order. So a direct child
+        is found even if a deeper node before it has the same label. Of
+        direct children with equal labels, the one created first is found.
+        """
         def matcher(n): return utils.eq(self._tree.GetItemText(n), label)
+        if node != self._tree.root and matcher(node):
+            return node
+        candidate = self._nodes_by_label.get((id(node), utils.normalize(label)))
+        if candidate and self._tree.GetItemParent(candidate) is node \
+                and utils.eq(self._tree.GetItemText(candidate), label):
+            return candidate
+        # Labels of nodes deeper in the tree are searched by walking the tree
         return self._find_node_with_predicate(node, matcher)
 
     def _find_node_with_predicate(self, node, predicate):
@@ -18,7 +18,7 @@ import wx
 from .editorcreator import EditorCreator
 from ..pluginapi import (Plugin, action_info_collection, TreeAwarePluginMixin)
 from ..publish import (RideTreeSelection, RideNotebookTabChanging, RideNotebookTabChanged, RideSaving)
-from ..publish.messages import RideDataFileRemoved
+from ..publish.messages import RideDataFileRemoved, RideExecutionTimesLoaded
 from ..widgets import PopupCreator
 
 _EDIT = """
@@ -60,6 +60,7 @@ class EditorPlugin(Plugin, TreeAwarePluginMixin):
         self.grid_popup_creator = PopupCreator()
         self._creator = EditorCreator(self.register_editor)
         self._editor = None
+        self.execution_times = None
 
     def enable(self):
         self._creator.register_editors()
@@ -70,6 +71,7 @@ class EditorPlugin(Plugin, TreeAwarePluginMixin):
         self.subscribe(self.on_tab_changing, RideNotebookTabChanging)
         self.subscribe(self.on_save_to_model, RideSaving)
         self.subscribe(self.on_file_deleted, RideDataFileRemoved)
+        self.subscribe(self.on_execution_times_loaded, RideExecutionTimesLoaded)
         self.add_self_as_tree_aware_plugin()
 
     def disable(self):
@@ -155,6 +157,10 @@ class EditorPlugin(Plugin, TreeAwarePluginMixin):
         _ = message
         self._create_editor()
 
+    def on_execution_times_loaded(self, message):
+        """Keeps keyword times of the latest run for grid tooltips"""
+        self.execution_times = message.times
+
 
 class _EditorTab(wx.Panel):
 
@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from bisect import bisect_left
+from collections import Counter
+
 import wx
 from wx import Colour
 from wx.lib.expando import ExpandoTextCtrl
@@ -30,6 +33,7 @@ from ..publish.messages import RideSettingsChanged
 
 _PREFERRED_POPUP_SIZE = (400, 200)
 _AUTO_SUGGESTION_CFG_KEY = "enable auto suggestions"
+_SUGGESTION_DELAY = 50  # milliseconds
 
 
 class _ContentAssistTextCtrlBase(wx.TextCtrl):
@@ -55,6 +59,7 @@ class _ContentAssistTextCtrlBase(wx.TextCtrl):
         self.Bind(wx.EVT_WINDOW_DESTROY, self.pop_event_handlers)
         self._row = None
         self._selection = None
+        self._suggestion_timer = None
         self.gherkin_prefix = ''
         # Store gherkin prefix from input to add \
         # later after search is performed
@@ -77,6 +82,7 @@ class _ContentAssistTextCtrlBase(wx.TextCtrl):
 
     def set_row(self, row):
         self._row = row
+        self._popup.clear_suggestions()
 
     def is_shown(self):
         return self._popup.is_shown()
@@ -116,9 +122,8 @@ class _ContentAssistTextCtrlBase(wx.TextCtrl):
         elif key_code == ord('4') and control_down and event.ShiftDown() and not alt_down:
             self.execute_sharp_uncomment()
         elif self._popup.is_shown() and key_code < 256:
-            wx.CallAfter(self._populate_content_assist)
+            self._update_content_assist_later()
             event.Skip()
-            wx.CallAfter(self._show_auto_suggestions_when_enabled)
         # Can not catch the following keyEvent from grid cell
         elif key_code == wx.WXK_RETURN:
             # fill suggestion in dialogs when pressing enter
@@ -136,10 +141,25 @@ class _ContentAssistTextCtrlBase(wx.TextCtrl):
         if self._is_auto_suggestion_enabled or self.is_shown():
             self.show_content_assist()
 
+    def _update_content_assist_later(self):
+        # Suggestions are updated only after typing pauses, so that fast
+        # typing does not look up suggestions for every key
+        if self._suggestion_timer is None:
+            self._suggestion_timer = wx.CallLater(_SUGGESTION_DELAY, self._update_content_assist)
+        else:
+            self._suggestion_timer.Restart(_SUGGESTION_DELAY)
+
+    def _update_content_assist(self):
+        if not self:
+            return
+        if self._popup.is_shown():
+            self._populate_content_assist()
+        self._show_auto_suggestions_when_enabled()
+
     def on_char(self, event):
         key_char = event.GetUnicodeKey()
         if key_char != wx.WXK_RETURN:
-            self._show_auto_suggestions_when_enabled()
+            self._update_content_assist_later()
         if key_char == wx.WXK_NONE:
             event.Skip()
             return
@@ -278,6 +298,8 @@ class _ContentAssistTextCtrlBase(wx.TextCtrl):
 
     def pop_event_handlers(self, event):
         _ = event
+        if self._suggestion_timer is not None:
+            self._suggestion_timer.Stop()
         # all pushed eventHandlers need to be popped before close
         # the last event handler is window object itself - do not pop itself
         if self:
@@ -441,15 +463,26 @@ class ContentAssistFileButton(FileBrowseButton):
 
 
 class Suggestions(object):
+    """Looks up and formats the suggestions of content assist.
+
+    Suggestions are looked up from the suggestion source only for values
+    none of whose beginnings has been looked up before for the same row and
+    namespace generation. Otherwise they are filtered from the suggestions
+    looked up for the longest such beginning, so that both typing more and
+    deleting characters are served from the cache.
+    """
 
     def __init__(self, suggestion_source):
         self._suggestion_source = suggestion_source
-        self._previous_value = None
+        self._cache_key = None
+        self._indexes = {}
         self._previous_choices = []
 
+    def clear(self):
+        self._indexes = {}
+
     def get_for(self, value, row=None):
         self._previous_choices = self._get_choices(value, row)
-        self._previous_value = value
         return [k for k, _ in self._previous_choices]
 
     def get_item(self, name):
@@ -459,41 +492,52 @@ class Suggestions(object):
         raise AttributeError('Item not in choices "%s"' % name)
 
     def _get_choices(self, value, row):
-        if self._previous_value and value.startswith(self._previous_value):
-            return [(key, val) for key, val in self._previous_choices
-                    if utils.normalize(key).startswith(utils.normalize(value))]
+        cache_key = (getattr(self._suggestion_source, 'generation', None), row)
+        if cache_key != self._cache_key:
+            self._indexes = {}
+            self._cache_key = cache_key
+        if value in self._indexes:
+            return self._indexes[value].choices
+        # Suggestions of an empty value are not filtered, because they are
+        # not all prefixed with the value typed after
+        for end in range(len(value) - 1, 0, -1):
+            if value[:end] in self._indexes:
+                return self._indexes[value[:end]].starting_with(value)
         choices = self._suggestion_source.get_suggestions(value, row)
-        duplicate_names = self._get_duplicate_names(choices)
-        return self._format_choices(choices, value, duplicate_names)
+        self._indexes[value] = _SuggestionIndex(choices, value)
+        return self._indexes[value].choices
 
-    @staticmethod
-    def _get_duplicate_names(choices):
-        results = set()
-        normalized_names = [utils.normalize(ch.name) for ch in choices]
-        for choice in choices:
-            normalized = utils.normalize(choice.name)
-            if normalized_names.count(normalized) > 1:
-                results.add(normalized)
-        return results
-
-    def _format_choices(self, choices, prefix, duplicate_names):
-        return [(self._format(val, prefix, duplicate_names), val) for val in
-                choices]
-
-    def _format(self, choice, prefix, duplicate_names):
-        return choice.name if self._matches_unique_shortname(
-            choice, prefix, duplicate_names) else choice.longname
+
+class _SuggestionIndex(object):
+    """Suggestions looked up for one value, formatted and sorted by their
+    normalized labels for finding the ones starting with a longer value."""
+
+    def __init__(self, choices, prefix):
+        names = [utils.normalize(choice.name) for choice in choices]
+        counts = Counter(names)
+        prefix = utils.normalize(prefix)
+        self.choices = [(self._format(choice, name, prefix, counts), choice)
+                        for choice, name in zip(choices, names)]
+        self._keys = sorted((utils.normalize(label), position)
+                            for position, (label, _) in enumerate(self.choices))
 
     @staticmethod
-    def _matches_unique_shortname(choice, prefix, duplicate_names):
+    def _format(choice, name, prefix, counts):
         if isinstance(choice, VariableInfo):
-            return True
-        if not utils.normalize(choice.name).startswith(
-                utils.normalize(prefix)):
-            return False
-        if utils.normalize(choice.name) in duplicate_names:
-            return False
-        return True
+            return choice.name
+        if name.startswith(prefix) and counts[name] == 1:
+            return choice.name
+        return choice.longname
+
+    def starting_with(self, value):
+        prefix = utils.normalize(value)
+        positions = []
+        for index in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+            key, position = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            positions.append(position)
+        return [self.choices[position] for position in sorted(positions)]
 
 
 class ContentAssistPopup(object):
@@ -512,6 +556,9 @@ class ContentAssistPopup(object):
     def reset(self):
         self._selection = -1
 
+    def clear_suggestions(self):
+        self._suggestions.clear()
+
     def get_value(self):
         return self._selection != -1 and self._list.get_text(
             self._selection) or None
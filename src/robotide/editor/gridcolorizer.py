@@ -26,6 +26,14 @@ from ..controller.cellinfo import CellType
 
 
 class Colorizer(object):
+    """Colors the cells of a grid by their content.
+
+    The visible rows, with a margin around them, are colored first. The
+    rest of the rows are colored in the background a chunk at a time, so
+    that the editor stays responsive also with long tests and keywords.
+    """
+    VISIBLE_MARGIN = 10
+    CHUNK_SIZE = 20
 
     def __init__(self, grid, controller):
         self._grid = grid
@@ -44,16 +52,40 @@ class Colorizer(object):
         else:
             self._timer.Restart(50, self._current_task_id, selection_content)
 
-    def _coloring_task(self, task_index, selection_content, row=0, col=0):
+    def _coloring_task(self, task_index, selection_content):
         if task_index != self._current_task_id or self._grid is None:
             return
-        if row >= self._grid.NumberRows:
-            self._grid.ForceRefresh()
-        elif col < self._grid.NumberCols:
-            self._colorize_cell(row, col, selection_content)
-            wx.CallAfter(self._coloring_task, task_index, selection_content, row, col+1)
+        first, last = self._visible_rows()
+        first = max(first - self.VISIBLE_MARGIN, 0)
+        last = min(last + self.VISIBLE_MARGIN, self._grid.NumberRows - 1)
+        self._colorize_rows(range(first, last + 1), selection_content)
+        self._grid.ForceRefresh()
+        remaining = list(range(last + 1, self._grid.NumberRows)) + list(range(first))
+        wx.CallAfter(self._prefetch_task, task_index, selection_content, remaining)
+
+    def _prefetch_task(self, task_index, selection_content, rows):
+        if task_index != self._current_task_id or self._grid is None:
+            return
+        rows = [row for row in rows if row < self._grid.NumberRows]
+        self._colorize_rows(rows[:self.CHUNK_SIZE], selection_content)
+        if rows[self.CHUNK_SIZE:]:
+            wx.CallAfter(self._prefetch_task, task_index, selection_content, rows[self.CHUNK_SIZE:])
         else:
-            self._coloring_task(task_index, selection_content, row+1, 0)
+            self._grid.ForceRefresh()
+
+    def _visible_rows(self):
+        _, top = self._grid.CalcUnscrolledPosition(0, 0)
+        height = self._grid.GetClientSize().height
+        last_row = self._grid.NumberRows - 1
+        first = self._grid.YToRow(top)
+        last = self._grid.YToRow(top + height)
+        return (first if first >= 0 else 0,
+                last if last >= 0 else last_row)
+
+    def _colorize_rows(self, rows, selection_content):
+        for row in rows:
+            for col in range(self._grid.NumberCols):
+                self._colorize_cell(row, col, selection_content)
 
     def _colorize_cell(self, row, col, selection_content):
         cell_info = self._controller.get_cell_info(row, col)
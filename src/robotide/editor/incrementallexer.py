@@ -0,0 +1,89 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+
+try:  # import installed version first
+    from pygments.lexers import robotframework as robotframeworklexer
+except ImportError:
+    robotframeworklexer = None
+
+
+class IncrementalLexer(object):
+    """Styles Robot Framework data line by line with the Pygments lexer.
+
+    The Pygments lexer only works on whole documents, but its state between
+    rows is kept in a row tokenizer. A copy of that state is saved at table
+    headings and at every `CHECKPOINT_INTERVAL` lines, so that after an edit
+    only the lines starting from the closest saved state before the edited
+    line need to be tokenized again.
+
+    `styles` maps Pygments tokens to style numbers.
+    """
+    CHECKPOINT_INTERVAL = 64
+
+    def __init__(self, styles):
+        self._styles = styles
+        self._variables = robotframeworklexer.VariableTokenizer()
+        self._checkpoints = [(0, robotframeworklexer.RowTokenizer())]
+        self._rows = None
+        self._next_line = None
+
+    def restart(self, line):
+        """Prepares styling starting from `line` and returns the line where
+        styling actually has to start.
+
+        Lines after `line` may have changed, so the states saved after the
+        returned line are discarded.
+        """
+        if line == self._next_line:
+            return line
+        index = len(self._checkpoints) - 1
+        while self._checkpoints[index][0] > line:
+            index -= 1
+        del self._checkpoints[index + 1:]
+        start, rows = self._checkpoints[index]
+        self._rows = copy.deepcopy(rows)
+        self._next_line = start
+        return start
+
+    def style_line(self, text):
+        """Returns the styles of the next line as bytes, one for each byte
+        of `text` encoded to UTF-8.
+
+        `text` contains the line separator, if any.
+        """
+        line = self._next_line
+        if (line % self.CHECKPOINT_INTERVAL == 0 or text.startswith('*')) \
+                and line > self._checkpoints[-1][0]:
+            self._checkpoints.append((line, copy.deepcopy(self._rows)))
+        self._next_line += 1
+        row = text.rstrip('\r\n')
+        separator_size = len(text) - len(row)
+        # Byte and character lengths only differ on lines with non-ASCII text
+        size = len if len(text.encode('UTF-8')) == len(text) else _utf8_size
+        styles = []
+        for value, token in self._rows.tokenize(row):
+            if value == '\n':
+                styles.append(bytes((self._styles[token],)) * separator_size)
+                continue
+            for value, token in self._variables.tokenize(value, token):
+                if value:
+                    styles.append(bytes((self._styles[token],)) * size(value))
+        return b''.join(styles)
+
+
+def _utf8_size(text):
+    return len(text.encode('UTF-8'))
@@ -0,0 +1,218 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from difflib import SequenceMatcher
+from io import BytesIO
+
+from .. import robotapi
+from ..controller.ctrlcommands import UpdateVariable
+
+TESTS = 'test case'
+KEYWORDS = 'keyword'
+VARIABLES = 'variable'
+
+
+class IncrementalUpdater(object):
+    """Applies changes made in the Text Editor to the items of a data file.
+
+    The old and the new text are split into the rows of every table, as
+    the parser reads them, and the rows are grouped into tests, keywords
+    and variables. Only the items whose rows differ are taken from the
+    data file parsed from the new text, and the existing items are updated
+    in place, so that their controllers, the namespace and the tree nodes
+    stay valid.
+
+    Changes that can not be applied item by item, like changes in the
+    setting table, in the table structure or items added elsewhere than at
+    the end of a table, are not applied at all and `update` returns False.
+
+    `create_target` returns a new empty data file of the same type as the
+    edited one.
+    """
+
+    def __init__(self, controller, create_target, tab_size):
+        self._controller = controller
+        self._create_target = create_target
+        self._tab_size = tab_size
+
+    def update(self, old_content, target, new):
+        """Applies the changes and returns True, or returns False without
+        changing anything if they can not be applied.
+
+        `old_content` must be the text the current data was created from.
+        `target` is the data file parsed from the new text and `new` the
+        rows read while parsing it, as returned by `read_tables`.
+        """
+        old = read_tables(old_content, self._create_target(), self._tab_size, populate=False)
+        if old.preamble != new.preamble or old.headers != new.headers:
+            return False
+        types = [self._table_type(header) for header in new.headers]
+        if None in types or len(set(types)) != len(types):
+            return False
+        changes = []
+        for table_type, old_rows, new_rows in zip(types, old.rows, new.rows):
+            if old_rows == new_rows:
+                continue
+            if table_type not in (TESTS, KEYWORDS, VARIABLES):
+                return False
+            change = self._table_change(table_type, old_rows, new_rows, target)
+            if not change:
+                return False
+            changes.append(change)
+        for change in changes:
+            change.apply(self._controller)
+        if changes:
+            self._controller.update_namespace()
+        return True
+
+    def _table_type(self, header):
+        table = self._create_target().start_table(robotapi.DataRow(header).all)
+        return table.type if table is not None else None
+
+    def _table_change(self, table_type, old_rows, new_rows, target):
+        old_items = split_items(table_type, old_rows)
+        new_items = split_items(table_type, new_rows)
+        parsed_items = _model_items(target, table_type)
+        if len(old_items) != len(_model_items(self._controller.data, table_type)) \
+                or len(new_items) != len(parsed_items):
+            return None
+        change = _TableChange(table_type)
+        matcher = SequenceMatcher(None, [_key(item) for item in old_items],
+                                  [_key(item) for item in new_items], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            if j2 - j1 > i2 - i1 and i2 < len(old_items):
+                return None
+            changed = min(i2 - i1, j2 - j1)
+            change.replaced.extend(range(i1, i1 + changed))
+            change.deleted.extend(range(i1 + changed, i2))
+            change.items.extend(parsed_items[j1:j2])
+        return change
+
+
+def read_tables(content, target, tab_size, populate=True):
+    """Reads `content` to `target` data file and returns the rows of its
+    tables.
+
+    With `populate` false only the tables of `target` are started, and
+    the rows are not parsed.
+    """
+    tables = _TableRows(robotapi.FromFilePopulator(target, tab_size), populate)
+    robotapi.RobotReader(spaces=tab_size).read(BytesIO(content.encode('UTF-8')), tables)
+    return tables
+
+
+class _TableRows(object):
+    """Populator collecting the rows of every table read by `RobotReader`.
+
+    Reading is delegated to `populator`, so that the rows are grouped to
+    the same tables as in the parsed data file.
+    """
+
+    def __init__(self, populator, populate):
+        self._populator = populator
+        self._populate = populate
+        self.preamble = []
+        self.headers = []
+        self.rows = []
+
+    def add_preamble(self, row):
+        self.preamble.append(row)
+        if self._populate:
+            self._populator.add_preamble(row)
+
+    def start_table(self, header):
+        if not self._populator.start_table(header):
+            return False
+        self.headers.append(header)
+        self.rows.append([])
+        return True
+
+    def add(self, row):
+        if self.rows:
+            self.rows[-1].append(row)
+        if self._populate:
+            self._populator.add(row)
+
+    def eof(self):
+        return self._populator.eof()
+
+
+class _TableChange(object):
+
+    def __init__(self, table_type):
+        self.table_type = table_type
+        self.replaced = []
+        self.deleted = []
+        self.items = []
+
+    def apply(self, controller):
+        table = {TESTS: controller.tests, KEYWORDS: controller.keywords,
+                 VARIABLES: controller.variables}[self.table_type]
+        items = iter(self.items)
+        for index, item in zip(self.replaced, items):
+            if self.table_type == VARIABLES:
+                table[index].execute(UpdateVariable(item.name, item.value, item.comment))
+            else:
+                table[index].replace_content(item)
+        for index in sorted(self.deleted, reverse=True):
+            if self.table_type == VARIABLES:
+                table.delete(index)
+            else:
+                table.delete(table[index])
+        for item in items:
+            if self.table_type == VARIABLES:
+                table.add_variable(item.name, item.value, item.comment)
+            else:
+                table.add_item(item)
+
+
+def split_items(table_type, rows):
+    """Groups the rows of a table by the test, keyword or variable they
+    belong to, the same way as the parser does.
+
+    Rows ignored by the parser, like empty rows inside tests and keywords,
+    comment rows before the first item and variables without a name, are
+    left out.
+    """
+    items = []
+    for cells in rows:
+        row = robotapi.DataRow(cells)
+        if not row:
+            continue
+        if table_type == VARIABLES:
+            continuing = row.is_continuing() and bool(items)
+        else:
+            continuing = row.is_indented() and bool(items) or row.is_commented()
+        if not continuing:
+            items.append([cells])
+        elif items and (any(row.cells) or row.comments):
+            items[-1].append(cells)
+    if table_type == VARIABLES:
+        return [item for item in items if robotapi.DataRow(item[0]).head]
+    return items
+
+
+def _key(item):
+    return tuple(tuple(cells) for cells in item)
+
+
+def _model_items(datafile, table_type):
+    if table_type == TESTS:
+        return datafile.testcase_table.tests
+    if table_type == KEYWORDS:
+        return datafile.keyword_table.keywords
+    return datafile.variable_table.variables
@@ -225,7 +225,18 @@ class KeywordEditor(GridEditor, Plugin):
             return ''
         cell = self.cell_under_cursor
         cell_info = self._controller.get_cell_info(cell.Row, cell.Col)
-        return tip_message(cell_info)
+        return tip_message(cell_info) + self._execution_time_message(cell, cell_info)
+
+    def _execution_time_message(self, cell, cell_info):
+        times = getattr(self._plugin, 'execution_times', None)
+        if not times or not cell_info or cell_info.cell_type != CellType.KEYWORD:
+            return ''
+        keyword = times.get_keyword(self.GetCellValue(cell.Row, cell.Col))
+        if not keyword:
+            return ''
+        return '<br /><br />Last run: %d call%s, %.2f s in total, slowest %.2f s' % (
+            keyword.count, '' if keyword.count == 1 else 's',
+            keyword.total / 1000.0, keyword.slowest / 1000.0)
 
     def on_settings_changed(self, message):
         """Redraw the colors if the color settings are modified"""
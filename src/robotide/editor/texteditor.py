@@ -14,7 +14,6 @@
 #  limitations under the License.
 
 import string
-from io import StringIO, BytesIO
 from time import time
 
 import wx
@@ -36,6 +35,8 @@ from ..publish import RideSettingsChanged, PUBLISHER
 from ..publish.messages import RideMessage
 from ..widgets import TextField, Label, HtmlDialog
 from ..widgets import VerticalSizer, HorizontalSizer, ButtonWithHandler, RIDEDialog
+from .incrementallexer import IncrementalLexer
+from .incrementalupdate import IncrementalUpdater, read_tables
 
 try:  # import installed version first
     from pygments.lexers import robotframework as robotframeworklexer
@@ -272,34 +273,28 @@ class DataValidationHandler(object):
 
     def validate_and_update(self, data, text):
         m_text = text.decode("utf-8")
-        if not self._sanity_check(data, m_text):
+        target, tables = data.parse(m_text)
+        if not self._sanity_check(data, m_text, target):
             handled = self._handle_sanity_check_failure()
             if not handled:
                 return False
         self._editor.reset()
-        if self._editor.reformat:
-            data.update_from(data.format_text(m_text))
-        else:
-            # DEBUG: This is the area where we will implement to not reformat code
-            data.update_from(m_text)
-            # There is no way to update the model without reformatting
-            # DEBUG: this only updates the editor, but not the model, changes in Text Editor are not reflected
-            # in Grid or when saving
-            # self.source_editor.source_editor.set_text(m_text)
+        # The model is the same whether it is created from the text or from its reformatted version
+        data.update_from(target, tables)
         self._editor.set_editor_caret_position()
         return True
 
-    def _sanity_check(self, data, text):
-        # First remove all lines starting with #
-        for line in text.split('\n'):
-            comment = line.strip().startswith('#')
-            if comment:
-                text = text.replace(line, '')
-        formatted_text = data.format_text(text)
+    def _sanity_check(self, data, text, target):
+        formatted_text = self._strip_comment_lines(data.format_data(target))
         c = self._normalize(formatted_text)
-        e = self._normalize(text)
+        e = self._normalize(self._strip_comment_lines(text))
         return len(c) == len(e)
 
+    @staticmethod
+    def _strip_comment_lines(text):
+        return '\n'.join(line for line in text.split('\n')
+                         if not line.strip().startswith('#'))
+
     @staticmethod
     def _normalize(text):
         for item in tuple(string.whitespace) + ('...', '*'):
@@ -339,17 +334,18 @@ class DataFileWrapper(object):  # DEBUG: bad class name
             return False
         return self.wrapper_data == other.wrapper_data
 
-    def update_from(self, content):
-        self.wrapper_data.execute(SetDataFile(self._create_target_from(content)))
-
-    def _create_target_from(self, content):
-        src = BytesIO(content.encode("utf-8"))
+    def parse(self, content):
+        """Returns the data file parsed from `content` and the rows of its tables."""
         target = self._create_target()
-        FromStringIOPopulator(target).populate(src, self._tab_size)
-        return target
+        return target, read_tables(content, target, self._tab_size)
 
-    def format_text(self, text):
-        return self._txt_data(self._create_target_from(text))
+    def update_from(self, target, tables):
+        updater = IncrementalUpdater(self.wrapper_data, self._create_target, self._tab_size)
+        if not updater.update(self.content, target, tables):
+            self.wrapper_data.execute(SetDataFile(target))
+
+    def format_data(self, target):
+        return self._txt_data(target)
 
     def mark_data_dirty(self):
         if not self.wrapper_data.is_dirty:
@@ -373,9 +369,7 @@ class DataFileWrapper(object):  # DEBUG: bad class name
         return self._txt_data(self.wrapper_data.data)
 
     def _txt_data(self, data):
-        output = StringIO()
-        data.save(output=output, format='txt', txt_separating_spaces=self._settings.get(TXT_NUM_SPACES, 4))
-        return output.getvalue()
+        return robotapi.txt_content(data, txt_separating_spaces=self._settings.get(TXT_NUM_SPACES, 4))
 
 
 class SourceEditor(wx.Panel):
@@ -1862,6 +1856,7 @@ class RobotDataEditor(stc.StyledTextCtrl):
     def set_text(self, text):
         self.SetReadOnly(False)
         self.SetText(text)
+        self.ConvertEOLs(wx.stc.STC_EOL_LF)
         self.stylizer.stylize()
         self.EmptyUndoBuffer()
         self.SetMarginWidth(self.margin, self.calc_margin_width())
@@ -1871,8 +1866,7 @@ class RobotDataEditor(stc.StyledTextCtrl):
         return self.GetText().encode('UTF-8')
 
     def on_style(self, event):
-        _ = event
-        self.stylizer.stylize()
+        self.stylizer.stylize(self.GetEndStyled(), event.GetPosition())
 
     def on_zoom(self, event):
         _ = event
@@ -2042,12 +2036,6 @@ class RobotDataEditor(stc.StyledTextCtrl):
             self._old_details = details
 
 
-class FromStringIOPopulator(robotapi.populators.FromFilePopulator):
-
-    def populate(self, content: [str, BytesIO], tab_size: int):
-        robotapi.RobotReader(spaces=tab_size).read(content, self)
-
-
 class RobotStylizer(object):
     def __init__(self, editor, settings, readonly=False):
         self.tokens = {}
@@ -2057,7 +2045,8 @@ class RobotStylizer(object):
         self._readonly = readonly
         self._ensure_default_font_is_valid()
         if robotframeworklexer:
-            self.lexer = robotframeworklexer.RobotFrameworkLexer()
+            self.lexer = IncrementalLexer(self.tokens)
+            self.editor.SetEOLMode(wx.stc.STC_EOL_LF)
         else:
             self.editor.GetParent().create_syntax_colorization_help()
         self.set_styles(self._readonly)
@@ -2173,19 +2162,22 @@ class RobotStylizer(object):
             sys_font = wx.SystemSettings.GetFont(wx.SYS_ANSI_FIXED_FONT)
             self.settings[PLUGIN_NAME]['font face'] = sys_font.GetFaceName()
 
-    def stylize(self):
+    def stylize(self, start=0, end=None):
+        """Styles the text from the line of `start` to the line of `end`.
+
+        Styling restarts from the closest saved lexer state before `start`,
+        so only the edited lines and the lines after them get tokenized.
+        """
         if not self.lexer:
             return
-        self.editor.ConvertEOLs(2)
-        shift = 0
-        for position, token, value in self.lexer.get_tokens_unprocessed(self.editor.GetText()):
-            if wx.VERSION < (4, 1, 0):
-                self.editor.StartStyling(position + shift, 31)
-            else:
-                self.editor.StartStyling(position + shift)
-            try:
-                self.editor.SetStyling(len(value.encode('utf-8')), self.tokens[token])
-                shift += len(value.encode('utf-8')) - len(value)
-            except UnicodeEncodeError:
-                self.editor.SetStyling(len(value), self.tokens[token])
-                shift += len(value) - len(value)
+        if end is None:
+            end = self.editor.GetLength()
+        first_line = self.lexer.restart(self.editor.LineFromPosition(start))
+        last_line = self.editor.LineFromPosition(end)
+        if wx.VERSION < (4, 1, 0):
+            self.editor.StartStyling(self.editor.PositionFromLine(first_line), 31)
+        else:
+            self.editor.StartStyling(self.editor.PositionFromLine(first_line))
+        for line in range(first_line, last_line + 1):
+            styles = self.lexer.style_line(self.editor.GetLine(line))
+            self.editor.SetStyleBytes(len(styles), styles)
@@ -38,11 +38,11 @@ this package are for for internal usage and may change without prior notice.
 .. tip:: More public APIs are exposed by the :mod:`robot.api` package.
 """
 
+import importlib
 import sys
+import types
 import warnings
 
-from robotide.lib.robot.rebot import rebot, rebot_cli
-from robotide.lib.robot.run import run, run_cli
 from robotide.lib.robot.version import get_version
 
 
@@ -54,3 +54,33 @@ if not sys.warnoptions:
 
 __all__ = ['run', 'run_cli', 'rebot', 'rebot_cli']
 __version__ = get_version()
+
+
+def __getattr__(name):
+    # The entry points import the whole execution and reporting machinery,
+    # so they are imported only when used. This keeps importing the parsing
+    # modules, for example by RIDE, cheap.
+    if name in ('run', 'run_cli'):
+        module_name = 'run'
+    elif name in ('rebot', 'rebot_cli'):
+        module_name = 'rebot'
+    else:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    module = importlib.import_module('%s.%s' % (__name__, module_name))
+    for function in (module_name, module_name + '_cli'):
+        globals()[function] = getattr(module, function)
+    return globals()[name]
+
+
+class _EntryPointPackage(types.ModuleType):
+
+    def __setattr__(self, name, value):
+        # Importing the `run` and `rebot` submodules sets them as attributes
+        # of this package. Keep the functions with the same names visible
+        # instead, like when they were imported eagerly.
+        if name in ('run', 'rebot') and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        types.ModuleType.__setattr__(self, name, value)
+
+
+sys.modules[__name__].__class__ = _EntryPointPackage
@@ -19,7 +19,17 @@ Not part of the public API, and also subject to change in the future when
 test execution is refactored.
 """
 
-from .output import Output
 from .logger import LOGGER
-from .xmllogger import XmlLogger
 from .loggerhelper import LEVELS, Message
+
+
+def __getattr__(name):
+    # Outputs are needed only when running tests, so importing them and the
+    # result model they depend on is deferred until they are used.
+    if name == 'Output':
+        from .output import Output
+        return Output
+    if name == 'XmlLogger':
+        from .xmllogger import XmlLogger
+        return XmlLogger
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
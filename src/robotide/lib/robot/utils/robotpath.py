@@ -43,7 +43,10 @@ if PY2:
     def path_to_url(path):
         return pathname2url(path.encode('UTF-8'))
 else:
-    from urllib.request import pathname2url as path_to_url
+    def path_to_url(path):
+        # urllib.request is slow to import and seldom needed.
+        from urllib.request import pathname2url
+        return pathname2url(path)
 
 if WINDOWS:
     CASE_INSENSITIVE_FILESYSTEM = True
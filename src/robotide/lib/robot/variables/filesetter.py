@@ -15,10 +15,6 @@
 
 import inspect
 import io
-try:
-    import yaml
-except ImportError:
-    yaml = None
 
 from robotide.lib.robot.errors import DataError
 from robotide.lib.robot.output import LOGGER
@@ -75,7 +71,9 @@ class YamlImporter(object):
         return variables.items()
 
     def _load_yaml(self, stream):
-        if not yaml:
+        try:
+            import yaml
+        except ImportError:
             raise DataError('Using YAML variable files requires PyYAML module '
                             'to be installed. Typically you can install it '
                             'by running `pip install pyyaml`.')
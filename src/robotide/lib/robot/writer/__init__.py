@@ -24,3 +24,4 @@ This package is considered stable, although the planned changes to
 """
 
 from .datafilewriter import DataFileWriter
+from .txtwriter import txt_content
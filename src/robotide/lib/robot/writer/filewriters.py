@@ -24,6 +24,7 @@ from robotide.lib.robot.utils import HtmlWriter, PY2
 from .formatters import TsvFormatter, TxtFormatter, PipeFormatter
 from .htmlformatter import HtmlFormatter
 from .htmltemplate import TEMPLATE_START, TEMPLATE_END
+from .txtwriter import StreamingTxtWriter
 
 
 def FileWriter(context):
@@ -39,7 +40,7 @@ def FileWriter(context):
         return TsvFileWriter(context)
     if context.pipe_separated:
         return PipeSeparatedTxtWriter(context)
-    return SpaceSeparatedTxtWriter(context)
+    return StreamingTxtWriter(context)
 
 
 class _DataFileWriter(object):
@@ -0,0 +1,129 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from .aligners import ColumnAligner
+from .dataextractor import DataExtractor
+from .formatters import TxtFormatter
+from .rowsplitter import RowSplitter
+
+
+class StreamingTxtWriter(object):
+    """Writes space separated plain text data straight to the output.
+
+    The output is identical to what
+    :class:`~robot.writer.filewriters.SpaceSeparatedTxtWriter` writes, but
+    rows are formatted without the intermediate formatter and aligner
+    objects. Column widths of aligned tables are counted once per table
+    instead of once per row, cells without consecutive whitespace are not
+    run through the escaping regexp, and the lines of a table are collected
+    into a reused buffer that is written to the output at once.
+    """
+    _setting_and_variable_name_width = TxtFormatter._setting_and_variable_name_width
+    _test_or_keyword_name_width = TxtFormatter._test_or_keyword_name_width
+    _whitespace = TxtFormatter._whitespace
+
+    def __init__(self, configuration):
+        self._output = configuration.output
+        self._separator = ' ' * configuration.txt_separating_spaces
+        self._splitter = RowSplitter(configuration.txt_column_count, split_multiline_doc=True)
+        self._buffer = []
+
+    def write(self, datafile):
+        tables = [table for table in datafile if table]
+        if datafile.has_preamble:
+            for line in datafile.preamble:
+                self._output.write(line)
+        for table in tables:
+            self._write_table(table, is_last=table is tables[-1])
+
+    def _write_table(self, table, is_last):
+        aligned = table.type in ('test case', 'keyword') and bool(table.header[1:])
+        widths = self._column_widths(table, aligned)
+        header = self._escape(table.header)
+        self._add_row(['*** %s ***' % header[0]] + header[1:], widths)
+        rows = DataExtractor(self._name_on_first_row if aligned else None).rows_from_table(table)
+        if not aligned:
+            rows = self._split_rows(rows, table.type)
+        for row in rows:
+            self._add_row(self._escape(row), widths)
+        if not is_last and not self._ends_with_empty_variable(table):
+            self._buffer.append('\n')
+        self._output.write(''.join(self._buffer))
+        self._buffer.clear()
+
+    def _column_widths(self, table, aligned):
+        if table.type in ('setting', 'variable'):
+            return [self._setting_and_variable_name_width]
+        if aligned:
+            return ColumnAligner(self._test_or_keyword_name_width, table)._widths
+        return None
+
+    def _name_on_first_row(self, table, name):
+        return len(name) <= self._test_or_keyword_name_width
+
+    def _split_rows(self, rows, table_type):
+        split = self._splitter.split
+        for row in rows:
+            for part in split(row, table_type):
+                yield part
+
+    @staticmethod
+    def _ends_with_empty_variable(table):
+        # Same workaround as in `_DataFileWriter._write_table`.
+        if table.type != 'variable':
+            return False
+        try:
+            return len(list(table)[-1].as_list()) == 0
+        except IndexError:
+            return False
+
+    def _escape(self, row):
+        escaped = []
+        content = False
+        for cell in row:
+            if '\n' in cell:
+                cell = cell.replace('\n', ' ')
+            if '  ' in cell or not cell.isprintable():
+                cell = self._whitespace.sub(TxtFormatter._whitespace_escaper, cell)
+            if cell:
+                content = True
+            elif content:
+                cell = '\\'
+            escaped.append(cell)
+        return escaped
+
+    def _add_row(self, row, widths):
+        if widths:
+            for index in range(min(len(row), len(widths))):
+                row[index] = row[index].ljust(widths[index])
+        self._buffer.append(self._separator.join(row).rstrip() + '\n')
+
+
+class _TextChunks(object):
+
+    def __init__(self):
+        self.chunks = []
+        self.write = self.chunks.append
+
+
+def txt_content(datafile, txt_separating_spaces=4):
+    """Returns `datafile` in the space separated plain text format.
+
+    The result is the same as what saving the datafile in the `txt` format
+    to a `StringIO` would produce.
+    """
+    output = _TextChunks()
+    datafile.save(output=output, format='txt', txt_separating_spaces=txt_separating_spaces)
+    return ''.join(output.chunks)
@@ -13,14 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robotide.lib.robot.running.arguments.embedded import EmbeddedArgumentParser
-
-
 class EmbeddedArgsHandler(object):
 
     def __init__(self, keyword):
         if keyword.arguments:
             raise TypeError('Cannot have normal arguments')
+        # Importing the parser imports the whole test execution side of
+        # Robot Framework, so it is done only when keywords are handled.
+        from robotide.lib.robot.running.arguments.embedded import EmbeddedArgumentParser
         self.name_regexp, self.embedded_args = \
             EmbeddedArgumentParser().parse(keyword.name)
         if not self.embedded_args:
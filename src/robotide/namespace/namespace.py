@@ -22,7 +22,7 @@ from itertools import chain
 
 
 from .. import robotapi, utils
-from ..publish import PUBLISHER, RideSettingsChanged, RideLogMessage
+from ..publish import PUBLISHER, RideSettingsChanged, RideLogMessage, RideVariableUpdated
 from ..robotapi import VariableFileSetter
 from ..spec.iteminfo import (TestCaseUserKeywordInfo, ResourceUserKeywordInfo, VariableInfo, UserKeywordInfo,
                              ArgumentInfo)
@@ -39,11 +39,14 @@ class Namespace(object):
         self._library_manager = None
         self._content_assist_hooks = []
         self._update_listeners = set()
+        self.generation = 0
         self._init_caches()
         self._set_pythonpath()
         PUBLISHER.subscribe(self._setting_changed, RideSettingsChanged)
+        PUBLISHER.subscribe(self._variable_updated, RideVariableUpdated)
 
     def _init_caches(self):
+        self.generation += 1
         self._lib_cache = LibraryCache(
             self.settings, self.update, self._library_manager)
         self._resource_factory = ResourceFactory(self.settings)
@@ -97,8 +100,18 @@ class Namespace(object):
         self._library_manager = library_manager
         self._lib_cache.set_library_manager(library_manager)
 
+    def _variable_updated(self, message):
+        _ = message
+        self.generation += 1
+
     def update(self, *args):
+        """Expires the caches after keywords or variables have changed.
+
+        `generation` is incremented on every update, so that data derived
+        from the namespace can be cached until the next update.
+        """
         _ = args
+        self.generation += 1
         self._retriever.expire_cache()
         self._context_factory = _RetrieverContextFactory()
         for listener in self._update_listeners:
@@ -132,6 +145,9 @@ class Namespace(object):
     def _get_default_keywords(self):
         return self._lib_cache.get_default_keywords()
 
+    def get_own_keywords(self, datafile):
+        return self._retriever.get_own_keywords_from(datafile, RetrieverContext())
+
     def get_suggestions_for(self, controller, start):
         datafile = controller.datafile
         ctx = self._context_factory.ctx_for_controller(controller)
@@ -438,6 +454,12 @@ class DatafileRetriever(object):
             self._get_imported_resource_keywords(datafile, ctx) +
             self._get_imported_library_keywords(datafile, ctx)))
 
+    def get_own_keywords_from(self, datafile, ctx):
+        self._get_vars_recursive(datafile, ctx)
+        ctx.allow_going_through_resources_again()
+        return set(self._get_datafile_keywords(datafile) +
+                   self._get_imported_library_keywords(datafile, ctx))
+
     def is_library_import_ok(self, datafile, imp, ctx):
         self._get_vars_recursive(datafile, ctx)
         return bool(self._lib_kw_getter(imp, ctx))
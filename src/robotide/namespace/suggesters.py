@@ -24,6 +24,15 @@ class SuggestionSource(object):
         self._plugin = plugin
         self._controller = controller
 
+    @property
+    def generation(self):
+        """Namespace generation the suggestions depend on, or None if the
+        source has no controller."""
+        try:
+            return self._controller.datafile_controller.namespace.generation
+        except AttributeError:
+            return None
+
     def get_suggestions(self, value, row=None):
         if self._controller:
             try:
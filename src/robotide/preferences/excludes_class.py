@@ -22,6 +22,8 @@ class Excludes(object):
     def __init__(self, directory):
         self._settings_directory = directory
         self._exclude_file_path = os.path.join(self._settings_directory, 'excludes')
+        self._normalized_excludes = None
+        self._excludes_file_state = None
 
     def get_excludes(self, separator='\n'):
         return separator.join(self._get_excludes())
@@ -44,6 +46,7 @@ class Excludes(object):
                 if not exclude:
                     continue
                 exclude_file.write("%s\n" % exclude)
+        self._excludes_file_state = None
         # print("DEBUG:real excluded self._get_excludes()=%s\n" % self._get_excludes())
 
     def update_excludes(self, new_excludes):
@@ -68,15 +71,30 @@ class Excludes(object):
     def contains(self, path, excludes=None):
         if not path:
             return False
-        excludes = excludes or self._get_excludes()
+        if excludes:
+            excludes = [self._normalize(e) for e in excludes]
+        else:
+            excludes = self._get_normalized_excludes()
         if len(excludes) < 1:
             return False
         path = self._normalize(path)
-        excludes = [self._normalize(e) for e in excludes]
         # print("DEBUG: excludes contains %s path %s\n"
         #      "any: %s\n" % (excludes[0], path, any(self._match(path, e) for e in excludes)) )
         return any(self._match(path, e) for e in excludes)
 
+    def _get_normalized_excludes(self):
+        # Every data file is checked when the tree is populated, so the file
+        # is read again only after it has changed
+        try:
+            stat = os.stat(self._exclude_file_path)
+            state = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            state = None
+        if state is None or state != self._excludes_file_state:
+            self._normalized_excludes = [self._normalize(e) for e in self._get_excludes()]
+            self._excludes_file_state = state
+        return self._normalized_excludes
+
     @staticmethod
     def _match(path, e):
         return fnmatch(path, e) or path.startswith(e)
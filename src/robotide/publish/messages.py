@@ -223,6 +223,12 @@ class RideTestStopped(RideMessage):
     data = ['item']
 
 
+class RideExecutionTimesLoaded(RideMessage):
+    """Sent when the elapsed times of the tests and keywords of a finished
+    test run have been read from its output file."""
+    data = ['times']
+
+
 class RideNotebookTabChanging(RideMessage):
     """Sent when the notebook tab change has started.
 
@@ -255,6 +261,15 @@ class RideSaved(RideMessage):
     data = ['path']
 
 
+class RideSavedBatch(RideSaved):
+    """Sent once after ``Save All`` has saved several files to disk.
+
+    ``paths`` contains the saved files and ``path`` describes them as a
+    whole. Listeners of `RideSaved` receive this message too.
+    """
+    data = ['path', 'paths']
+
+
 class RideSaveAll(RideMessage):
     """Sent when user selects ``Save All`` from ``File`` menu or via shortcut."""
     pass
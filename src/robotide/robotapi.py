@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import importlib
+
 from .lib.robot.parsing import populators
 from .lib.robot.errors import DataError, VariableError, Information
 from .lib.robot.model import TagPatterns
@@ -29,15 +31,13 @@ from .lib.robot.parsing.settings import (Library, Resource, Variables, Comment,
                                          Documentation, Timeout, Tags, Return, Setting)
 from .lib.robot.parsing.tablepopulators import UserKeywordPopulator, TestCasePopulator
 from .lib.robot.parsing.robotreader import RobotReader
-from .lib.robot.running import TestLibrary, EXECUTION_CONTEXTS
 from .lib.robot.libraries import STDLIBS as STDLIB_NAMES
-from .lib.robot.running.usererrorhandler import UserErrorHandler
-from .lib.robot.running.arguments.embedded import EmbeddedArgumentParser
 from .lib.robot.utils import normpath, NormalizedDict
 from .lib.robot.variables import Variables as RobotVariables
 from .lib.robot.variables import is_scalar_var, is_list_var, is_var, is_dict_var, VariableSplitter
 from .lib.robot.variables.tablesetter import VariableTableReader
 from .lib.robot.version import ROBOT_VERSION, ALIAS_MARKER
+from .lib.robot.writer import txt_content
 try:
     from robot.variables.filesetter import VariableFileSetter
     # print("DEBUG: robotapi using installed RobotFramework VariableFileSetter.")
@@ -58,3 +58,21 @@ LOG_LEVELS = {
   'DEBUG': 1,
   'TRACE': 0,
 }
+
+# Execution side of Robot Framework is needed only when libraries are loaded,
+# so it is imported on first use to keep the parser and model cheap to import.
+_RUNNING = {
+    'TestLibrary': ('.lib.robot.running', 'TestLibrary'),
+    'EXECUTION_CONTEXTS': ('.lib.robot.running', 'EXECUTION_CONTEXTS'),
+    'UserErrorHandler': ('.lib.robot.running.usererrorhandler', 'UserErrorHandler'),
+    'EmbeddedArgumentParser': ('.lib.robot.running.arguments.embedded', 'EmbeddedArgumentParser'),
+}
+
+
+def __getattr__(name):
+    if name not in _RUNNING:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    module, attribute = _RUNNING[name]
+    value = getattr(importlib.import_module(module, __package__), attribute)
+    globals()[name] = value
+    return value
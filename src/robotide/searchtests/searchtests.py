@@ -19,6 +19,7 @@ import wx
 
 from .. import robotapi
 from ..action import ActionInfo
+from ..controller.tagindex import CompiledTagPatterns
 from ..pluginapi import Plugin
 from ..publish import RideOpenTagSearch
 from .dialogsearchtests import TestsDialog
@@ -54,7 +55,7 @@ class TestSearchPlugin(Plugin):
     def show_search_for_tag_patterns(self, includes, excludes):
         matcher = TagSearchMatcher(includes, excludes)
         self._dialog.set_tag_search_model(
-            includes, excludes, self._search_results(matcher))
+            includes, excludes, self._tag_search_results(matcher))
         self._dialog.set_focus_to_default_location()
 
     def show_tag_search(self, message):
@@ -100,6 +101,15 @@ class TestSearchPlugin(Plugin):
         if not current_suite:
             return []
         result = self._search(matcher, current_suite)
+        return self._sorted(result)
+
+    def _tag_search_results(self, matcher):
+        if not self.frame.controller.data:
+            return []
+        result = matcher.search(self.frame.controller.tag_index)
+        return self._sorted(result)
+
+    def _sorted(self, result):
         return sorted(result, key=cmp_to_key(lambda x, y:
                                              self.m_cmp(x[1], y[1])))
 
@@ -135,6 +145,11 @@ class TagSearchMatcher(object):
         self._tag_pattern_includes = robotapi.TagPatterns(
             includes.split()) if includes.split() else None
         self._tag_pattern_excludes = robotapi.TagPatterns(excludes.split())
+        self._compiled = CompiledTagPatterns(includes, excludes)
+
+    def search(self, tag_index):
+        return [(test, test.longname)
+                for test in self._compiled.search(tag_index)]
 
     def matches(self, test):
         tags = [str(tag) for tag in test.tags]
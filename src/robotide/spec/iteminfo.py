@@ -17,7 +17,6 @@ import os
 from functools import total_ordering
 
 from .. import utils
-from ..lib.robot.libdocpkg.htmlwriter import DocToHtml
 
 
 class ItemInfo(object):
@@ -171,6 +170,7 @@ class _KeywordInfo(ItemInfo):
 
     @property
     def details(self):
+        from ..lib.robot.libdocpkg.htmlwriter import DocToHtml
         formatter = DocToHtml(self.doc_format)
         return ('<table>'
                 '<tr><td><i>Name:</i></td><td>%s</td></tr>'
@@ -17,7 +17,7 @@ import os
 import sqlite3
 import time
 
-from ..preferences.settings import SETTINGS_DIRECTORY
+from ..context import SETTINGS_DIRECTORY
 from ..spec.iteminfo import LibraryKeywordInfo
 from ..lib.robot.utils import system_decode
 
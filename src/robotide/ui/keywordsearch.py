@@ -14,6 +14,8 @@
 #  limitations under the License.
 
 import os.path
+import re
+from bisect import bisect_left, bisect_right
 from functools import (cmp_to_key)
 
 import wx
@@ -42,6 +44,9 @@ class KeywordSearch(Plugin):
         Plugin.__init__(self, app)
         self.all_keywords = []
         self._criteria = _SearchCriteria()
+        self._index = _KeywordIndex()
+        self._dirty_datafiles = set()
+        self._rebuild = True
         self.dirty = False
         self._dialog = None
 
@@ -53,8 +58,9 @@ class KeywordSearch(Plugin):
                             position=51)
         self.register_action(action)
         self.register_search_action(SEARCH_KW, self.show_search_for, ImageProvider().KW_SEARCH_ICON)
-        self.subscribe(self.mark_dirty, RideOpenSuite, RideOpenResource,
-                       RideImportSetting, RideUserKeyword, RideNewProject)
+        self.subscribe(self.mark_dirty, RideOpenSuite, RideNewProject)
+        self.subscribe(self.mark_datafile_dirty, RideOpenResource,
+                       RideImportSetting, RideUserKeyword)
         self._dialog = KeywordSearchDialog(self.frame, self)
         self.tree.register_context_menu_hook(self._search_resource)
 
@@ -64,6 +70,14 @@ class KeywordSearch(Plugin):
 
     def mark_dirty(self, message):
         _ = message
+        self._rebuild = True
+        self.dirty = True
+
+    def mark_datafile_dirty(self, message):
+        datafile = message.datafile
+        if hasattr(datafile, 'datafile_controller'):
+            datafile = datafile.datafile
+        self._dirty_datafiles.add(datafile)
         self.dirty = True
 
     def have_keywords_changed(self):
@@ -74,14 +88,28 @@ class KeywordSearch(Plugin):
 
     def _update(self):
         self.dirty = False
-        self.all_keywords = self.model.get_all_keywords()
+        datafiles = set(ctrl.datafile for ctrl in self.model.datafiles
+                        if ctrl.datafile)
+        if self._rebuild:
+            self._rebuild = False
+            self._index.clear()
+            self._index.set_group(None, self.model.get_all_keywords_from([]))
+            self._dirty_datafiles = datafiles
+        for datafile in self._dirty_datafiles:
+            if datafile in datafiles:
+                self._index.set_group(
+                    datafile, self.model.namespace.get_own_keywords(datafile))
+            else:
+                self._index.remove_group(datafile)
+        self._dirty_datafiles = set()
+        self.all_keywords = self._index.keywords
 
     def search(self, pattern, search_docs, source_filter):
         self._criteria = _SearchCriteria(pattern, search_docs, source_filter)
         return self._search()
 
     def _search(self):
-        return [kw for kw in self.all_keywords if self._criteria.matches(kw)]
+        return self._index.search(self._criteria)
 
     def _search_resource(self, item):
         if isinstance(item, (TestCaseFileController, ResourceFileController)):
@@ -109,13 +137,21 @@ class _SearchCriteria(object):
         self._source_filter = source_filter
 
     def matches(self, kw):
-        if not self._matches_source_filter(kw):
+        if not self.matches_source_filter(kw):
             return False
         if self._contains(kw.name, self._pattern):
             return True
         return self._search_docs and self._contains(kw.doc, self._pattern)
 
-    def _matches_source_filter(self, kw):
+    @property
+    def pattern(self):
+        return self._pattern
+
+    @property
+    def search_docs(self):
+        return self._search_docs
+
+    def matches_source_filter(self, kw):
         if self._source_filter == ALL_KEYWORDS:
             return True
         if self._source_filter == ALL_USER_KEYWORDS and kw.is_user_keyword():
@@ -129,6 +165,122 @@ class _SearchCriteria(object):
         return utils.normalize(pattern) in utils.normalize(string)
 
 
+class _KeywordIndex(object):
+    """Search index over keywords with pre-normalized names and documentation.
+
+    Keywords are kept in groups, one group per datafile they are defined in
+    or imported to, so that a change in a datafile only re-indexes that
+    group. Normalized names and documentations are joined into single
+    strings, which are scanned with `str.find` instead of testing every
+    keyword. Documentation words are kept in a sorted token index.
+    """
+    _token = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._groups = {}
+        self._entries = {}
+        self._corpus = None
+
+    @property
+    def keywords(self):
+        return [entry[0] for entry in self._entries.values()]
+
+    def set_group(self, key, keywords):
+        self.remove_group(key)
+        keywords = list(keywords)
+        for kw in keywords:
+            self._retain(kw)
+        self._groups[key] = keywords
+
+    def remove_group(self, key):
+        for kw in self._groups.pop(key, ()):
+            self._release(kw)
+
+    def _retain(self, kw):
+        entry = self._entries.get(id(kw))
+        if entry:
+            entry[1] += 1
+            return
+        doc = kw.doc or ''
+        tokens = set(token.lower() for token in self._token.findall(doc))
+        self._entries[id(kw)] = [kw, 1, utils.normalize(kw.name),
+                                 utils.normalize(doc), tokens]
+        self._corpus = None
+
+    def _release(self, kw):
+        entry = self._entries[id(kw)]
+        entry[1] -= 1
+        if not entry[1]:
+            del self._entries[id(kw)]
+            self._corpus = None
+
+    def _get_corpus(self):
+        if self._corpus is None:
+            entries = list(self._entries.values())
+            tokens = {}
+            for index, entry in enumerate(entries):
+                for token in entry[4]:
+                    tokens.setdefault(token, []).append(index)
+            self._corpus = (entries,
+                            _JoinedText([entry[2] for entry in entries]),
+                            _JoinedText([entry[3] for entry in entries]),
+                            sorted(tokens), tokens)
+        return self._corpus
+
+    def search(self, criteria):
+        """Returns keywords matching `criteria`, most relevant first.
+
+        Keywords whose name starts with the pattern come first, then
+        keywords whose name contains it, then keywords having a word
+        in documentation starting with it and finally keywords whose
+        documentation otherwise contains it.
+        """
+        entries, names, docs, token_list, tokens = self._get_corpus()
+        pattern = utils.normalize(criteria.pattern)
+        name_hits = names.find_all(pattern)
+        ranked = [i for i in name_hits if entries[i][2].startswith(pattern)]
+        ranked += [i for i in name_hits if not entries[i][2].startswith(pattern)]
+        if criteria.search_docs:
+            seen = set(name_hits)
+            start = bisect_left(token_list, pattern)
+            end = bisect_right(token_list, pattern + '\U0010ffff')
+            token_hits = sorted(set(i for token in token_list[start:end]
+                                    for i in tokens[token]) - seen)
+            seen.update(token_hits)
+            ranked += token_hits
+            ranked += [i for i in docs.find_all(pattern) if i not in seen]
+        return [entries[i][0] for i in ranked
+                if criteria.matches_source_filter(entries[i][0])]
+
+
+class _JoinedText(object):
+
+    def __init__(self, texts):
+        self._text = '\n'.join(texts)
+        self._starts = []
+        position = 0
+        for text in texts:
+            self._starts.append(position)
+            position += len(text) + 1
+
+    def find_all(self, pattern):
+        """Returns indices of texts containing `pattern`, in order."""
+        if not pattern:
+            return list(range(len(self._starts)))
+        hits = []
+        position = self._text.find(pattern)
+        while position != -1:
+            index = bisect_right(self._starts, position) - 1
+            hits.append(index)
+            if index + 1 == len(self._starts):
+                break
+            position = self._text.find(pattern, self._starts[index + 1])
+        return hits
+
+
 class KeywordSearchDialog(RIDEDialog):
 
     def __init__(self, parent, searcher):
@@ -218,6 +370,7 @@ class KeywordSearchDialog(RIDEDialog):
         self.Bind(wx.EVT_SEARCHCTRL_SEARCH_BTN, self.on_search,
                   self._search_control)
         self.Bind(wx.EVT_TEXT_ENTER, self.on_search, self._search_control)
+        self.Bind(wx.EVT_TEXT, self.on_search, self._search_control)
         self.Bind(wx.EVT_ACTIVATE, self.on_activate)
         self.Bind(wx.EVT_CLOSE, self.on_close)
         self.Bind(wx.EVT_CHECKBOX, self.on_use_doc_change, self._use_doc)
@@ -357,12 +510,15 @@ class _KeywordData(list):
 
     def _sort_by_search(self, keywords, sort_order, search_criteria):
         search_criteria = search_criteria.lower()
-        starts_with = [kw for kw in keywords if kw.name.lower().startswith(search_criteria)]
-        name_contains = [kw for kw in keywords if (search_criteria in kw.name.lower()
-                                                   and kw not in starts_with)]
-        doc_contains = [kw for kw in keywords if (search_criteria in kw.details.lower()
-                                                  and kw not in starts_with
-                                                  and kw not in name_contains)]
+        starts_with, name_contains, doc_contains = [], [], []
+        for kw in keywords:
+            name = kw.name.lower()
+            if name.startswith(search_criteria):
+                starts_with.append(kw)
+            elif search_criteria in name:
+                name_contains.append(kw)
+            elif search_criteria in kw.details.lower():
+                doc_contains.append(kw)
         result = []
         for to_sort in (starts_with, name_contains, doc_contains):
             result.extend(self._sort_by_attr(to_sort, sort_order))
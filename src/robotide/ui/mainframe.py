@@ -26,7 +26,6 @@ from .fileexplorerplugin import FileExplorer
 from .notebook import NoteBook
 from .pluginmanager import PluginManager
 from .progress import LoadProgressObserver
-from .review import ReviewDialog
 from .treeplugin import Tree
 from ..action import action_info_collection, action_factory, SeparatorInfo
 from ..action.shortcut import localize_shortcuts
@@ -485,6 +484,7 @@ class RideFrame(wx.Frame):
     def on_search_unused_keywords(self, event):
         _ = event
         if self._review_dialog is None:
+            from .review import ReviewDialog
             self._review_dialog = ReviewDialog(self.controller, self)
         self._review_dialog.show_dialog()
 
@@ -159,27 +159,17 @@ class ViewAllTagsDialog(RIDEDialog, listmix.ColumnSorterMixin):
         pass
 
     def _search_for_tags(self):
-        unique_tags = utils.NormalizedDict()
+        tag_index = self.frame.controller.tag_index
         self._tags = utils.NormalizedDict()
-        self._test_cases = []
-        for test in self.frame.controller.all_testcases():
-            self._test_cases.append(test)
-            for tag in test.tags:
-                if tag.is_empty() or len(str(tag).strip()) == 0:
-                    continue
-                else:
-                    tag_name = str(tag)
-                if tag_name in unique_tags:
-                    unique_tags[tag_name].append(test)
-                    self._tags[tag_name].append(tag)
-                else:
-                    unique_tags[tag_name] = [test]
-                    self._tags[tag_name] = [tag]
+        unique_tags = []
+        for tag_name in tag_index.tag_names():
+            unique_tags.append((tag_name, tag_index.tests_with_tag(tag_name)))
+            self._tags[tag_name] = tag_index.tag_objects(tag_name)
 
         isreversed = (self.sort_state[1] != 1)
-        self.total_test_cases = len(self._test_cases)
+        self.total_test_cases = tag_index.number_of_tests
 
-        self._results = sorted(unique_tags.items(),
+        self._results = sorted(unique_tags,
                                key=lambda item: item[0].lower(),
                                reverse=isreversed)
 
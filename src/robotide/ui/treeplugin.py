@@ -25,7 +25,7 @@ from wx.lib.mixins import treemixin
 from ..context import IS_WINDOWS
 from ..publish.messages import (RideTestRunning, RideTestPaused, RideTestPassed, RideTestFailed, RideTestSkipped,
                                 RideTestExecutionStarted, RideTestStopped, RideImportSetting, RideExcludesChanged,
-                                RideIncludesChanged, RideOpenSuite, RideNewProject)
+                                RideIncludesChanged, RideOpenSuite, RideNewProject, RideExecutionTimesLoaded)
 from ..ui.images import (RUNNING_IMAGE_INDEX, PASSED_IMAGE_INDEX, FAILED_IMAGE_INDEX, PAUSED_IMAGE_INDEX,
                          SKIPPED_IMAGE_INDEX, ROBOT_IMAGE_INDEX)
 from ..ui.treenodehandlers import TestCaseHandler, TestDataDirectoryHandler, TestCaseFileHandler
@@ -51,6 +51,11 @@ _TREE_ARGS['agwStyle'] |= customtreectrl.TR_TOOLTIP_ON_LONG_ITEMS | customtreect
 if IS_WINDOWS:
     _TREE_ARGS['style'] |= wx.TR_EDIT_LABELS
 
+_ICON_UPDATE_INTERVAL = 100  # milliseconds
+# Tests faster than this share of the slowest test are not highlighted
+_HEATMAP_THRESHOLD = 0.1
+_HEATMAP_COLOUR = (255, 96, 0)
+
 
 class TreePlugin(Plugin):
     """Provides a tree view for Test Suites """
@@ -196,6 +201,13 @@ class TreePlugin(Plugin):
         self._tree.Update()
 
 
+def _heat_colour(background, ratio):
+    """Blends `background` towards the heatmap colour, the more the greater `ratio` is."""
+    weight = 0.15 + 0.55 * min(ratio, 1)
+    return wx.Colour(*[int(base + (heat - base) * weight)
+                       for base, heat in zip(background.Get(False), _HEATMAP_COLOUR)])
+
+
 class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
     _RESOURCES_NODE_LABEL = 'External Resources'
 
@@ -211,6 +223,10 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         self._bind_tree_events()
         self._images = TreeImageList()
         self._animctrl = None
+        self._animated_node = None
+        self._animated_index = None
+        self._pending_icon_updates = {}
+        self._icon_update_scheduled = False
         self._silent_mode = False
         self.SetImageList(self._images)
         self.label_editor = TreeLabelEditListener(self, action_registerer)
@@ -263,6 +279,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         self.Bind(customtreectrl.EVT_TREE_ITEM_CHECKED, self.on_tree_item_checked)
         self.Bind(wx.EVT_TREE_ITEM_COLLAPSING, self.on_tree_item_collapsing)
         self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.Bind(wx.EVT_TREE_DELETE_ITEM, self.on_delete_item)
 
     def on_selection(self, event):
         if self._right_click:
@@ -319,6 +336,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
             (self._test_result, RideTestFailed),
             (self._test_result, RideTestSkipped),
             (self._test_result, RideTestStopped),
+            (self._execution_times_loaded, RideExecutionTimesLoaded),
             (self._handle_import_setting_message, RideImportSetting),
             (self._mark_excludes, RideExcludesChanged),
             (self._mark_excludes, RideIncludesChanged),
@@ -358,11 +376,29 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
             return wx.LIGHT_GREY
 
     def _testing_started(self, message):
-        self._for_all_drawn_tests(
-            self.root, lambda t: self.SetItemImage(t, ROBOT_IMAGE_INDEX))
+        def reset(node):
+            self.SetItemImage(node, ROBOT_IMAGE_INDEX)
+            self.SetItemBackgroundColour(node, wx.NullColour)
+        self._for_all_drawn_tests(self.root, reset)
         self._execution_results = message.results
         self._images.set_execution_results(message.results)
 
+    def _execution_times_loaded(self, message):
+        """Colors test nodes by how long the tests took on the last run."""
+        times = message.times
+        slowest = times.slowest_test
+        if not slowest:
+            return
+        background = self.GetBackgroundColour()
+
+        def colour(node):
+            elapsed = times.get_test(self.GetItemData(node).controller.longname)
+            ratio = (elapsed or 0) / slowest
+            self.SetItemBackgroundColour(
+                node, _heat_colour(background, ratio)
+                if ratio >= _HEATMAP_THRESHOLD else wx.NullColour)
+        self._for_all_drawn_tests(self.root, colour)
+
     def _test_result(self, message):
         from ..controller.macrocontrollers import TestCaseController
 
@@ -370,11 +406,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         if not test:
             # test object will be None when running with DataDriver
             # when runner is interrupted, is also None, so let's stop animation
-            if self._animctrl:
-                self._animctrl.Stop()
-                self._animctrl.Animation.Destroy()
-                self._animctrl.Destroy()
-                self._animctrl = None
+            wx.CallAfter(self._cancel_icon_updates)
             return
         if isinstance(message, RideTestPassed):
             test.run_passed = True
@@ -384,46 +416,77 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
             test.run_passed = False
         else:
             test.run_passed = None
-        wx.CallAfter(self._set_icon_from_execution_results, message.item)
+        # Results are published from the test runner's listener thread, so
+        # the pending updates are handled only in the UI thread.
+        wx.CallAfter(self._queue_icon_update, test)
+
+    def _queue_icon_update(self, controller):
+        # Results may arrive much faster than the tree can be redrawn, so they
+        # are collected and applied in batches at most every
+        # _ICON_UPDATE_INTERVAL milliseconds.
+        self._pending_icon_updates[id(controller)] = controller
+        if not self._icon_update_scheduled:
+            self._icon_update_scheduled = True
+            wx.CallLater(_ICON_UPDATE_INTERVAL, self._apply_icon_updates)
+
+    def _cancel_icon_updates(self):
+        # An interrupted run must not be restarted by an already scheduled batch.
+        self._pending_icon_updates = {}
+        self._stop_running_animation()
+
+    def _apply_icon_updates(self):
+        self._icon_update_scheduled = False
+        controllers, self._pending_icon_updates = list(self._pending_icon_updates.values()), {}
+        running = None
+        for controller in controllers:
+            node = self.controller.find_node_by_controller(controller)
+            if not node:
+                continue
+            img_index = self._get_icon_index_for(controller)
+            self.SetItemImage(node, img_index)
+            if img_index in (RUNNING_IMAGE_INDEX, PAUSED_IMAGE_INDEX):
+                running = (node, img_index)
+            elif node is self._animated_node:
+                self._stop_running_animation()
+        if running:
+            self._show_running_animation(*running)
+        self.Update()
 
-    def _set_icon_from_execution_results(self, controller):
-        node = self.controller.find_node_by_controller(controller)
-        if not node:
+    def _show_running_animation(self, node, img_index):
+        if self._animctrl and node is self._animated_node and img_index == self._animated_index:
             return
-        img_index = self._get_icon_index_for(controller)
-        # Always set the static icon
-        self.SetItemImage(node, img_index)
+        self._stop_running_animation()
+        from wx.adv import Animation, AnimationCtrl
+        _BASE = os.path.join(os.path.dirname(__file__), '..', 'widgets')
+        if img_index == RUNNING_IMAGE_INDEX:
+            img = os.path.join(_BASE, 'robot-running.gif')
+        else:
+            img = os.path.join(_BASE, 'robot-pause.gif')
+        ani = Animation(img)
+        rect = (node.GetX()+20, node.GetY())  # Overlaps robot icon
+        self._animctrl = AnimationCtrl(self, -1, ani, rect)
+        self._animctrl.SetBackgroundColour('white')
+        self.SetItemWindow(node, self._animctrl, False)
+        self._animctrl.Play()
+        self._animated_node = node
+        self._animated_index = img_index
+        # Make visible only the running or paused test, not its siblings
+        parent = node.GetParent()
+        if parent and parent is not self.root:
+            self.Expand(parent)
+        self.EnsureVisible(node)
+
+    def _stop_running_animation(self):
         if self._animctrl:
             self._animctrl.Stop()
             self._animctrl.Animation.Destroy()
-            self._animctrl.Destroy()
-            self._animctrl = None
-            self.DeleteItemWindow(node)
-        if img_index in (RUNNING_IMAGE_INDEX, PAUSED_IMAGE_INDEX):
-            from wx.adv import Animation, AnimationCtrl
-            import os
-            _BASE = os.path.join(os.path.dirname(__file__), '..', 'widgets')
-            if img_index == RUNNING_IMAGE_INDEX:
-                img = os.path.join(_BASE, 'robot-running.gif')
+            if self._animated_node and self._animated_node.GetWindow() is self._animctrl:
+                self.DeleteItemWindow(self._animated_node)
             else:
-                img = os.path.join(_BASE, 'robot-pause.gif')
-            ani = Animation(img)
-            obj = self
-            rect = (node.GetX()+20, node.GetY())  # Overlaps robot icon
-            self._animctrl = AnimationCtrl(obj, -1, ani, rect)
-            """
-            self._animctrl.SetBackgroundColour(obj.GetBackgroundColour())
-            """
-            self._animctrl.SetBackgroundColour('white')
-            self.SetItemWindow(node, self._animctrl, False)
-            self._animctrl.Play()
-        # Make visible the running or paused test
-        parent = node.GetParent()
-        self.EnsureVisible(parent)  # DEBUG add animation to parent if suite setup/teardown started
-        self.ExpandAllChildren(parent)
-        self.EnsureVisible(node)
-        self.ExpandAllChildren(node)
-        self.Update()
+                self._animctrl.Destroy()
+        self._animctrl = None
+        self._animated_node = None
+        self._animated_index = None
 
     def _get_icon_index_for(self, controller):
         if not self._execution_results:
@@ -448,9 +511,12 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
 
     def _clear_tree_data(self):
         self.DeleteAllItems()
+        self._animctrl = None
+        self._animated_node = None
         self.root = self.AddRoot('')
         self._resource_root = self._create_resource_root()
         self.datafile_nodes = []
+        self._unrendered_datafiles = {}
         self._resources = []
         self.controller.clear_history()
 
@@ -472,7 +538,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
 
     def _resource_added(self, message):
         ctrl = message.datafile
-        if self.controller.find_node_by_controller(ctrl):
+        if self._is_rendered_on_expand(ctrl) or self.controller.find_node_by_controller(ctrl):
             return
         if ctrl.parent:
             parent = self._get_dir_node(ctrl.parent)
@@ -494,7 +560,10 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         self.select_controller_node(message.item)
 
     def select_controller_node(self, controller):
-        self.SelectItem(self.controller.find_node_by_controller(controller))
+        node = self.controller.find_node_by_controller(controller)
+        if node is None and self._is_rendered_on_expand(controller):
+            node = self._get_datafile_node(controller.data)
+        self.SelectItem(node)
 
     def _suite_added(self, message):
         self.add_datafile(message.parent, message.suite)
@@ -518,11 +587,42 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         if controller.dirty:
             self.controller.mark_node_dirty(node)
         self.datafile_nodes.append(node)
+        self.controller.register_datafile_node(node, controller)
         self.SetItemHasChildren(node, True)
+        # Nodes of child data files are created when the node is expanded
+        if controller.children:
+            self._unrendered_datafiles[id(controller)] = (controller, node)
+        return node
 
-        for child in controller.children:
+    def _render_datafile_children(self, node):
+        handler = self.controller.get_handler(node)
+        entry = handler and self._unrendered_datafiles.get(id(handler.controller))
+        if not entry or entry[1] is not node:
+            return
+        del self._unrendered_datafiles[id(handler.controller)]
+        for child in handler.controller.children:
             self._render_datafile(node, child)
-        return node
+
+    def _is_rendered_on_expand(self, controller):
+        """Returns True if the node of `controller` is not yet created,
+        because a data file node above it has not been expanded."""
+        parent = controller.parent
+        while parent:
+            entry = self._unrendered_datafiles.get(id(parent))
+            if entry and entry[0] is parent:
+                return True
+            parent = parent.parent
+        return False
+
+    def _render_datafile_path(self, datafile):
+        """Creates the child data file nodes of the node above `datafile`
+        whose children are not yet rendered. Returns False if there is no such
+        node."""
+        for controller, node in list(self._unrendered_datafiles.values()):
+            if any(df.data == datafile for df in controller.iter_datafiles()):
+                self._render_datafile_children(node)
+                return True
+        return False
 
     @staticmethod
     def _normalize(path):
@@ -542,6 +642,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
             self.SetItemTextColour(node, TREETEXTCOLOUR)  # wxPython3 hack
         action_handler = handler_class(controller, self, node, self.controller.settings)
         self.SetPyData(node, action_handler)
+        self.controller.register_node(node, controller)
 
         # if we have a TestCase node we have to make sure that
         # we retain the checked state
@@ -561,6 +662,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         self.Expand(node)
 
     def _render_children(self, node):
+        self._render_datafile_children(node)
         handler = self.controller.get_handler(node)
         if not handler or not handler.can_be_rendered:
             return
@@ -569,9 +671,13 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         handler.set_rendered()
 
     def _create_child_nodes(self, node, handler, predicate):
+        # All the children are inserted to the same place, each one after the
+        # previous, so the place is looked up only once
+        index = self._get_insertion_index(node, predicate)
         for childitem in self._children_of(handler):
-            index = self._get_insertion_index(node, predicate)
-            self._create_node_with_handler(node, childitem, index)
+            child = self._create_node_with_handler(node, childitem, index)
+            if child and index is not None:
+                index = child
 
     @staticmethod
     def _children_of(handler):
@@ -662,6 +768,8 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
 
     def _datafile_removed(self, message):
         dfnode = self._get_datafile_node(message.datafile.data)
+        if dfnode is None:
+            return
         self.datafile_nodes.remove(dfnode)
         self.DeleteChildren(dfnode)
         self.Delete(dfnode)
@@ -672,6 +780,8 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
     def _filename_changed(self, message):
         df = message.datafile
         node = self.controller.find_node_by_controller(df)
+        if not node and self._is_rendered_on_expand(df):
+            return
         if not node:
             raise AssertionError('No node found with controller "%s"' % df)
         wx.CallAfter(self.SetItemText, node, df.display_name)
@@ -730,10 +840,12 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
             self.SelectItem(node)
 
     def _get_datafile_node(self, datafile):
-        for node in self.datafile_nodes:
-            if self.controller.get_handler(node).item == datafile:
-                return node
-        return None
+        if datafile is None:
+            return None
+        node = self.controller.find_datafile_node(datafile)
+        while node is None and self._render_datafile_path(datafile):
+            node = self.controller.find_datafile_node(datafile)
+        return node
 
     def get_selected_datafile(self):
         """Returns currently selected data file.
@@ -761,8 +873,10 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         node = self.GetSelection()
         if not node or node in (self._resource_root, self.root):
             return None
-        while node not in self.datafile_nodes:
+        while not self.controller.is_datafile_node(node):
             node = self.GetItemParent(node)
+            if not node:
+                return None
         return node
 
     def get_selected_item(self):
@@ -860,10 +974,8 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         return self.GetItemText(item)
 
     def _get_data_controller_node(self, controller):
-        for node in self.datafile_nodes:
-            if self.GetItemData(node).controller == controller:
-                return node
-        return None
+        node = self.controller.find_node_by_controller(controller)
+        return node if self.controller.is_datafile_node(node) else None
 
     @staticmethod
     def _click_on_item(item, flags):
@@ -877,7 +989,7 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
 
     def _remove_datafile_node(self, node):
         for child in self.GetItemChildren(node):
-            if child in self.datafile_nodes:
+            if self.controller.is_datafile_node(child):
                 self._remove_datafile_node(child)
         self.datafile_nodes.remove(node)
         self.Delete(node)
@@ -931,6 +1043,10 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         self._hide_item(item)
         event.Skip()
 
+    def SetItemText(self, item, text):  # Overrides wx method
+        customtreectrl.CustomTreeCtrl.SetItemText(self, item, text)
+        self.controller.label_changed(item)
+
     def _hide_item(self, item):
         for item in item.GetChildren():
             itemwindow = item.GetWindow()
@@ -1012,6 +1128,15 @@ class Tree(treemixin.DragAndDrop, customtreectrl.CustomTreeCtrl, wx.Panel):
         print("DEBUG: Tree OnClose hidding")
         self.Hide()
 
+    def on_delete_item(self, event):
+        node = event.GetItem()
+        handler = self.controller.get_handler(node)
+        entry = handler and self._unrendered_datafiles.get(id(handler.controller))
+        if entry and entry[1] is node:
+            del self._unrendered_datafiles[id(handler.controller)]
+        self.controller.unregister_node(node)
+        event.Skip()
+
     def on_tree_item_checked(self, event):
         node: GenericTreeItem = event.GetItem()
         handler: TestCaseHandler = self.controller.get_handler(node=node)
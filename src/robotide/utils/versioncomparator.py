@@ -13,15 +13,29 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-try:
-    from pkg_resources import parse_version
-except ImportError:
+_PARSE_VERSION = None
+
+
+def parse_version(version):
+    # pkg_resources is slow to import, so it is imported only when versions
+    # are compared for the first time.
+    global _PARSE_VERSION
+    if _PARSE_VERSION is None:
+        _PARSE_VERSION = _import_parse_version()
+    return _PARSE_VERSION(version)
+
+
+def _import_parse_version():
     try:
-        from packaging.version import parse as parse_version
-    except ImportError as e:
-        print("RIDE cannot verify versions upgrade because of missing packages."
-              "You can install missing package with:\npip install packaging\nor\npip install setuptools")
-        raise e
+        from pkg_resources import parse_version as parse
+    except ImportError:
+        try:
+            from packaging.version import parse
+        except ImportError as e:
+            print("RIDE cannot verify versions upgrade because of missing packages."
+                  "You can install missing package with:\npip install packaging\nor\npip install setuptools")
+            raise e
+    return parse
 
 
 def cmp_versions(version1, version2):
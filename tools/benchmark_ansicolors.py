@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Micro-benchmark of parsing colored Robot Framework console output.
+
+Usage: benchmark_ansicolors.py [megabytes] [captured_output_file]
+
+Without a file, console output of a colored robot run is generated.
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..', 'src'))
+
+from robotide.contrib.testrunner.ansicolors import split_colors, GREEN, RED, YELLOW
+
+STYLES = {RED: 4, GREEN: 1, YELLOW: 3}
+SEPARATOR = b'-' * 78 + b'\n'
+STATUSES = [b'\x1b[32mPASS\x1b[0m', b'\x1b[31mFAIL\x1b[0m', b'\x1b[33mSKIP\x1b[0m']
+
+
+def generated_output(size):
+    lines = []
+    total = index = 0
+    while total < size:
+        name = b'Test case number %d with a longish name' % index
+        test = [name.ljust(70) + b'| ' + STATUSES[index % 7 % 3] + b' |\n']
+        if index % 7 == 1:
+            test.append(b'Expected failure message of test %d\n' % index)
+        test.append(SEPARATOR)
+        lines.extend(test)
+        total += sum(len(line) for line in test)
+        index += 1
+    return b''.join(lines)
+
+
+def chunks(data, size=4096):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def main(megabytes=4, path=None):
+    if path:
+        with open(path, 'rb') as output:
+            data = output.read()
+    else:
+        data = generated_output(int(float(megabytes) * 1024 * 1024))
+    parts = chunks(data)
+    start = time.perf_counter()
+    for part in parts:
+        split_colors(part, STYLES, 0)
+    elapsed = time.perf_counter() - start
+    print('%.1f MB in %d chunks: %.3f s (%.1f MB/s)'
+          % (len(data) / 1024.0 / 1024, len(parts), elapsed,
+             len(data) / 1024.0 / 1024 / elapsed))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
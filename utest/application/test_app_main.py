@@ -91,6 +91,15 @@ class TestMain(unittest.TestCase):
         assert (noupdatecheck, debug_console, inpath) == (False, False, None)
         noupdatecheck, debug_console, inpath = _parse_args(args=('--garbagein', '--garbageout'))
         assert (noupdatecheck, debug_console, inpath) == (False, False, '--garbageout')  # returns always last arg
+        noupdatecheck, debug_console, inpath = _parse_args(args=('--noupdatecheck', '--profile-startup'))
+        assert (noupdatecheck, debug_console, inpath) == (True, False, None)
+
+    def test_parse_profile_args(self):
+        from robotide import _parse_profile_args
+        assert _parse_profile_args(args=None) == (False, None)
+        assert _parse_profile_args(args=('--noupdatecheck', 'no file')) == (False, None)
+        assert _parse_profile_args(args=('--profile-startup', 'no file')) == (True, None)
+        assert _parse_profile_args(args=('--profile-startup=ride.prof',)) == (True, 'ride.prof')
 
     def test_run_call_with_fail_import(self):
         import robotide.application
@@ -118,7 +127,7 @@ class TestMain(unittest.TestCase):
 
             class SideEffect(RIDE):
 
-                def __init__(self, path=None, updatecheck=True):
+                def __init__(self, path=None, updatecheck=True, profile=None):
                     self.frame = wx.Frame(None)
 
                 def OnInit(self):  # Overrides wx method
@@ -152,7 +161,7 @@ class TestMain(unittest.TestCase):
 
             class SideEffect(RIDE):
 
-                def __init__(self, path=None, updatecheck=True):
+                def __init__(self, path=None, updatecheck=True, profile=None):
                     self.frame = wx.Frame(None)
 
                 def OnInit(self):
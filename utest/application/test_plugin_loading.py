@@ -31,8 +31,12 @@ LOGGER = _Log()
 robotide.context.LOG = LOGGER
 
 
+from robotide.action import ActionInfo
+from robotide.application.pluginconnector import LazyPlugin
 from robotide.application.pluginloader import PluginLoader
 from robotide.log import LogPlugin
+from robotide.pluginapi import Plugin
+from robotide.publish import PUBLISHER, RideParserLogMessage
 from utest.resources import FakeApplication, FakeSettings
 
 robotide.application.pluginconnector.SETTINGS = FakeSettings()
@@ -88,6 +92,118 @@ class TestPluginLoader(unittest.TestCase):
         return None
 
 
+class LazyExamplePlugin(Plugin):
+    created = 0
+
+    def __init__(self, application):
+        Plugin.__init__(self, application)
+        LazyExamplePlugin.created += 1
+        self.messages = []
+
+    def enable(self):
+        self.register_action(ActionInfo('Tools', 'Lazy Example', self.on_menu))
+        self.subscribe(self.on_message, RideParserLogMessage)
+
+    def disable(self):
+        self.unregister_actions()
+        self.unsubscribe_all()
+
+    def on_message(self, message):
+        self.messages.append(message.message)
+
+    def on_menu(self, event):
+        self.messages.append('menu')
+
+
+class _FakeActions(object):
+    """Runs all actions registered with the same name, like the real menus."""
+
+    def __init__(self):
+        self.by_name = {}
+
+    def register_action(self, info):
+        action = _FakeAction(info, self.by_name.setdefault(info.name, []))
+        action.actions.append(action)
+        return action
+
+    def trigger(self, name):
+        for action in self.by_name.get(name, []):
+            action.info.action(None)
+
+
+class _FakeAction(object):
+
+    def __init__(self, info, actions):
+        self.info = info
+        self.actions = actions
+
+    def unregister(self):
+        self.actions.remove(self)
+
+
+class _FakeFrame(object):
+
+    def __init__(self):
+        self.actions = _FakeActions()
+
+
+class TestLazyPlugins(unittest.TestCase):
+
+    def setUp(self):
+        LazyExamplePlugin.created = 0
+        lazy = LazyPlugin(__name__, 'LazyExamplePlugin',
+                          actions=[('Tools', 'Lazy Example', 'on_menu', 99)],
+                          topics=[(RideParserLogMessage, 'on_message')])
+        app = FakeApplication()
+        app.frame = self.frame = _FakeFrame()
+        app.settings['Plugins'].add_section(lazy.name).set('_enabled', True)
+        self.loader = PluginLoader(app, [], [], [lazy])
+        self.plugin = self.loader.plugins[0]
+
+    def tearDown(self):
+        for p in self.loader.plugins:
+            p.disable()
+        PUBLISHER.unsubscribe_all()
+
+    def test_plugin_is_not_created_when_enabled(self):
+        self.loader.enable_plugins()
+        assert self.plugin.name == 'Lazy Example'
+        assert self.plugin.enabled
+        assert not self.plugin.activated
+        assert self.plugin.conn_plugin is None
+        assert LazyExamplePlugin.created == 0
+
+    def test_first_message_activates_plugin(self):
+        self.loader.enable_plugins()
+        RideParserLogMessage('first').publish()
+        assert self.plugin.activated
+        assert self.plugin.conn_plugin.messages == ['first']
+        RideParserLogMessage('second').publish()
+        assert self.plugin.conn_plugin.messages == ['first', 'second']
+        assert LazyExamplePlugin.created == 1
+
+    def test_menu_action_runs_plugin_once_per_trigger(self):
+        self.loader.enable_plugins()
+        self.frame.actions.trigger('Lazy Example')
+        assert self.plugin.conn_plugin.messages == ['menu']
+        self.frame.actions.trigger('Lazy Example')
+        assert self.plugin.conn_plugin.messages == ['menu', 'menu']
+        assert len(self.frame.actions.by_name['Lazy Example']) == 1
+
+    def test_activating_plugin_explicitly(self):
+        self.loader.enable_plugins()
+        plugin = self.plugin.activate()
+        assert isinstance(plugin, LazyExamplePlugin)
+        assert self.plugin.activate() is plugin
+
+    def test_disabled_plugin_is_not_activated_by_messages(self):
+        self.loader.enable_plugins()
+        self.plugin.disable()
+        RideParserLogMessage('ignored').publish()
+        assert not self.plugin.activated
+        assert LazyExamplePlugin.created == 0
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,78 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import pstats
+import tempfile
+import unittest
+from io import StringIO
+
+from robotide.application.startupprofile import StartupProfile
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def test_disabled_profile_records_nothing(self):
+        profile = StartupProfile()
+        with profile.phase('Settings'):
+            pass
+        output = StringIO()
+        profile.finish(output)
+        assert profile.phases == []
+        assert output.getvalue() == ''
+
+    def test_nested_phases_are_reported_in_order(self):
+        profile = StartupProfile(enabled=True)
+        with profile.phase('Plugin enabling'):
+            with profile.phase('Log'):
+                pass
+            with profile.phase('Editor'):
+                pass
+        with profile.phase('Data loading'):
+            pass
+        self.assertEqual([(depth, name) for depth, name, _ in profile.phases],
+                         [(0, 'Plugin enabling'), (1, 'Log'), (1, 'Editor'), (0, 'Data loading')])
+        output = StringIO()
+        profile.finish(output)
+        lines = output.getvalue().splitlines()
+        assert lines[0].startswith('RIDE startup took ')
+        assert lines[1].endswith(' ms  Plugin enabling')
+        assert lines[2].endswith(' ms    Log')
+
+    def test_phase_failing_is_recorded(self):
+        profile = StartupProfile(enabled=True)
+        with self.assertRaises(ValueError):
+            with profile.phase('Failing'):
+                raise ValueError
+        assert profile.phases[0][2] is not None
+
+    def test_profile_statistics_are_written_to_file(self):
+        path = os.path.join(tempfile.gettempdir(), 'ride_startup_test.prof')
+        try:
+            profile = StartupProfile(profile_path=path)
+            assert profile.enabled
+            with profile.phase('Sorting'):
+                sorted(range(100))
+            output = StringIO()
+            profile.finish(output)
+            assert pstats.Stats(path).total_calls > 0
+            assert output.getvalue().endswith('Profile written to %s\n' % path)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
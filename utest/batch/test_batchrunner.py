@@ -0,0 +1,122 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+from robotide.batch import BatchError, BatchRunner, parse_script
+from robotide.spec.librarymanager import LibraryManager
+from utest.resources import FakeSettings
+from utest.resources.datafilereader import SIMPLE_TEST_SUITE_PATH
+
+
+class TestParseScript(unittest.TestCase):
+
+    def test_text_script(self):
+        commands = parse_script('# comment\n\nrename keyword    Old    New\n'
+                                'sort tests\n  find usages\tMy Keyword  \n')
+        self.assertEqual(commands, [['rename keyword', 'Old', 'New'], ['sort tests'],
+                                    ['find usages', 'My Keyword']])
+
+    def test_json_script(self):
+        commands = parse_script('[{"command": "rename keyword", "args": ["Old", "New"]},'
+                                ' ["sort tests"], {"command": "save"}]', json_format=True)
+        self.assertEqual(commands, [['rename keyword', 'Old', 'New'], ['sort tests'], ['save']])
+
+    def test_invalid_json_script(self):
+        for content in ['[', '{"command": "save"}', '[{"args": []}]', '[["save", 1]]']:
+            self.assertRaises(BatchError, parse_script, content, json_format=True)
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.datapath = os.path.join(tempfile.mkdtemp(), 'suite')
+        shutil.copytree(SIMPLE_TEST_SUITE_PATH, self.datapath)
+        self.output = StringIO()
+        self.runner = self._load()
+
+    def tearDown(self):
+        self.runner.close()
+        shutil.rmtree(os.path.dirname(self.datapath))
+
+    def _load(self, dry_run=False):
+        runner = BatchRunner(FakeSettings(), self.output, StringIO(), dry_run)
+        library_manager = LibraryManager(':memory:')
+        library_manager.create_database()
+        runner.load(self.datapath, library_manager)
+        return runner
+
+    def _read(self, name):
+        with open(os.path.join(self.datapath, name)) as source:
+            return source.read()
+
+    def test_loading_is_reported(self):
+        self.assertIn('Loaded 9 files with 5 tests and 16 keywords', self.output.getvalue())
+
+    def test_loading_invalid_path_fails(self):
+        self.datapath = os.path.join(self.datapath, 'nonexisting.robot')
+        self.assertRaises(BatchError, self._load)
+        self.datapath = os.path.dirname(self.datapath)
+
+    def test_rename_keyword_and_save(self):
+        self.runner.run([['rename keyword', 'My Keyword', 'Renamed Keyword'], ['save']])
+        self.assertIn('Renamed Keyword', self._read('TestSuite3.robot'))
+        self.assertNotIn('My Keyword', self._read('TestSuite3.robot'))
+        self.assertIn('Saved 1 files', self.output.getvalue())
+
+    def test_rename_test(self):
+        self.runner.execute('Rename  Test', 'TestSuite1.robot::My Test', 'First Test')
+        self.runner.save()
+        self.assertIn('First Test', self._read('TestSuite1.robot'))
+
+    def test_sort_keywords(self):
+        self.runner.execute('sort keywords', 'TestSuite2.robot')
+        controller = self.runner._find_datafile('TestSuite2.robot')
+        self.assertEqual([kw.name for kw in controller.keywords][:3],
+                         ['Keyword Teardown Keyword', 'Log', 'Suite Setup Keyword'])
+        self.assertTrue(controller.dirty)
+
+    def test_find_usages(self):
+        occurrences = self.runner.execute('find usages', 'None Keyword')
+        self.assertTrue(occurrences)
+        self.assertIn("usages of keyword 'None Keyword'", self.output.getvalue())
+
+    def test_extract_keyword(self):
+        self.runner.execute('extract keyword', 'TestSuite2.robot::My Test', '1', '2', 'Extracted')
+        controller = self.runner._find_datafile('TestSuite2.robot')
+        self.assertEqual(controller.tests[0].steps[0].as_list(), ['Extracted'])
+        self.assertIn('Extracted', [kw.name for kw in controller.keywords])
+
+    def test_dry_run_does_not_save(self):
+        self.runner.close()
+        self.runner = self._load(dry_run=True)
+        original = self._read('TestSuite1.robot')
+        self.runner.run([['rename test', 'TestSuite1.robot::My Test', 'First Test'], ['save']])
+        self.assertEqual(self._read('TestSuite1.robot'), original)
+        self.assertIn('Not saving 1 changed files in dry run', self.output.getvalue())
+
+    def test_invalid_commands(self):
+        for command in [['unknown'], ['rename test', 'TestSuite1.robot::My Test'],
+                        ['rename test', 'My Test', 'New'], ['rename test', 'Nonex.robot::My Test', 'New'],
+                        ['extract keyword', 'TestSuite2.robot::My Test', '1', '99', 'New'],
+                        ['change format', 'doc']]:
+            self.assertRaises(BatchError, self.runner.execute, *command)
+
+
+if __name__ == '__main__':
+    unittest.main()
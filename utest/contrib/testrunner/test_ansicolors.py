@@ -0,0 +1,74 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.contrib.testrunner.ansicolors import join_colors, split_colors, BLUE, GREEN, RED
+
+STYLES = {RED: 4, GREEN: 1}
+
+
+class TestSplitColors(unittest.TestCase):
+
+    def test_text_without_colors(self):
+        assert split_colors(b'plain', STYLES, 0) == (b'plain', b'\x00' * 5)
+        assert split_colors('plain', STYLES, 2) == ('plain', b'\x02' * 5)
+
+    def test_colors_are_removed_and_styled(self):
+        text, styling = split_colors(b'Test | \x1b[32mPASS\x1b[0m |\n', STYLES, 0)
+        assert text == b'Test | PASS |\n'
+        assert styling == b'\x00' * 7 + b'\x01' * 4 + b'\x00' * 3
+
+    def test_unknown_codes_use_default_style(self):
+        text, styling = split_colors('\x1b[34mab\x1b[1;31mcd\x1b[0m', STYLES, 0)
+        assert text == 'abcd'
+        assert styling == b'\x00\x00\x04\x04'
+
+    def test_styling_is_per_utf8_byte(self):
+        text, styling = split_colors(u'\x1b[31m\xe4\x1b[0ma', STYLES, 0)
+        assert text == u'\xe4a'
+        assert styling == b'\x04\x04\x00'
+
+
+class TestJoinColors(unittest.TestCase):
+    codes = dict((style, code) for code, style in STYLES.items())
+
+    def test_text_without_styles(self):
+        assert join_colors(b'plain', b'\x00' * 5, self.codes, 0) == b'plain'
+
+    def test_styles_are_written_as_colors(self):
+        colored = join_colors(b'Test | PASS |\n', b'\x00' * 7 + b'\x01' * 4 + b'\x00' * 3,
+                              self.codes, 0)
+        assert colored == b'Test | \x1b[32mPASS\x1b[0m |\n'
+
+    def test_styles_without_color_use_reset(self):
+        assert join_colors(b'ab', b'\x04\x03', self.codes, 0) == b'\x1b[31ma\x1b[0mb'
+
+    def test_color_is_repeated_on_every_line(self):
+        colored = join_colors(b'one\ntwo\nend', b'\x04' * 8 + b'\x00' * 3, self.codes, 0)
+        assert colored == b'\x1b[31mone\n\x1b[31mtwo\n\x1b[31m\x1b[0mend'
+        assert split_colors(colored.split(b'\n', 1)[1], STYLES, 0) == \
+            (b'two\nend', b'\x04' * 4 + b'\x00' * 3)
+
+    def test_split_colors_restores_styling(self):
+        styles = dict(STYLES, **{BLUE: 2})
+        text = u'\xe4 | FAIL |\nerror\n'.encode('UTF-8')
+        styling = b'\x00' * 5 + b'\x04' * 4 + b'\x00' * 3 + b'\x02' * 6
+        colored = join_colors(text, styling, dict((s, c) for c, s in styles.items()), 0)
+        assert split_colors(colored.decode('UTF-8'), styles, 0) == (text.decode('UTF-8'), styling)
+
+
+if __name__ == '__main__':
+    unittest.main()
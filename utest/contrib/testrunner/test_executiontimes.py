@@ -0,0 +1,122 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from robotide.contrib.testrunner.executiontimes import read_execution_times
+
+OLD_OUTPUT = """<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 3.2.2" generated="20200101 12:00:00.000">
+<suite id="s1" name="Root">
+<suite id="s1-s1" name="Sub">
+<test id="s1-s1-t1" name="First">
+<kw name="Sleep" library="BuiltIn">
+<arguments><arg>1s</arg></arguments>
+<msg timestamp="20200101 12:00:01.000" level="INFO">Slept 1 second</msg>
+<status status="PASS" starttime="20200101 12:00:00.000" endtime="20200101 12:00:01.000"/>
+</kw>
+<kw type="for" name="${i} IN RANGE [ 2 ]">
+<kw type="foritem" name="${i} = 0">
+<kw name="Log" library="BuiltIn">
+<status status="PASS" starttime="20200101 12:00:01.000" endtime="20200101 12:00:01.010"/>
+</kw>
+<status status="PASS" starttime="20200101 12:00:01.000" endtime="20200101 12:00:01.010"/>
+</kw>
+<status status="PASS" starttime="20200101 12:00:01.000" endtime="20200101 12:00:01.010"/>
+</kw>
+<status status="PASS" starttime="20200101 12:00:00.000" endtime="20200101 12:00:01.010" critical="yes"/>
+</test>
+<test id="s1-s1-t2" name="Second">
+<kw name="Log" library="BuiltIn">
+<status status="FAIL" starttime="20200101 12:00:01.010" endtime="20200101 12:00:01.040"/>
+</kw>
+<status status="FAIL" starttime="20200101 12:00:01.010" endtime="20200101 12:00:01.050" critical="yes">Failed</status>
+</test>
+<status status="FAIL" starttime="20200101 12:00:00.000" endtime="20200101 12:00:01.050"/>
+</suite>
+<status status="FAIL" starttime="20200101 12:00:00.000" endtime="20200101 12:00:01.050"/>
+</suite>
+<statistics></statistics>
+<errors></errors>
+</robot>
+"""
+
+NEW_OUTPUT = """<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" generated="2024-01-01T12:00:00.000000" rpa="false" schemaversion="5">
+<suite id="s1" name="Root">
+<test id="s1-t1" name="Only">
+<kw name="My Keyword" owner="resource">
+<kw name="Sleep" owner="BuiltIn">
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.250"/>
+</kw>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.300"/>
+</kw>
+<for flavor="IN">
+<iter><kw name="Sleep" owner="BuiltIn">
+<status status="PASS" start="2024-01-01T12:00:00.300000" elapsed="0.100"/>
+</kw><status status="PASS" start="2024-01-01T12:00:00.300000" elapsed="0.100"/></iter>
+<status status="PASS" start="2024-01-01T12:00:00.300000" elapsed="0.100"/>
+</for>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.400"/>
+</test>
+<status status="PASS" start="2024-01-01T12:00:00.000000" elapsed="0.400"/>
+</suite>
+</robot>
+"""
+
+
+class TestReadExecutionTimes(unittest.TestCase):
+
+    def _read(self, content):
+        fd, path = tempfile.mkstemp(suffix='.xml')
+        with os.fdopen(fd, 'w') as output:
+            output.write(content)
+        try:
+            return read_execution_times(path)
+        finally:
+            os.remove(path)
+
+    def test_tests_of_old_output(self):
+        times = self._read(OLD_OUTPUT)
+        assert list(times.tests.items()) == [('Root.Sub.First', ('PASS', 1010)),
+                                             ('Root.Sub.Second', ('FAIL', 40))]
+        assert times.get_test('Root.Sub.Second') == 40
+        assert times.get_test('Root.Sub.Third') is None
+        assert times.slowest_test == 1010
+
+    def test_keywords_of_old_output(self):
+        times = self._read(OLD_OUTPUT)
+        log = times.get_keyword('BuiltIn.Log')
+        assert (log.count, log.total, log.slowest, log.average) == (2, 40, 30, 20)
+        assert times.get_keyword('log').total == 40
+        assert times.get_keyword('${i} = 0') is None
+        assert [kw.name for kw in times.slowest_keywords()] == ['BuiltIn.Sleep', 'BuiltIn.Log']
+
+    def test_new_output(self):
+        times = self._read(NEW_OUTPUT)
+        assert times.get_test('Root.Only') == 400
+        assert times.get_keyword('Sleep').total == 350
+        assert times.get_keyword('resource.My Keyword').count == 1
+        assert times.get_keyword('my_keyword').total == 300
+
+    def test_slowest_tests(self):
+        times = self._read(OLD_OUTPUT)
+        assert times.slowest_tests(1) == [('Root.Sub.First', 1010)]
+
+
+if __name__ == '__main__':
+    unittest.main()
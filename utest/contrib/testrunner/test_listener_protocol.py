@@ -0,0 +1,124 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import socket
+import threading
+import time
+import unittest
+
+from robotide.contrib.testrunner.TestRunnerAgent import (BinaryStreamHandler, EventFilter,
+                                                         StreamHandler)
+from robotide.contrib.testrunner.testrunner import RideListenerHandler, RideListenerServer
+
+EVENTS = [('pid', (42,)),
+          ('start_test', ('Test', {'longname': 'Suite.Test'})),
+          ('log_message', ({'message': u'\xe4iti', 'level': 'INFO'},)),
+          ('end_test', ('Test', {'longname': 'Suite.Test', 'status': 'PASS'}))]
+
+
+class TestBinaryStreamHandler(unittest.TestCase):
+
+    def test_batches_are_read_back(self):
+        stream = io.BytesIO()
+        writer = BinaryStreamHandler(stream)
+        writer.start()
+        writer.dump_batch(EVENTS[:2])
+        writer.dump_batch(EVENTS[2:])
+        stream.seek(0)
+        assert stream.read(1) == BinaryStreamHandler.MAGIC
+        reader = BinaryStreamHandler(stream)
+        events = reader.load_batch() + reader.load_batch()
+        assert [(name, tuple(args)) for name, args in events] == EVENTS
+        self.assertRaises(EOFError, reader.load_batch)
+
+    def test_magic_does_not_start_json_protocol_messages(self):
+        stream = io.BytesIO()
+        StreamHandler(stream).dump(EVENTS[0])
+        assert stream.getvalue()[:1] != BinaryStreamHandler.MAGIC
+
+
+class TestEventFilter(unittest.TestCase):
+
+    def test_everything_is_sent_by_default(self):
+        event_filter = EventFilter()
+        assert event_filter.log_message('TRACE')
+        assert event_filter.start_keyword() and event_filter.start_keyword()
+        assert event_filter.end_keyword() and event_filter.end_keyword()
+
+    def test_log_level(self):
+        event_filter = EventFilter({'log_level': 2})
+        assert not event_filter.log_message('DEBUG')
+        assert event_filter.log_message('INFO')
+        assert event_filter.log_message('WARN')
+
+    def test_keyword_events_off(self):
+        event_filter = EventFilter({'keywords': False})
+        assert not event_filter.start_keyword()
+        assert not event_filter.end_keyword()
+
+    def test_keyword_sampling_sends_end_only_for_sent_start(self):
+        event_filter = EventFilter({'keyword_interval': 60})
+        assert event_filter.start_keyword()
+        assert not event_filter.start_keyword()
+        assert not event_filter.end_keyword()
+        assert event_filter.end_keyword()
+
+
+class TestRideListenerHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        self.server = RideListenerServer(RideListenerHandler, self._callback)
+        self.thread = threading.Thread(target=self.server.handle_request)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.server_close()
+
+    def _callback(self, name, *args):
+        self.events.append((name, args))
+
+    def _send(self, write):
+        sock = socket.create_connection(('localhost', self.server.server_address[1]))
+        fp = sock.makefile('wb')
+        write(fp)
+        fp.close()
+        sock.close()
+        self.thread.join(5)
+        # Connections are handled in their own threads
+        deadline = time.time() + 5
+        while len(self.events) < len(EVENTS) and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_binary_protocol(self):
+        def write(fp):
+            handler = BinaryStreamHandler(fp)
+            handler.start()
+            handler.dump_batch(EVENTS)
+        self._send(write)
+        assert [(name, tuple(args)) for name, args in self.events] == EVENTS
+
+    def test_json_protocol_is_used_as_fallback(self):
+        def write(fp):
+            handler = StreamHandler(fp)
+            for event in EVENTS:
+                handler.dump(event)
+        self._send(write)
+        assert [(name, tuple(args)) for name, args in self.events] == EVENTS
+
+
+if __name__ == '__main__':
+    unittest.main()
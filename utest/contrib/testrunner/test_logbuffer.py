@@ -0,0 +1,57 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.contrib.testrunner.logbuffer import SpillFile
+
+
+class TestSpillFile(unittest.TestCase):
+
+    def setUp(self):
+        self.spill = SpillFile()
+
+    def tearDown(self):
+        self.spill.clear()
+
+    def test_empty(self):
+        assert self.spill.size == 0
+        assert self.spill.pop(100) == ''
+
+    def test_newest_text_is_popped_first(self):
+        self.spill.push('first line\n')
+        self.spill.push('second line\n')
+        assert self.spill.pop(12) == 'second line\n'
+        assert self.spill.pop(100) == 'first line\n'
+        assert self.spill.size == 0
+
+    def test_pop_starts_from_line_start(self):
+        self.spill.push('first line\nsecond line\nthird line\n')
+        assert self.spill.pop(15) == 'third line\n'
+        assert self.spill.pop(100) == 'first line\nsecond line\n'
+
+    def test_pop_does_not_split_multibyte_characters(self):
+        self.spill.push(u'\xe4\xe4\xe4\xe4')
+        assert self.spill.pop(5) == u'\xe4\xe4'
+        assert self.spill.pop(5) == u'\xe4\xe4'
+
+    def test_clear(self):
+        self.spill.push('text')
+        self.spill.clear()
+        assert self.spill.size == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import threading
 import unittest
+from unittest import mock
 import time
 from robot.version import VERSION
 from utest.resources import datafilereader
 
 from robotide.contrib.testrunner.testrunner import Process
+from robotide.contrib.testrunner.Process import ProcessGroup, StreamReaderThread
 
 if VERSION >= '4.0':
     console_out = b"==============================================================================\n" \
@@ -97,5 +101,120 @@ class ProcessUnicodeTestCase(unittest.TestCase):
         pass
 
 
+class StreamReaderThreadTestCase(unittest.TestCase):
+
+    def test_data_is_collected_and_receiver_notified_once_per_batch(self):
+        read_fd, write_fd = os.pipe()
+        notifications = []
+        with os.fdopen(read_fd, 'rb', 0) as stream:
+            reader = StreamReaderThread(stream, lambda: notifications.append(1))
+            reader.run()
+            os.write(write_fd, b'first\n')
+            self._wait_until(lambda: notifications)
+            os.write(write_fd, b'second\n')
+            os.close(write_fd)
+            reader.join(5)
+            assert reader.pop() == b'first\nsecond\n'
+            assert reader.pop() == b''
+            assert len(notifications) == 1
+
+    def test_incomplete_utf8_character_and_escape_sequence_are_kept(self):
+        text = 'ä € \x1b[31mred\x1b[0m'.encode('UTF-8')
+        for split in range(1, len(text)):
+            read_fd, write_fd = os.pipe()
+            notifications = []
+            with os.fdopen(read_fd, 'rb', 0) as stream:
+                reader = StreamReaderThread(stream, lambda: notifications.append(1))
+                reader.run()
+                os.write(write_fd, text[:split])
+                self._wait_until(lambda: notifications)
+                first = reader.pop()
+                first.decode('UTF-8')
+                assert not first.endswith((b'\x1b', b'\x1b[', b'\x1b[3', b'\x1b[31', b'\x1b[0'))
+                os.write(write_fd, text[split:])
+                os.close(write_fd)
+                reader.join(5)
+                assert first + reader.pop() == text
+
+    def test_incomplete_end_is_returned_when_stream_ends(self):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, 'rb', 0) as stream:
+            reader = StreamReaderThread(stream)
+            reader.run()
+            os.write(write_fd, b'text \xe2\x82 \x1b[3')
+            os.close(write_fd)
+            reader.join(5)
+            assert reader.pop() == b'text \xe2\x82 \x1b[3'
+
+    def test_exit_is_notified_after_output_is_read(self):
+        ended = threading.Event()
+        outputs = []
+        process = Process('.', on_exit=lambda: (outputs.append(process.get_output()),
+                                                ended.set()))
+        process.run_command('echo hello')
+        assert ended.wait(7)
+        assert outputs[0].strip() == b'hello'
+
+    @staticmethod
+    def _wait_until(condition):
+        for _ in range(70):
+            if condition():
+                return
+            time.sleep(0.1)
+        raise AssertionError('condition not met in 7 seconds')
+
+
+class ProcessGroupTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ended = threading.Event()
+        self.group = ProcessGroup('.', on_exit=self.ended.set)
+
+    def test_final_command_is_run_after_all_commands(self):
+        self.group.run_commands(['echo first', 'echo second'],
+                                final_command=lambda: 'echo final')
+        assert self.ended.wait(7)
+        assert not self.group.is_alive()
+        output = self.group.get_output().split()
+        assert sorted(output[:2]) == [b'first', b'second']
+        assert output[2:] == [b'final']
+        assert self.group.get_returncode() == 0
+
+    def test_without_final_command_return_code_is_the_worst(self):
+        self.group.run_commands(['exit 0', 'exit 3'])
+        assert self.ended.wait(7)
+        assert self.group.get_returncode() == 3
+
+    def test_final_command_is_skipped_when_none(self):
+        self.group.run_commands(['exit 2'], final_command=lambda: None)
+        assert self.ended.wait(7)
+        assert self.group.get_returncode() == 2
+
+    def test_non_existing_executable(self):
+        self.group.run_commands(['echo first', 'non_existing_executable_for_ride_test'],
+                                final_command=lambda: None)
+        assert self.ended.wait(7)
+        assert not self.group.is_alive()
+        assert self.group.get_returncode() != 0
+
+    def test_processes_are_killed_when_command_can_not_be_started(self):
+        original = Process.run_command
+
+        def run_command(process, command, env=None):
+            if command == 'cannot start':
+                raise OSError('No such file or directory')
+            original(process, command, env)
+
+        # `exec` so that killing the shell also ends the sleep keeping the output open
+        with mock.patch.object(Process, 'run_command', run_command):
+            with self.assertRaises(OSError):
+                self.group.run_commands(['exec sleep 30', 'cannot start', 'echo not started'],
+                                        final_command=lambda: 'echo final')
+        assert self.ended.wait(7)
+        assert not self.group.is_alive()
+        assert b'final' not in self.group.get_output()
+        assert b'not started' not in self.group.get_output()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from robotide.controller.ctrlcommands import ChangeCellValue
+from robotide.contrib.testrunner.resultstore import (FAIL, PASS, ResultStore,
+                                                     hash_test_content, hash_tests_content,
+                                                     model_longname)
+from utest.resources import datafilereader
+
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'results', 'project.json')
+        self.store = ResultStore(self.path)
+        self.store.set_result('S.Passing', PASS, 100, 'a')
+        self.store.set_result('S.Failing', FAIL, 3000, 'b')
+        self.store.set_result('S.Slow', PASS, 5000, 'c')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_results_are_persisted(self):
+        self.store.save()
+        store = ResultStore(self.path)
+        assert store.get_status('S.Failing') == FAIL
+        assert store.get_elapsed('S.Slow') == 5000
+        assert store.get_status('S.Unknown') is None
+
+    def test_corrupted_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as results_file:
+            results_file.write('{not json')
+        assert ResultStore(self.path).get_status('S.Failing') is None
+
+    def test_failed(self):
+        assert self.store.failed(['S.Passing', 'S.Failing', 'S.New']) == ['S.Failing']
+
+    def test_changed_includes_tests_never_run(self):
+        hashes = [('S.Passing', 'a'), ('S.Failing', 'changed'), ('S.New', 'd')]
+        assert self.store.changed(hashes) == ['S.Failing', 'S.New']
+
+    def test_slowest_first(self):
+        names = ['S.Passing', 'S.Failing', 'S.New', 'S.Slow']
+        assert self.store.slowest_first(names) == ['S.New', 'S.Slow', 'S.Failing', 'S.Passing']
+
+
+class TestContentHash(unittest.TestCase):
+
+    def setUp(self):
+        self.project = datafilereader.construct_project(datafilereader.SIMPLE_PROJECT)
+        self.datafile = self.project.datafiles[0]
+        self.test = self.datafile.tests[0]
+
+    def test_hash_is_stable(self):
+        assert hash_test_content(self.test) == hash_test_content(self.test)
+
+    def test_hash_changes_with_test_content(self):
+        original = hash_test_content(self.test)
+        self.test.execute(ChangeCellValue(0, 1, 'other argument'))
+        assert hash_test_content(self.test) != original
+
+    def test_hash_changes_with_keywords_of_the_same_file(self):
+        original = hash_test_content(self.test)
+        keyword = self.test.datafile_controller.keywords[0]
+        keyword.execute(ChangeCellValue(0, 0, 'Comment'))
+        assert hash_test_content(self.test) != original
+
+    def test_hashes_of_many_tests_are_same_as_separate_hashes(self):
+        tests = list(self.datafile.tests) * 2
+        hashes = hash_tests_content(tests)
+        assert hashes == [(test.longname, hash_test_content(test)) for test in tests]
+        assert len(set(content_hash for _, content_hash in hashes)) == len(self.datafile.tests)
+
+    def test_file_content_is_hashed_once_per_file(self):
+        file_digests = {}
+        for test in self.datafile.tests:
+            hash_test_content(test, file_digests)
+        assert list(file_digests) == [id(self.test.datafile)]
+
+    def test_results_of_renamed_top_level_suite_match_hashes(self):
+        suite = self.project.controller.longname
+        hashes = hash_tests_content(self.datafile.tests)
+        store = ResultStore(os.path.join(tempfile.gettempdir(), 'not_saved.json'))
+        for longname, content_hash in hashes:
+            name = model_longname('Renamed' + longname[len(suite):], 'Renamed', suite)
+            store.set_result(name, FAIL, 1, dict(hashes)[name])
+        assert store.changed(hashes) == []
+        assert store.failed([name for name, _ in hashes]) == [name for name, _ in hashes]
+
+
+class TestModelLongname(unittest.TestCase):
+
+    def test_top_level_suite_name_is_replaced(self):
+        assert model_longname('Renamed.Sub.Test', 'Renamed', 'Top') == 'Top.Sub.Test'
+
+    def test_name_is_kept_when_suite_is_not_renamed(self):
+        assert model_longname('Top.Sub.Test', 'Top', 'Top') == 'Top.Sub.Test'
+        assert model_longname('Top.Sub.Test', None, 'Top') == 'Top.Sub.Test'
+
+    def test_only_whole_suite_name_is_replaced(self):
+        assert model_longname('Renamed2.Test', 'Renamed', 'Top') == 'Renamed2.Test'
+
+
+if __name__ == '__main__':
+    unittest.main()
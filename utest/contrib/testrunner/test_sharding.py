@@ -0,0 +1,58 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.contrib.testrunner.sharding import BY_SUITE, BY_TEST, shard_tests
+
+TESTS = [('Root.A', 'Root.A.1'), ('Root.A', 'Root.A.2'), ('Root.A', 'Root.A.3'),
+         ('Root.B', 'Root.B.1'), ('Root.C', 'Root.C.1'), ('Root.C', 'Root.C.2')]
+
+
+class TestSharding(unittest.TestCase):
+
+    def test_by_suite_keeps_suites_together(self):
+        shards = shard_tests(TESTS, 2, BY_SUITE)
+        assert shards == [TESTS[:3], TESTS[3:]]
+
+    def test_by_suite_balances_the_biggest_suites_first(self):
+        shards = shard_tests(TESTS, 3, BY_SUITE)
+        assert sorted(len(shard) for shard in shards) == [1, 2, 3]
+        assert sorted(test for shard in shards for test in shard) == sorted(TESTS)
+
+    def test_by_test(self):
+        shards = shard_tests(TESTS, 4, BY_TEST)
+        assert shards == [[TESTS[0], TESTS[4]], [TESTS[1], TESTS[5]],
+                          [TESTS[2]], [TESTS[3]]]
+
+    def test_no_empty_shards(self):
+        assert shard_tests(TESTS[:2], 5, BY_TEST) == [[TESTS[0]], [TESTS[1]]]
+        assert shard_tests(TESTS, 5, BY_SUITE) == [TESTS[:3], TESTS[4:], TESTS[3:4]]
+        assert shard_tests([], 3) == []
+
+    def test_weights_balance_shards(self):
+        durations = {'Root.A.1': 1, 'Root.A.2': 1, 'Root.A.3': 1,
+                     'Root.B.1': 10, 'Root.C.1': 2, 'Root.C.2': 2}
+        shards = shard_tests(TESTS, 2, BY_TEST, weight=lambda test: durations[test[1]])
+        assert shards == [[TESTS[3]], [TESTS[0], TESTS[1], TESTS[2], TESTS[4], TESTS[5]]]
+        shards = shard_tests(TESTS, 2, BY_SUITE, weight=lambda test: durations[test[1]])
+        assert shards == [[TESTS[3]], TESTS[:3] + TESTS[4:]]
+
+    def test_at_least_one_shard(self):
+        assert shard_tests(TESTS, 0) == [TESTS]
+
+
+if __name__ == '__main__':
+    unittest.main()
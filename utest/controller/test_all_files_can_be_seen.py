@@ -55,6 +55,16 @@ class TestAllFiles(unittest.TestCase):
                                                self.project.datafiles)
         self.assertTrue(used.is_used())
 
+    def test_imports_of_all_resources_are_resolved_at_once(self):
+        used = datafilereader.get_ctrl_by_name('Used Resource',
+                                               self.project.datafiles)
+        unused = datafilereader.get_ctrl_by_name('Unused Resource',
+                                                 self.project.datafiles)
+        self.assertFalse(unused.is_used())
+        self.assertTrue(self.project.resource_file_controller_factory
+                        .is_all_resource_file_imports_resolved())
+        self.assertTrue(used._known_imports)
+
 
 if __name__ == '__main__':
     unittest.main()
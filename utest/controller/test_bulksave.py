@@ -0,0 +1,102 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+from robotide.controller.ctrlcommands import NullObserver, RenameKeywordOccurrences, SaveAll
+from robotide.publish import PUBLISHER
+from robotide.publish.messages import RideSaved, RideSavedBatch
+from utest.resources.datafilereader import SIMPLE_TEST_SUITE_PATH, construct_project
+
+
+class TestBulkSave(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.datapath = os.path.join(self.tempdir, 'suite')
+        shutil.copytree(SIMPLE_TEST_SUITE_PATH, self.datapath)
+        self.project = construct_project(self.datapath)
+        self.project.controller.execute(RenameKeywordOccurrences('None Keyword', 'Other Keyword', NullObserver()))
+        self.dirty = [df for df in self.project.datafiles if df.dirty]
+        self.messages = []
+        PUBLISHER.subscribe(self._listener, RideSaved)
+
+    def tearDown(self):
+        PUBLISHER.unsubscribe(self._listener, RideSaved)
+        self.project.close()
+        shutil.rmtree(self.tempdir)
+
+    def _listener(self, message):
+        self.messages.append(message)
+
+    def _expected_content(self, controller):
+        output = StringIO(newline='')
+        controller.datafile.save(output=output, txt_separating_spaces=2, line_separator=os.linesep,
+                                 pipe_separated=False)
+        return output.getvalue()
+
+    def _files(self):
+        return sorted(os.path.join(root, name) for root, dirs, files in os.walk(self.tempdir)
+                      for name in dirs + files)
+
+    def test_all_dirty_files_are_saved(self):
+        files = self._files()
+        expected = {df.filename: self._expected_content(df) for df in self.dirty}
+        self.assertTrue(len(expected) > 1)
+        saved = self.project.execute(SaveAll())
+        self.assertEqual(sorted(df.filename for df in saved), sorted(expected))
+        for path, content in expected.items():
+            with open(path, newline='') as saved_file:
+                self.assertEqual(saved_file.read(), content)
+        self.assertFalse(any(df.dirty for df in self.project.datafiles))
+        self.assertEqual(self._files(), files)
+
+    def test_single_batch_message_is_published(self):
+        self.project.execute(SaveAll())
+        self.assertEqual(len(self.messages), 1)
+        self.assertTrue(isinstance(self.messages[0], RideSavedBatch))
+        self.assertEqual(sorted(self.messages[0].paths), sorted(df.filename for df in self.dirty))
+        self.assertEqual(self.messages[0].path, '%d files' % len(self.dirty))
+
+    def test_failing_file_is_left_untouched(self):
+        failing = self.dirty[0]
+        with open(failing.filename) as original:
+            content = original.read()
+        failing.data.save = _fail
+        files = self._files()
+        saved = self.project.execute(SaveAll())
+        self.assertNotIn(failing, saved)
+        self.assertEqual(len(saved), len(self.dirty) - 1)
+        self.assertTrue(failing.dirty)
+        with open(failing.filename) as original:
+            self.assertEqual(original.read(), content)
+        self.assertEqual(self._files(), files)
+
+    def test_nothing_is_published_without_dirty_files(self):
+        self.project.execute(SaveAll())
+        self.messages = []
+        self.assertEqual(self.project.execute(SaveAll()), [])
+        self.assertEqual(self.messages, [])
+
+
+def _fail(**options):
+    raise IOError('Writing failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -395,6 +395,19 @@ class TestCellInfo(unittest.TestCase):
         self._verify_cell_info(0, 0, ContentType.STRING, CellType.UNKNOWN)
         self._verify_cell_info(0, 1, ContentType.EMPTY, CellType.UNKNOWN)
 
+    def test_cell_info_is_cached_until_row_or_rows_before_change(self):
+        self.test.execute(ChangeCellValue(0, 0, SET_VARIABLE))
+        self.test.execute(ChangeCellValue(1, 0, 'Log'))
+        self.test.execute(ChangeCellValue(2, 0, 'Log'))
+        first, second = self.test.get_cell_info(0, 0), self.test.get_cell_info(2, 1)
+        assert self.test.get_cell_info(0, 0) is first
+        assert self.test.get_cell_info(2, 1) is second
+        self.test.execute(ChangeCellValue(1, 0, '${var}='))
+        assert self.test.get_cell_info(0, 0) is first
+        assert self.test.get_cell_info(2, 1) is not second
+        self.test.datafile_controller.update_namespace()
+        assert self.test.get_cell_info(0, 0) is not first
+
     def _verify_string_change(self, row, col, celltype):
         self._verify_cell_info(row, col, ContentType.EMPTY, celltype)
         self.test.execute(ChangeCellValue(row, col, 'diipadaapa'))
@@ -303,6 +303,26 @@ class TestFindingControllers(unittest.TestCase):
         result = self.project.find_controller_by_longname('Suite.Test 1', 'Test 1')
         assert result == test
 
+    def test_finding_testcase_controller_after_rename(self):
+        suite_controller = TestCaseFileController(_testcasefile('Suite.robot'))
+        test = suite_controller.create_test('Test 1')
+        self.project.controller = suite_controller
+        assert self.project.find_controller_by_longname('Suite.Test 1', 'Test 1') == test
+        test.rename('Renamed')
+        test.notify_name_changed('Test 1')
+        assert self.project.find_controller_by_longname('Suite.Test 1', 'Test 1') is None
+        assert self.project.find_controller_by_longname('Suite.Renamed', 'Renamed') == test
+
+    def test_finding_testcase_controller_after_changing_project(self):
+        suite_controller = TestCaseFileController(_testcasefile('Suite.robot'))
+        suite_controller.create_test('Test 1')
+        self.project.controller = suite_controller
+        self.project.find_controller_by_longname('Suite.Test 1', 'Test 1')
+        other_controller = TestCaseFileController(_testcasefile('Suite.robot'))
+        test = other_controller.create_test('Test 1')
+        self.project.controller = other_controller
+        assert self.project.find_controller_by_longname('Suite.Test 1', 'Test 1') is test
+
     def test_finding_correct_testcase_when_two_with_same_name(self):
         test1, test2 = self._create_suite_structure_with_two_tests_with_same_name()
         result1 = self.project.find_controller_by_longname('Ro.ot.' + test1.longname, test1.display_name)
@@ -15,6 +15,8 @@
 
 import unittest
 
+from robotide import robotapi
+from robotide.controller.cellinfo import CellType
 from robotide.controller.stepcontrollers import StepController
 
 
@@ -103,5 +105,66 @@ class StepContainsKeywordTest(unittest.TestCase, FakeStep):
         self._keyword = 'Then came John'
         self._verify_contains('Then came John')
 
+
+class _KeywordInfo(object):
+    arguments = ['${first}', '${second}']
+    source = 'Lib'
+
+
+class _RecordingParent(object):
+
+    def __init__(self):
+        self.lookups = []
+        self.datafile_controller = self
+        self.namespace = self
+        self.generation = 0
+
+    def get_keyword_info(self, name):
+        self.lookups.append(name)
+        return _KeywordInfo() if name == 'My Keyword' else None
+
+    def is_user_keyword(self, name):
+        self.lookups.append(name)
+        return False
+
+    def is_library_keyword(self, name):
+        self.lookups.append(name)
+        return name == 'My Keyword'
+
+    def has_template(self):
+        return False
+
+    def index_of_step(self, step):
+        return 0
+
+
+class CachedKeywordLookupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = _RecordingParent()
+        self.step = StepController(self.parent, robotapi.Step(['My Keyword', 'a', 'b', 'c']))
+
+    def _cell_types(self):
+        return [self.step.get_cell_info(col).cell_type for col in range(4)]
+
+    def test_keywords_are_looked_up_once_per_value(self):
+        self.assertEqual(self._cell_types(), [CellType.KEYWORD, CellType.MANDATORY,
+                                              CellType.MANDATORY, CellType.MUST_BE_EMPTY])
+        self.assertEqual(sorted(self.parent.lookups),
+                         sorted(['My Keyword'] * 3 + ['a', 'b', 'c'] * 3))
+        self._cell_types()
+        self.assertEqual(len(self.parent.lookups), 12)
+
+    def test_lookups_are_repeated_after_changes(self):
+        self._cell_types()
+        self.parent.generation += 1
+        self._cell_types()
+        self.assertEqual(len(self.parent.lookups), 24)
+        self.step.step_controller_step.__init__(['My Keyword', 'x', 'b', 'c'])
+        self._cell_types()
+        self.assertEqual(self.parent.lookups[24:].count('x'), 3)
+        self.assertNotIn('a', self.parent.lookups[24:])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,109 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.robotapi import (TestCaseFile, TestDataDirectory, FromFilePopulator,
+                               TagPatterns)
+from robotide.controller.filecontrollers import (TestCaseFileController,
+                                                 TestDataDirectoryController)
+from robotide.controller.tagindex import TagIndex
+from robotide.publish import RideOpenSuite
+
+DATA = ['First  [Tags]  foo  bar',
+        'Second  [Tags]  foo  Baz_1',
+        'Third  [Tags]  b a z 2',
+        'Fourth  No Operation',
+        'Fifth  [Tags]  NONE  Foo']
+
+
+class _FakeProject(object):
+
+    def __init__(self, tests):
+        self.data = True
+        self._tests = tests
+
+    def all_testcases(self):
+        return iter(self._tests)
+
+
+def _tests(data):
+    tcf = TestCaseFile()
+    tcf.directory = '/path/to'
+    pop = FromFilePopulator(tcf)
+    pop.start_table(['Test cases'])
+    for line in data:
+        pop.add(line.split('  '))
+    pop.eof()
+    directory = TestDataDirectoryController(TestDataDirectory())
+    return list(TestCaseFileController(tcf, None, directory).tests)
+
+
+class TestTagIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tests = _tests(DATA)
+        self.index = TagIndex(_FakeProject(self.tests))
+
+    def _names(self, includes, excludes=''):
+        return [t.name for t in self.index.search(includes, excludes)]
+
+    def _expected(self, includes, excludes=''):
+        incl = TagPatterns(includes.split()) if includes.split() else None
+        excl = TagPatterns(excludes.split())
+        return [t.name for t in self.tests
+                if (incl is None or incl.match([str(tag) for tag in t.tags]))
+                and not excl.match([str(tag) for tag in t.tags])]
+
+    def test_tag_names_and_tests(self):
+        assert sorted(self.index.tag_names()) == \
+            ['Baz_1', 'NONE', 'b a z 2', 'bar', 'foo']
+        assert [t.name for t in self.index.tests_with_tag('FOO')] == \
+            ['First', 'Second', 'Fifth']
+        assert self.index.number_of_tests == 5
+
+    def test_tag_objects(self):
+        tags = self.index.tag_objects('foo')
+        assert [str(tag) for tag in tags] == ['foo', 'foo', 'Foo']
+
+    def test_search_is_equivalent_to_robot_tag_patterns(self):
+        for includes, excludes in [('foo', ''), ('FO*', ''), ('fooANDbar', ''),
+                                   ('foo&baz1', ''), ('barORbaz2', ''),
+                                   ('fooNOTbar', ''), ('NOTfoo', ''), ('', 'foo'),
+                                   ('ba?_*', 'bar'), ('none', ''), ('', ''),
+                                   ('foo bar', 'baz*'), ('b[a]z2', ''),
+                                   ('fooANDbarORbaz*', ''), ('nonexisting', '')]:
+            assert self._names(includes, excludes) == \
+                self._expected(includes, excludes), (includes, excludes)
+
+    def test_test_tags_are_updated_incrementally(self):
+        self.index.universe
+        self.tests[3].tags.set_value('new | foo')
+        assert self._names('new') == ['Fourth']
+        assert self._names('foo') == ['First', 'Second', 'Fourth', 'Fifth']
+        self.tests[0].tags.set_value('other')
+        assert self._names('foo') == ['Second', 'Fourth', 'Fifth']
+        assert 'bar' not in self.index.tag_names()
+
+    def test_rebuilt_after_structural_change(self):
+        self.index.universe
+        self.tests.pop()
+        RideOpenSuite(path='', datafile=None).publish()
+        assert self.index.number_of_tests == 4
+        assert self._names('foo') == ['First', 'Second']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,6 +50,135 @@ class TestTreeController(unittest.TestCase):
             [a.name for a in mocked_ar.action_collections])
 
 
+class _FakeHandler(object):
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.item = getattr(controller, 'data', None)
+
+
+class _FakeTree(object):
+    root = 'root'
+
+    def __init__(self):
+        self.children = {'root': []}
+        self.parents = {}
+        self.labels = {}
+        self.data = {}
+        self.visited = 0
+
+    def add(self, parent, node, controller):
+        self.children[parent].append(node)
+        self.children[node] = []
+        self.parents[node] = parent
+        self.labels[node] = node.capitalize()
+        self.data[node] = _FakeHandler(controller)
+
+    def GetItemParent(self, node):
+        return self.parents.get(node)
+
+    def GetItemText(self, node):
+        return self.labels[node]
+
+    def GetItemData(self, node):
+        self.visited += 1
+        return self.data.get(node)
+
+    def GetFirstChild(self, node):
+        return self.GetNextChild(node, 0)
+
+    def GetNextChild(self, node, cookie):
+        children = self.children[node]
+        if cookie < len(children):
+            return children[cookie], cookie + 1
+        return None, cookie
+
+    def ItemHasChildren(self, node):
+        return bool(self.children[node])
+
+
+class TestFindingNodes(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = _FakeTree()
+        self.controller = TreeController(self.tree, None, None, None)
+        self.controllers = [object() for _ in range(3)]
+        for index, ctrl in enumerate(self.controllers):
+            self.tree.add('root', 'node%d' % index, ctrl)
+
+    def test_registered_node_is_found_without_walking_the_tree(self):
+        self.controller.register_node('node2', self.controllers[2])
+        assert self.controller.find_node_by_controller(self.controllers[2]) == 'node2'
+        assert self.tree.visited == 1
+
+    def test_unregistered_node_is_not_found(self):
+        assert self.controller.find_node_by_controller(self.controllers[1]) is None
+        assert self.tree.visited == 0
+
+    def test_deleted_node_is_not_found(self):
+        self.controller.register_node('node0', self.controllers[0])
+        self.controller.unregister_node('node0')
+        self.tree.children['root'].remove('node0')
+        assert self.controller.find_node_by_controller(self.controllers[0]) is None
+
+    def test_node_with_changed_handler_is_not_returned(self):
+        self.controller.register_node('node0', self.controllers[0])
+        self.tree.data['node0'] = _FakeHandler(object())
+        assert self.controller.find_node_by_controller(self.controllers[0]) is None
+
+    def test_datafile_node_is_found_by_data(self):
+        datafile = _FakeDatafileController()
+        self.tree.add('node1', 'suite', datafile)
+        self.controller.register_node('suite', datafile)
+        self.controller.register_datafile_node('suite', datafile)
+        assert self.controller.find_datafile_node(datafile.data) == 'suite'
+        assert self.controller.is_datafile_node('suite')
+        assert not self.controller.is_datafile_node('node1')
+        self.controller.unregister_node('suite')
+        assert self.controller.find_datafile_node(datafile.data) is None
+
+    def test_registered_node_is_found_by_label_without_walking_the_tree(self):
+        self.controller.register_node('node1', self.controllers[1])
+        assert self.controller.find_node_with_label('root', 'NODE 1') == 'node1'
+        assert self.tree.visited == 0
+
+    def test_changed_label_is_found(self):
+        self.controller.register_node('node1', self.controllers[1])
+        self.tree.labels['node1'] = 'Renamed'
+        self.controller.label_changed('node1')
+        assert self.controller.find_node_with_label('root', 'renamed') == 'node1'
+        assert self.tree.visited == 0
+
+    def test_deeper_node_is_found_by_label_by_walking_the_tree(self):
+        self.tree.add('node2', 'child', object())
+        assert self.controller.find_node_with_label('root', 'Child') == 'child'
+        assert self.controller.find_node_with_label('root', 'Missing') is None
+
+    def test_node_itself_is_found_before_its_children(self):
+        self.tree.add('node1', 'child', object())
+        self.tree.labels['child'] = 'Node1'
+        self.controller.register_node('child', object())
+        assert self.controller.find_node_with_label('node1', 'Node1') == 'node1'
+
+    def test_direct_child_is_found_before_deeper_node_with_same_label(self):
+        self.tree.add('node0', 'deeper', object())
+        self.tree.labels['deeper'] = 'Node2'
+        self.controller.register_node('node2', self.controllers[2])
+        assert self.controller.find_node_with_label('root', 'Node2') == 'node2'
+
+    def test_first_created_child_is_found_with_equal_labels(self):
+        self.tree.labels['node2'] = 'Node1'
+        for index in (1, 2):
+            self.controller.register_node('node%d' % index, self.controllers[index])
+        assert self.controller.find_node_with_label('root', 'Node1') == 'node1'
+
+
+class _FakeDatafileController(object):
+
+    def __init__(self):
+        self.data = object()
+
+
 class _BaseTreeControllerTest(object):
 
     def setUp(self):
@@ -79,6 +79,37 @@ class TestSuggestions(unittest.TestCase):
         suggestions.get_for('a')
         self.assertEqual(mock_source.request_count, 2)
 
+    def test_deleting_characters_is_served_from_cache(self):
+        mock_source = self._create_mock_source()
+        suggestions = Suggestions(mock_source)
+        self.assertEqual(suggestions.get_for('a'), ['aarnio', 'fo.aaatio', 'bA.AAATIO'])
+        self.assertEqual(suggestions.get_for('aar'), ['aarnio'])
+        self.assertEqual(suggestions.get_for('aa'), ['aarnio'])
+        self.assertEqual(suggestions.get_for('a'), ['aarnio', 'fo.aaatio', 'bA.AAATIO'])
+        self.assertEqual(mock_source.request_count, 1)
+
+    def test_suggestions_of_empty_value_are_not_filtered(self):
+        mock_source = self._create_mock_source()
+        suggestions = Suggestions(mock_source)
+        suggestions.get_for('')
+        suggestions.get_for('a')
+        suggestions.get_for('')
+        self.assertEqual(mock_source.request_count, 2)
+
+    def test_cache_is_cleared_when_row_or_namespace_changes(self):
+        mock_source = self._create_mock_source()
+        mock_source.generation = 1
+        suggestions = Suggestions(mock_source)
+        suggestions.get_for('a', row=1)
+        suggestions.get_for('a', row=2)
+        self.assertEqual(mock_source.request_count, 2)
+        mock_source.generation = 2
+        suggestions.get_for('a', row=2)
+        self.assertEqual(mock_source.request_count, 3)
+        suggestions.clear()
+        suggestions.get_for('a', row=2)
+        self.assertEqual(mock_source.request_count, 4)
+
     def test_suggestions_for_duplicates(self):
         mock_source = self._create_mock_source()
         suggestions = Suggestions(mock_source)
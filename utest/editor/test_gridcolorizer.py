@@ -15,12 +15,14 @@
 
 import unittest
 import random
+from unittest.mock import patch
 
 import pytest
 
 from robotide.lib.robot.libraries.String import String
 
 from robotide.controller.cellinfo import CellInfo, ContentType, CellType, CellContent, CellPosition
+from robotide.editor import gridcolorizer
 from robotide.editor.gridcolorizer import Colorizer
 
 
@@ -154,5 +156,60 @@ class TestColorIdentification(unittest.TestCase):
         assert bk_color.title().upper() == grid.settings['background highlight'].upper()  # I am cheating here ;)
 
 
+class ScrolledMockGrid(MockGrid):
+    NumberRows = 100
+    NumberCols = 2
+    ForceRefresh = MockGrid.noop
+
+    def CalcUnscrolledPosition(self, x, y):
+        return x, y + 1000
+
+    def GetClientSize(self):
+        return Size(200, 200)
+
+    def YToRow(self, y):
+        return y // 20 if y < 2000 else -1
+
+
+class Size(object):
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+class RecordingController(object):
+
+    def __init__(self):
+        self.rows = []
+
+    def get_cell_info(self, row, column):
+        if column == 0:
+            self.rows.append(row)
+        return None
+
+
+class TestViewportColorizing(unittest.TestCase):
+
+    def test_visible_rows_are_colored_first(self):
+        controller = RecordingController()
+        colorizer = Colorizer(ScrolledMockGrid(), controller)
+        calls = []
+        with patch.object(gridcolorizer.wx, 'CallAfter', lambda *args: calls.append(args)):
+            colorizer._coloring_task(colorizer._current_task_id, None)
+            self.assertEqual(controller.rows, list(range(40, 71)))
+            while calls:
+                function, *args = calls.pop(0)
+                function(*args)
+        self.assertEqual(controller.rows, list(range(40, 71)) + list(range(71, 100)) + list(range(40)))
+
+    def test_outdated_task_is_not_continued(self):
+        controller = RecordingController()
+        colorizer = Colorizer(ScrolledMockGrid(), controller)
+        colorizer._current_task_id = 2
+        colorizer._prefetch_task(1, None, [1, 2, 3])
+        assert not controller.rows
+
+
 if __name__ == '__main__':
     unittest.main()
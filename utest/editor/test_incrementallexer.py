@@ -0,0 +1,109 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.editor.incrementallexer import IncrementalLexer, robotframeworklexer
+
+DATA = '''*** Settings ***
+Library    OperatingSystem
+Test Template    Template Keyword
+
+*** Variables ***
+${VARIABLE}    välue
+@{LIST}    a    b
+...    c
+
+*** Test Cases ***
+First Test
+    [Documentation]    Uses the template
+    arg1    ${VARIABLE}
+Second Test
+    [Template]    NONE
+    Log    Hello    # comment
+    Should Be Equal    ${x}    ${y}
+
+*** Keywords ***
+Template Keyword
+    [Arguments]    ${arg1}    ${arg2}
+    Log Many    ${arg1}
+    ...    ${arg2}
+'''
+
+
+class _Styles(dict):
+
+    def __missing__(self, token):
+        self[token] = len(self)
+        return self[token]
+
+
+@unittest.skipIf(robotframeworklexer is None, 'Pygments is not installed')
+class TestIncrementalLexer(unittest.TestCase):
+
+    def setUp(self):
+        self.styles = _Styles()
+        self.lexer = IncrementalLexer(self.styles)
+        self.lexer.CHECKPOINT_INTERVAL = 4
+
+    def _style(self, lines, start=0):
+        first = self.lexer.restart(start)
+        return first, [self.lexer.style_line(line) for line in lines[first:]]
+
+    def _expected(self, text):
+        styles = []
+        for _, token, value in robotframeworklexer.RobotFrameworkLexer(
+                ).get_tokens_unprocessed(text):
+            styles.append(bytes((self.styles[token],)) * len(value.encode('UTF-8')))
+        return b''.join(styles)
+
+    def test_styles_match_full_document_lexing(self):
+        lines = DATA.splitlines(True)
+        _, styles = self._style(lines)
+        for line, line_styles in zip(lines, styles):
+            self.assertEqual(len(line_styles), len(line.encode('UTF-8')))
+        self.assertEqual(b''.join(styles), self._expected(DATA))
+
+    def test_restyling_after_edit_starts_from_checkpoint(self):
+        lines = DATA.splitlines(True)
+        self._style(lines)
+        lines[17] = '    Should Not Be Equal    ${x}    ${y}\n'
+        first, styles = self._style(lines, 17)
+        self.assertLessEqual(first, 17)
+        self.assertGreater(first, 0)
+        self.assertEqual(b''.join(styles),
+                         self._expected(''.join(lines))[-sum(len(s) for s in styles):])
+
+    def test_edit_changing_table_restyles_following_lines(self):
+        lines = DATA.splitlines(True)
+        self._style(lines)
+        lines[9] = '*** Keywords ***\n'
+        first, styles = self._style(lines, 9)
+        full = self._expected(''.join(lines))
+        self.assertEqual(b''.join(styles), full[-sum(len(s) for s in styles):])
+
+    def test_continuing_from_last_styled_line(self):
+        lines = DATA.splitlines(True)
+        first, styles = self._style(lines[:10])
+        first, more = self._style(lines, 10)
+        self.assertEqual(first, 10)
+        self.assertEqual(b''.join(styles + more), self._expected(DATA))
+
+    def test_last_line_without_separator(self):
+        _, styles = self._style(['*** Test Cases ***\n', 'Test'])
+        self.assertEqual(len(styles[1]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
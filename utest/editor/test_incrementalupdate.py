@@ -0,0 +1,166 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+from io import StringIO
+
+from robotide import robotapi
+from robotide.controller.filecontrollers import TestCaseFileController
+from robotide.editor.incrementalupdate import IncrementalUpdater, read_tables, split_items, TESTS, VARIABLES
+from robotide.lib.robot.parsing.model import ForLoop
+from robotide.publish import PUBLISHER
+from robotide.publish.messages import RideDataFileSet, RideItemStepsChanged, RideTestCaseAdded, RideTestCaseRemoved
+
+DATA = '''*** Settings ***
+Library    OperatingSystem
+
+*** Variables ***
+${SCALAR}    value
+@{LIST}    a    b
+
+*** Test Cases ***
+First Test
+    Log    first
+
+Second Test
+    [Documentation]    Second
+    My Keyword    arg
+
+Third Test
+    Log    third
+
+*** Keywords ***
+My Keyword
+    [Arguments]    ${arg}
+    Log    ${arg}
+'''
+
+
+def _parse(content):
+    datafile = robotapi.TestCaseFile(source='/tmp/incremental.robot')
+    return datafile, read_tables(content, datafile, 4)
+
+
+class TestIncrementalUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.controller = TestCaseFileController(_parse(DATA)[0])
+        self.updater = IncrementalUpdater(self.controller, self._create_target, 4)
+        self.messages = []
+        for message in (RideDataFileSet, RideItemStepsChanged, RideTestCaseAdded, RideTestCaseRemoved):
+            PUBLISHER.subscribe(self._listener, message)
+
+    def tearDown(self):
+        PUBLISHER.unsubscribe_all(self)
+
+    def _listener(self, message):
+        self.messages.append(message)
+
+    @staticmethod
+    def _create_target():
+        return robotapi.TestCaseFile(source='/tmp/incremental.robot')
+
+    def _content(self):
+        output = StringIO()
+        self.controller.data.save(output=output, format='txt', txt_separating_spaces=4)
+        return output.getvalue()
+
+    def _update(self, old, new):
+        content = self._content().replace(old, new)
+        return self.updater.update(self._content(), *_parse(content)), content
+
+    def _assert_model_matches(self, content):
+        output = StringIO()
+        _parse(content)[0].save(output=output, format='txt', txt_separating_spaces=4)
+        self.assertEqual(self._content(), output.getvalue())
+
+    def test_changed_test_is_updated_in_place(self):
+        test = self.controller.tests[1]
+        data = test.data
+        updated, content = self._update('My Keyword    arg', 'My Keyword    other')
+        assert updated
+        assert self.controller.tests[1] is test
+        assert test.data is data
+        self.assertEqual(test.steps[0].as_list(), ['My Keyword', 'other'])
+        self.assertEqual(data.doc.parent, data)
+        self.assertEqual([type(m) for m in self.messages], [RideItemStepsChanged])
+        assert self.controller.dirty
+        self._assert_model_matches(content)
+
+    def test_for_loop_parent_is_updated_item(self):
+        # The parser creates plain steps for FOR loops, so the loop is added by hand
+        test = self.controller.tests[2]
+        data = test.data
+        new_data = _parse(self._content())[0].testcase_table.tests[2]
+        for_loop = ForLoop(new_data, ['FOR', '${i}', 'IN', 'a', 'b'])
+        new_data.steps.append(for_loop)
+        test.replace_content(new_data)
+        assert test.data is data
+        assert data.steps[-1] is for_loop
+        assert for_loop.parent is data
+
+    def test_renamed_test(self):
+        updated, content = self._update('Third Test', 'Renamed Test')
+        assert updated
+        self.assertEqual(self.controller.tests[2].name, 'Renamed Test')
+        self._assert_model_matches(content)
+
+    def test_removed_test(self):
+        updated, content = self._update('Second Test\n    [Documentation]    Second\n'
+                                        '    My Keyword    arg\n\n', '')
+        assert updated
+        self.assertEqual([t.name for t in self.controller.tests], ['First Test', 'Third Test'])
+        self.assertEqual([type(m) for m in self.messages], [RideTestCaseRemoved])
+        self._assert_model_matches(content)
+
+    def test_test_added_at_end_of_table(self):
+        updated, content = self._update('    Log    third\n', '    Log    third\n\nFourth\n    No Operation\n')
+        assert updated
+        self.assertEqual(self.controller.tests[3].name, 'Fourth')
+        self.assertEqual([type(m) for m in self.messages], [RideTestCaseAdded])
+        self._assert_model_matches(content)
+
+    def test_changed_keyword_and_variable(self):
+        updated, content = self._update('    Log    ${arg}', '    Log Many    ${arg}')
+        assert updated
+        self._assert_model_matches(content)
+        updated, content = self._update('a    b\n', 'a    b    c\n')
+        assert updated
+        self.assertEqual(self.controller.data.variable_table.variables[1].value, ['a', 'b', 'c'])
+        self._assert_model_matches(content)
+
+    def test_unchanged_text(self):
+        assert self.updater.update(self._content(), *_parse(self._content()))
+        assert not self.messages
+        assert not self.controller.dirty
+
+    def test_structural_changes_are_not_applied(self):
+        for old, new in [('OperatingSystem', 'Collections'),
+                         ('*** Keywords ***', '*** Keyword ***'),
+                         ('First Test\n', 'New Test\n    No Operation\n\nFirst Test\n')]:
+            original = self._content()
+            assert not self.updater.update(original, *_parse(original.replace(old, new)))
+            self.assertEqual(self._content(), original)
+        assert not self.messages
+
+    def test_split_items(self):
+        rows = [['# comment'], ['Test'], ['', 'Log', 'x'], ['# inner'], [''], ['Other'], ['', '...', 'y']]
+        self.assertEqual(split_items(TESTS, rows),
+                         [[['Test'], ['', 'Log', 'x'], ['# inner']], [['Other'], ['', '...', 'y']]])
+        self.assertEqual(split_items(VARIABLES, [['${a}', '1'], [''], ['# comment'], ['${b}']]),
+                         [[['${a}', '1']], [['${b}']]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -565,5 +565,14 @@ class TestEditorCommands(unittest.TestCase):
         self.app.MainLoop()
 
 
+class TestDataValidationHandler(unittest.TestCase):
+
+    def test_strip_comment_lines(self):
+        text = ('*** Test Cases ***\n# comment\nTest\n    # inner comment\n'
+                '    Log    \\# not a comment line    # trailing\n# comment\n')
+        self.assertEqual(texteditor.DataValidationHandler._strip_comment_lines(text),
+                         '*** Test Cases ***\nTest\n    Log    \\# not a comment line    # trailing\n')
+
+
 if __name__ == '__main__':
     unittest.main()
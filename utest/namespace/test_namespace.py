@@ -386,6 +386,14 @@ class TestKeywordSearch(_DataFileTest):
         self.assert_in_keywords(all_kws, 'My Test Setup',
                                          'My Suite Teardown')
 
+    def test_own_keywords_contain_datafile_and_library_keywords(self):
+        own_kws = self.ns.get_own_keywords(self.tcf)
+        self.assert_in_keywords(own_kws, 'Should be in keywords Uk',
+                                         'Create File')
+        names = [kw.name for kw in own_kws]
+        assert 'Should Be Equal' not in names
+        assert 'UK From Resource from Resource with Variable' not in names
+
     def test_resource_kws_only_once(self):
         directory = TestDataDirectory(source=SIMPLE_TEST_SUITE_PATH).populate()
         all_kws = self.ns.get_all_keywords(directory.children)
@@ -94,6 +94,19 @@ class TestExcludes(unittest.TestCase):
         self.assertFalse(self.exclude.contains('foo/zar'))
         self.assertTrue(self.exclude.contains('foo/gar'))
 
+    def test_excludes_file_is_read_only_when_changed(self):
+        self.exclude.update_excludes(['foo'])
+        reads = []
+        get_excludes = self.exclude._get_excludes
+        self.exclude._get_excludes = lambda: reads.append(1) or get_excludes()
+        for _ in range(3):
+            self.assertTrue(self.exclude.contains(_join('foo', 'bar')))
+        self.assertEqual(len(reads), 1)
+        with open(self.file_path, 'a') as exclude_file:
+            exclude_file.write('baz\n')
+        self.assertTrue(self.exclude.contains(_join('baz', 'qux')))
+        self.assertEqual(len(reads), 2)
+
 def _join(*args):
     return os.path.join(*args) + sep
 
@@ -16,7 +16,7 @@
 import unittest
 
 from robotide.ui.keywordsearch import _KeywordData, _SearchCriteria,\
-    ALL_KEYWORDS, ALL_USER_KEYWORDS, ALL_LIBRARY_KEYWORDS, _SortOrder
+    ALL_KEYWORDS, ALL_USER_KEYWORDS, ALL_LIBRARY_KEYWORDS, _SortOrder, _KeywordIndex
 from robotide.spec.iteminfo import ItemInfo
 
 test_kws = [ItemInfo(name, source, desc) for name, source, desc in
@@ -92,6 +92,54 @@ class TestSearchCriteria(unittest.TestCase):
         assert criteria.matches(keyword) == expected
 
 
+class TestKeywordIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.libs = [Keyword('Should Be Equal', 'BuiltIn', 'Fails if values are not equal'),
+                     Keyword('Get File', 'OperatingSystem', 'Returns the contents')]
+        self.res = [Keyword('get bar', 'resource.robot', 'getting bar'),
+                    Keyword('Use File', 'resource.robot', 'Bar and file')]
+        self.index = _KeywordIndex()
+        self.index.set_group(None, self.libs)
+        self.index.set_group('resource.robot', self.res)
+
+    def _search(self, pattern, search_docs=True, source_filter=ALL_KEYWORDS):
+        return [kw.name for kw in self.index.search(
+            _SearchCriteria(pattern, search_docs, source_filter))]
+
+    def test_results_are_same_as_with_search_criteria(self):
+        for pattern in ['', 'file', 'BAR', 'e f', 'equal', 'nothing', 'g']:
+            for search_docs in (True, False):
+                for source_filter in (ALL_KEYWORDS, ALL_USER_KEYWORDS, 'BuiltIn'):
+                    criteria = _SearchCriteria(pattern, search_docs, source_filter)
+                    expected = [kw for kw in self.libs + self.res
+                                if criteria.matches(kw)]
+                    assert sorted(self.index.search(criteria), key=id) == \
+                        sorted(expected, key=id)
+
+    def test_ranking(self):
+        assert self._search('file') == ['Get File', 'Use File']
+        assert self._search('bar') == ['get bar', 'Use File']
+        assert self._search('fil') == ['Get File', 'Use File']
+        assert self._search('ar') == ['get bar', 'Should Be Equal', 'Use File']
+        assert self._search('ar', search_docs=False) == ['get bar']
+
+    def test_group_update(self):
+        self.index.set_group('resource.robot', [Keyword('New', 'resource.robot', '')])
+        assert self._search('bar') == []
+        assert self._search('new') == ['New']
+        self.index.remove_group('resource.robot')
+        assert sorted(kw.name for kw in self.index.keywords) == \
+            ['Get File', 'Should Be Equal']
+
+    def test_keyword_shared_by_groups_is_kept_until_last_group_removed(self):
+        self.index.set_group('other.robot', self.libs)
+        self.index.remove_group(None)
+        assert self._search('equal') == ['Should Be Equal']
+        self.index.remove_group('other.robot')
+        assert self._search('equal') == []
+
+
 class TestKeyWordData(unittest.TestCase):
 
     def test_sort_by_search(self):
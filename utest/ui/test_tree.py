@@ -170,6 +170,34 @@ class TestPopulating(_BaseSuiteTreeTest):
             assert self._tree.GetItemText(item) == name
 
 
+class TestLazyPopulating(_BaseSuiteTreeTest):
+
+    def _create_model(self):
+        model = _BaseSuiteTreeTest._create_model(self)
+        suite = model.data.data
+        nested = self._create_directory_suite('/top_suite/nested')
+        nested.children = [self._create_file_suite('deep_suite.robot')]
+        suite.children.append(nested)
+        model.controller = TestDataDirectoryController(suite)
+        return model
+
+    def _datafile_labels(self):
+        return [self._tree.GetItemText(node) for node in self._tree.datafile_nodes]
+
+    def test_nested_suites_are_rendered_when_parent_is_expanded(self):
+        self._tree.populate(self._model)
+        assert 'Nested' in self._datafile_labels()
+        assert 'Deep Suite' not in self._datafile_labels()
+        self._tree._expand_and_render_children(self._get_node('Nested'))
+        assert 'Deep Suite' in self._datafile_labels()
+
+    def test_selecting_item_of_nested_suite_renders_its_parents(self):
+        self._tree.populate(self._model)
+        deep_suite = self._model.data.children[-1].children[0]
+        self._tree.select_node_by_data(deep_suite)
+        assert self._get_selected_label() == 'Deep Suite'
+
+
 class TestAddingItems(_BaseSuiteTreeTest):
 
     def test_adding_user_keyword(self):
@@ -0,0 +1,74 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time of robotide.robotapi in microseconds, as reported by
+# `python -X importtime`. It is around 50 ms on a developer machine.
+IMPORT_TIME_BUDGET = 500000
+# Modules that are needed only for running tests, creating reports or using
+# libraries, and that must not be imported with the parser and the model.
+DEFERRED_MODULES = ['robotide.lib.robot.run', 'robotide.lib.robot.rebot',
+                    'robotide.lib.robot.running', 'robotide.lib.robot.reporting',
+                    'robotide.lib.robot.libdocpkg', 'robotide.lib.robot.libraries.BuiltIn',
+                    'robotide.lib.robot.output.output', 'pkg_resources', 'yaml',
+                    'urllib.request']
+
+
+def import_times(statement):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            stderr=subprocess.PIPE, env=env, universal_newlines=True)
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.times = import_times('import robotide.robotapi')
+
+    def test_robotapi_is_imported_within_budget(self):
+        self.assertLess(self.times['robotide.robotapi'], IMPORT_TIME_BUDGET)
+
+    def test_execution_and_reporting_modules_are_not_imported(self):
+        imported = [name for name in DEFERRED_MODULES if name in self.times]
+        self.assertEqual(imported, [])
+
+    def test_controllers_do_not_import_user_interface(self):
+        times = import_times('import robotide.controller')
+        imported = [name for name in times
+                    if name.startswith(('robotide.ui', 'robotide.preferences', 'robotide.editor'))]
+        self.assertEqual(imported, [])
+
+    def test_deferred_entry_points_can_be_imported(self):
+        for statement in ['from robotide.lib.robot import run, rebot_cli',
+                          'import robotide.lib.robot as robot; run = robot.run; rebot_cli = robot.rebot_cli',
+                          'import robotide.lib.robot.rebot; from robotide.lib.robot import run, rebot_cli']:
+            import_times(statement + '; assert run.__name__ == "run"; assert rebot_cli.__name__ == "rebot_cli"')
+
+
+if __name__ == '__main__':
+    unittest.main()
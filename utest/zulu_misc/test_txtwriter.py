@@ -0,0 +1,119 @@
+#  Copyright 2023-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import unittest
+from io import BytesIO, StringIO
+
+from robotide import robotapi
+from robotide.lib.robot.writer import txt_content
+from robotide.lib.robot.writer.datafilewriter import WritingContext
+from robotide.lib.robot.writer.filewriters import FileWriter, SpaceSeparatedTxtWriter
+from robotide.lib.robot.writer.txtwriter import StreamingTxtWriter
+from utest.resources.datafilereader import DATAPATH
+
+DATA = '''Preamble line
+*** Settings ***
+Documentation    First line\\nSecond line\\n third line
+Library    OperatingSystem    WITH NAME    OS
+Suite Setup    Log Many    a    ${EMPTY}    b
+
+*** Variables ***
+${SCALAR}    value with${SPACE * 2}spaces
+@{LIST}    1    2    3    4    5    6    7    8    9    10    11    12    13    14    15    16    17    18    19    20
+${EMPTY VALUE}
+
+*** Test Cases ***
+Test With A Name Longer Than The Column Width
+    [Documentation]    Doc\\nwith\\nlines
+    Log    one    \\    three
+    FOR    ${i}    IN RANGE    10
+        Log    ${i}
+    END
+    Run Keyword If    ${True}    Log    a    ELSE IF    ${False}    Log    b    ELSE    Log    c
+    # comment    continues    here
+
+Short
+    Log    x    # trailing comment
+    ${var}=    Set Variable    tab\there
+
+*** Keywords ***
+My Keyword
+    [Arguments]    ${arg}
+    Log    ${arg}    WARN
+'''
+
+ALIGNED = '''*** Test Cases ***    Action    Argument    Expected
+Valid    Login    demo    Welcome
+A Test Case With A Very Long Name    Login    x    Error
+Third
+    Login    someone with a long name    Failed
+
+*** Keywords ***    Step
+Login
+    [Arguments]    ${user}
+    Log    ${user}
+'''
+
+
+def _parse(content, source='/tmp/txtwriter.robot'):
+    datafile = robotapi.TestCaseFile(source=source)
+    robotapi.RobotReader().read(BytesIO(content.encode('UTF-8')), robotapi.FromFilePopulator(datafile))
+    return datafile
+
+
+def _write(writer_class, datafile, spaces=4):
+    output = StringIO()
+    writer_class(WritingContext(datafile, format='txt', output=output,
+                                txt_separating_spaces=spaces)).write(datafile)
+    return output.getvalue()
+
+
+class TestStreamingTxtWriter(unittest.TestCase):
+
+    def _assert_identical(self, datafile):
+        for spaces in (2, 4):
+            self.assertEqual(_write(StreamingTxtWriter, datafile, spaces),
+                             _write(SpaceSeparatedTxtWriter, datafile, spaces))
+
+    def test_output_is_identical_with_space_separated_writer(self):
+        self._assert_identical(_parse(DATA))
+
+    def test_aligned_tables(self):
+        datafile = _parse(ALIGNED)
+        self._assert_identical(datafile)
+
+    def test_test_data_files(self):
+        for name in ['testsuite/everything.robot', 'performance/suite_kw1000.robot',
+                     'forloop/forloop.robot', 'complex_tests/TestSuite.robot']:
+            self._assert_identical(robotapi.TestCaseFile(source=os.path.join(DATAPATH, name)).populate())
+
+    def test_file_writer_uses_streaming_writer_for_space_separated_formats(self):
+        datafile = _parse(DATA)
+        for data_format, writer_class in [('txt', StreamingTxtWriter), ('robot', StreamingTxtWriter),
+                                          ('tsv', None), ('html', None)]:
+            writer = FileWriter(WritingContext(datafile, format=data_format, output=StringIO()))
+            self.assertEqual(isinstance(writer, StreamingTxtWriter), writer_class is not None)
+        writer = FileWriter(WritingContext(datafile, format='txt', output=StringIO(), pipe_separated=True))
+        self.assertFalse(isinstance(writer, StreamingTxtWriter))
+
+    def test_txt_content(self):
+        datafile = _parse(DATA)
+        output = StringIO()
+        datafile.save(output=output, format='txt', txt_separating_spaces=2)
+        self.assertEqual(txt_content(datafile, 2), output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()